@@ -0,0 +1,53 @@
+# Benchmarks conjugate_paradigm against the per-cell path used by the *-main.py scripts.
+# Run from verb_affixes/:  python benchmarks/bench_paradigm.py
+
+import runpy
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from conjugator.models import ConjugationInput
+from conjugator.paradigm import conjugate_paradigm, FORMS, NEGATIONS, TENSES, DIRECT_OBJECTS, SUFFIX_FUNCTIONS, get_pronouns
+from conjugator.tense_prefix_core import get_tense_prefix
+from conjugator.pronoun_prefix_core import get_pronoun_prefix
+
+def load_verbs(verb_type: str) -> list[str]:
+    return runpy.run_path(str(ROOT / f"{verb_type}-main.py"))["VERBS"]
+
+def per_cell_paradigm(verb: str, verb_type: str) -> list:
+    results = []
+    get_suffix = SUFFIX_FUNCTIONS[verb_type]
+    for form in FORMS[verb_type]:
+        for neg in NEGATIONS:
+            for tense in TENSES:
+                for pronoun in get_pronouns(verb_type, form):
+                    for obj in DIRECT_OBJECTS[verb_type]:
+                        input_data = ConjugationInput(
+                            type=verb_type,
+                            form=form,
+                            verb=verb,
+                            pronoun=pronoun,
+                            tense=tense,
+                            negation=neg,
+                            direct_object=obj
+                        )
+                        added_suffix = get_suffix(input_data)
+                        added_tense_prefix = get_tense_prefix(added_suffix, pronoun, tense)
+                        if verb_type != "vii":
+                            added_tense_prefix = get_pronoun_prefix(verb_type, added_tense_prefix, form, neg, pronoun, tense)
+                        results.append(added_tense_prefix)
+    return results
+
+def main():
+    print(f"{'type':<6}{'per-cell (ms)':>16}{'paradigm (ms)':>16}{'speedup':>10}")
+    for verb_type in ("vai", "vii", "vti"):
+        verbs = load_verbs(verb_type)
+        per_cell = min(timeit.repeat(lambda: [per_cell_paradigm(v, verb_type) for v in verbs], number=5, repeat=5)) / 5
+        paradigm = min(timeit.repeat(lambda: [conjugate_paradigm(v, verb_type) for v in verbs], number=5, repeat=5)) / 5
+        print(f"{verb_type:<6}{per_cell * 1000:>16.2f}{paradigm * 1000:>16.2f}{per_cell / paradigm:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Import-time benchmark: what each entry point pays before its first conjugation, measured with -X importtime.
+# Every statement runs in a fresh interpreter, so nothing is already cached in sys.modules.
+# Run from verb_affixes/:
+#   python benchmarks/import_time.py              # best-of-N cumulative import time per statement vs its budget
+#   python benchmarks/import_time.py --top 15     # also list the slowest modules of each statement
+# Exits with status 1 when a statement is over budget; tests/test_import_time.py enforces the same budgets.
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# statement -> budget in microseconds (cumulative, best of --repeat runs).
+# The package itself must stay close to free; a single verb type pays for its own tables only.
+IMPORT_BUDGETS = {
+    "import conjugator": 20_000,
+    "import conjugator.vai_suffixes_core": 100_000,
+    "import conjugator.vti_suffixes_core": 100_000,
+    "import conjugator.vii_suffixes_core": 120_000
+}
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """(module, nesting depth, self us, cumulative us) per line of -X importtime output, in output order."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+def measure(statement: str) -> tuple[int, list[tuple[str, int, int, int]]]:
+    """(total us, per-module entries) of running statement in a fresh interpreter."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    entries = parse_importtime(result.stderr)
+    # Interpreter start-up imports (site, encodings, ...) come first; the statement's own cost is the
+    # cumulative time of the top-level imports of the conjugator package and its submodules.
+    total = sum(cumulative for name, depth, _, cumulative in entries
+                if depth == 0 and name.split(".")[0] == "conjugator")
+    return total, entries
+
+def loaded_modules(statement: str) -> set[str]:
+    """Names in sys.modules after running statement in a fresh interpreter."""
+    result = subprocess.run([sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+def best_of(statement: str, repeat: int) -> tuple[int, list[tuple[str, int, int, int]]]:
+    return min((measure(statement) for _ in range(repeat)), key=lambda run: run[0])
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the conjugator entry points.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="list the N modules with the highest self time")
+    args = parser.parse_args()
+
+    over_budget = False
+    print(f"{'statement':<45}{'ms':>10}{'budget':>10}  status")
+    for statement, budget in IMPORT_BUDGETS.items():
+        total, entries = best_of(statement, args.repeat)
+        status = "ok" if total <= budget else "OVER BUDGET"
+        over_budget |= total > budget
+        print(f"{statement:<45}{total / 1000:>10.2f}{budget / 1000:>10.2f}  {status}")
+        for name, _, self_us, _ in sorted(entries, key=lambda entry: -entry[2])[:args.top]:
+            print(f"    {name:<41}{self_us / 1000:>10.2f}")
+    if over_budget:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
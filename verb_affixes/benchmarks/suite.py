@@ -0,0 +1,188 @@
+# Benchmark suite: every conjugation stage on its own (micro) plus full paradigm generation and FST analysis (macro):
+# macro.fst_analyze.* reads surfaces against a LemmaIndex of the benchmark verbs, macro.fst_guess.* guesses any stem.
+# Writes machine-readable results and compares them with a stored baseline so regressions show up immediately.
+# Run from verb_affixes/:
+#   python benchmarks/suite.py --save-baseline          # first, on a new machine: record this machine's baseline
+#   python benchmarks/suite.py                          # run, print, compare with benchmarks/baseline.json
+#   python benchmarks/suite.py --output results.json    # also write this run's results
+#   python benchmarks/suite.py --fail-on-regression     # exit with status 1 when a benchmark is slower than the
+#                                                       # baseline by more than --tolerance (for CI on a fixed machine)
+# Timings are best-of-N over a fixed input set, so runs on the same machine are comparable; the memo cache is left off.
+# Baselines are machine-specific: the committed baseline.json only shows the expected shape of the numbers.
+# Without --fail-on-regression a regression is reported but the exit status stays 0.
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_paradigm import load_verbs, per_cell_paradigm
+from conjugator.fst import compile_fst, paradigm_cells
+from conjugator.lemma_index import LemmaIndex
+from conjugator.models import ConjugationInput
+from conjugator.paradigm import conjugate_paradigm, conjugate_paradigm_forms, FORMS, NEGATIONS, TENSES, DIRECT_OBJECTS, get_pronouns
+from conjugator.pronoun_prefix_core import get_pronoun_prefix, takes_pronoun_prefix
+from conjugator.tense_prefix_core import consonant_shift, get_tense_prefix
+from conjugator.utils import styled_text
+from conjugator.vai_suffixes_core import get_vai_suffix
+from conjugator.vii_suffixes_core import get_vii_suffix
+from conjugator.vti_suffixes_core import get_vti_suffix
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+VERB_TYPES = ("vai", "vii", "vti")
+
+# Analysis is timed on every ANALYSIS_SAMPLE-th distinct surface form of the VERBS entries, in sorted order.
+ANALYSIS_SAMPLE = 10
+
+# --- 1. Inputs ---
+def paradigm_inputs(verb_type: str) -> list[ConjugationInput]:
+    """Every cell of every VERBS entry of a *-main.py script, as the main scripts build them."""
+    inputs = []
+    for verb in load_verbs(verb_type):
+        for form in FORMS[verb_type]:
+            for neg in NEGATIONS:
+                for tense in TENSES:
+                    for pronoun in get_pronouns(verb_type, form):
+                        for obj in DIRECT_OBJECTS[verb_type]:
+                            inputs.append(ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun,
+                                                           tense=tense, negation=neg, direct_object=obj))
+    return inputs
+
+def analysis_surfaces(verb_type: str) -> list[str]:
+    forms = {form.render() for verb in load_verbs(verb_type) for form in conjugate_paradigm_forms(verb, verb_type)}
+    return sorted(forms)[::ANALYSIS_SAMPLE]
+
+def build_benchmarks() -> dict[str, tuple[callable, int]]:
+    """name -> (function running the whole input set once, number of calls it makes)."""
+    inputs = {verb_type: paradigm_inputs(verb_type) for verb_type in VERB_TYPES}
+    verbs = {verb_type: load_verbs(verb_type) for verb_type in VERB_TYPES}
+
+    tense_args = [(get_vai_suffix(i), i.pronoun, i.tense) for i in inputs["vai"]]
+    shift_args = [(word, tense) for word, _, tense in tense_args]
+    prefix_args = [(i.type, get_tense_prefix(get_vai_suffix(i), i.pronoun, i.tense), i.form, i.negation, i.pronoun, i.tense)
+                   for i in inputs["vai"] if takes_pronoun_prefix(i.type, i.form)]
+    style_args = [(word, style) for word, _, _ in tense_args for style in ("green_normal", "red_normal")]
+
+    benchmarks = {
+        "micro.get_vai_suffix": (lambda: [get_vai_suffix(i) for i in inputs["vai"]], len(inputs["vai"])),
+        "micro.get_vii_suffix": (lambda: [get_vii_suffix(i) for i in inputs["vii"]], len(inputs["vii"])),
+        "micro.get_vti_suffix": (lambda: [get_vti_suffix(i) for i in inputs["vti"]], len(inputs["vti"])),
+        "micro.consonant_shift": (lambda: [consonant_shift(*args) for args in shift_args], len(shift_args)),
+        "micro.get_tense_prefix": (lambda: [get_tense_prefix(*args) for args in tense_args], len(tense_args)),
+        "micro.get_pronoun_prefix": (lambda: [get_pronoun_prefix(*args) for args in prefix_args], len(prefix_args)),
+        "micro.styled_text": (lambda: [styled_text(*args) for args in style_args], len(style_args)),
+    }
+    # Compiling the transducer takes seconds: only runs that include an fst benchmark pay for it (in calibration).
+    compiled = []
+
+    def fst():
+        if not compiled:
+            compiled.append(compile_fst())
+        return compiled[0]
+
+    cells = {verb_type: paradigm_cells((verb_type,)) for verb_type in VERB_TYPES}
+    surfaces = {verb_type: analysis_surfaces(verb_type) for verb_type in VERB_TYPES}
+    lemmas = LemmaIndex((verb, verb_type) for verb_type in VERB_TYPES for verb in verbs[verb_type])
+    # Default arguments pin verb_type per lambda; the calls count is paradigms generated, or surfaces analysed.
+    for verb_type in VERB_TYPES:
+        count = len(verbs[verb_type])
+        benchmarks[f"macro.per_cell.{verb_type}"] = (
+            lambda t=verb_type: [per_cell_paradigm(v, t) for v in verbs[t]], count)
+        benchmarks[f"macro.conjugate_paradigm.{verb_type}"] = (
+            lambda t=verb_type: [conjugate_paradigm(v, t) for v in verbs[t]], count)
+        benchmarks[f"macro.conjugate_paradigm_forms.{verb_type}"] = (
+            lambda t=verb_type: [conjugate_paradigm_forms(v, t) for v in verbs[t]], count)
+        benchmarks[f"macro.fst.{verb_type}"] = (
+            lambda t=verb_type: [[fst().generate(v, *cell) for cell in cells[t]] for v in verbs[t]], count)
+        benchmarks[f"macro.fst_paradigm.{verb_type}"] = (
+            lambda t=verb_type: [fst().generate_paradigm(v, t) for v in verbs[t]], count)
+        benchmarks[f"macro.fst_analyze.{verb_type}"] = (
+            lambda t=verb_type: [fst().analyze(s, lemmas) for s in surfaces[t]], len(surfaces[verb_type]))
+        benchmarks[f"macro.fst_guess.{verb_type}"] = (
+            lambda t=verb_type: [fst().analyze(s) for s in surfaces[t]], len(surfaces[verb_type]))
+    return benchmarks
+
+# --- 2. Running and comparing ---
+def run_benchmark(func: callable, calls: int, repeat: int, min_time: float) -> float:
+    """Best-of-repeat microseconds per call."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / (number * calls) * 1e6
+
+def run_suite(names_filter: str = "", repeat: int = 5, min_time: float = 0.2) -> dict:
+    results = {}
+    for name, (func, calls) in build_benchmarks().items():
+        if names_filter and names_filter not in name:
+            continue
+        results[name] = {"us_per_call": round(run_benchmark(func, calls, repeat, min_time), 4), "calls": calls}
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": results
+    }
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[tuple[str, float, float | None, str]]:
+    """Returns (name, current, baseline, status) rows; status is 'ok', 'faster', 'REGRESSION' or 'new'."""
+    rows = []
+    for name, result in results["results"].items():
+        current = result["us_per_call"]
+        previous = baseline.get("results", {}).get(name, {}).get("us_per_call")
+        if previous is None:
+            status = "new"
+        elif current > previous * (1 + tolerance):
+            status = "REGRESSION"
+        elif current < previous * (1 - tolerance):
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, current, previous, status))
+    return rows
+
+def print_rows(rows: list[tuple[str, float, float | None, str]]):
+    print(f"{'benchmark':<40}{'us/call':>12}{'baseline':>12}{'ratio':>8}  status")
+    for name, current, previous, status in rows:
+        baseline = f"{previous:>12.3f}" if previous is not None else f"{'-':>12}"
+        ratio = f"{current / previous:>7.2f}x" if previous else f"{'-':>8}"
+        print(f"{name:<40}{current:>12.3f}{baseline}{ratio}  {status}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the conjugator benchmark suite.")
+    parser.add_argument("--output", help="write this run's results as JSON")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a regression (0.25 = 25%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 when a regression is found")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_suite(args.filter, args.repeat)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print_rows(compare(results, {}, args.tolerance))
+        return
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+    rows = compare(results, baseline, args.tolerance)
+    print_rows(rows)
+    if args.fail_on_regression and any(status == "REGRESSION" for *_, status in rows):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,57 @@
 # conjugator/__init__.py
+# Public names are loaded on first access (PEP 562), so `import conjugator` stays cheap and a caller
+# that only needs one verb type never builds the others' suffix tables.
 
-from .vii_suffixes_core import get_vii_suffix
-from .vai_suffixes_core import get_vai_suffix
-from .vti_suffixes_core import get_vti_suffix
-from .models import ConjugationInput
-from .utils import styled_text
-
-__all__ = ["get_vii_suffix",
-           "get_vai_suffix",
-           "get_vti_suffix",
-           "ConjugationInput",
-           "styled_text"]
\ No newline at end of file
+from importlib import import_module
+
+EXPORTS = {
+    "get_vii_suffix": ".vii_suffixes_core",
+    "get_vai_suffix": ".vai_suffixes_core",
+    "get_vti_suffix": ".vti_suffixes_core",
+    "conjugate": ".pipeline",
+    "conjugate_many": ".pipeline",
+    "conjugate_planned": ".planner",
+    "Analyzer": ".analyzer",
+    "Analysis": ".models",
+    "ParadigmStore": ".store",
+    "ParadigmTable": ".binary_table",
+    "write_paradigm_table": ".binary_table",
+    "LemmaIndex": ".lemma_index",
+    "LemmaEntry": ".models",
+    "load_lemma_index": ".lemma_index",
+    "Dawg": ".dawg",
+    "build_dawg": ".dawg",
+    "write_surface_dawg": ".dawg",
+    "LexiconReader": ".ingest",
+    "iter_lexicon": ".ingest",
+    "normalize_stem": ".ingest",
+    "compile_fst": ".fst",
+    "Transducer": ".fst",
+    "conjugate_paradigm": ".paradigm",
+    "conjugate_paradigm_forms": ".paradigm",
+    "ConjugationInput": ".models",
+    "CompactInput": ".models",
+    "ConjugatedForm": ".models",
+    "ConjugationError": ".models",
+    "ParadigmCell": ".models",
+    "styled_text": ".utils",
+    "configure_cache": ".cache",
+    "clear_cache": ".cache",
+    "cache_stats": ".cache",
+    "VariantPolicy": ".pronoun_prefix_core",
+    "set_variant_policy": ".pronoun_prefix_core"
+}
+
+__all__ = list(EXPORTS)
+
+def __getattr__(name: str):
+    module = EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    # Cache on the package so later accesses skip __getattr__.
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,37 @@
+# This file runs the conjugator in reverse: surface form -> every (verb, type, features) that produces it.
+# The index is generated by running the same rules, tense maps and prefix maps forward over a verb list,
+# so an analysis can never disagree with what conjugate() would produce.
+# Lookups are a single dict access on the normalized surface.
+
+from collections.abc import Iterable
+from .models import Analysis
+from .paradigm import conjugate_paradigm_forms
+
+def normalize_surface(word: str) -> str:
+    """Lookup key: lowercase with hyphens removed, so 'gii-nibaa' and 'giinibaa' find the same entries."""
+    return word.strip().lower().replace("-", "")
+
+class Analyzer:
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()):
+        self.index = {}
+        for verb, verb_type in entries:
+            self.add(verb, verb_type)
+
+    def add(self, verb: str, verb_type: str):
+        """Indexes every surface form (and every prefix variant) of a verb's paradigm."""
+        for form in conjugate_paradigm_forms(verb, verb_type):
+            analysis = Analysis(verb, verb_type, form.form, form.negation, form.tense, form.pronoun, form.direct_object)
+            for surface in form.render_all():
+                analyses = self.index.setdefault(normalize_surface(surface), [])
+                if analysis not in analyses:
+                    analyses.append(analysis)
+
+    def analyze(self, word: str) -> list[Analysis]:
+        """Returns every analysis of a surface form, in paradigm order; [] when the form is unknown."""
+        return list(self.index.get(normalize_surface(word), ()))
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_surface(word) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
@@ -0,0 +1,200 @@
+# This file defines a compact binary format for precomputed paradigms, read through mmap for instant cold start.
+# Opening a table parses only the header; a lookup binary-searches two fixed-width indexes and reads a few
+# strings from the pool, so only the pages it touches are loaded.
+#
+# Layout (little-endian):
+#   header  HEADER_FORMAT: magic, version, lemma count, cell count, lemma index offset, cell index offset, pool offset
+#   lemmas  LEMMA_FORMAT per lemma, sorted by (UTF-8 verb, type code): verb (pool offset, length), type code,
+#           first cell, cell count
+#   cells   CELL_FORMAT per cell, grouped by lemma and sorted by cell key within it: cell key, then (pool offset,
+#           length) of the prefix variants (joined by NUL), preverb, stem and suffix
+#   pool    deduplicated UTF-8 strings
+# The cell key packs (form, negation, tense, pronoun, object) codes in generation order, so a lemma's cells are
+# stored in the same order conjugate_paradigm_forms returns them.
+
+import mmap
+import struct
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+from .models import ConjugatedForm
+from .export import iter_paradigms
+from .paradigm import ANIMATE_PRONOUNS, PRONOUNS, TENSES
+
+# --- 1. Constants ---
+MAGIC = b"CJPT"
+VERSION = 1
+
+HEADER_FORMAT = struct.Struct("<4sHxxIIIII")
+LEMMA_FORMAT = struct.Struct("<IHBxII")
+CELL_FORMAT = struct.Struct("<HIHIHIHIH")
+
+VERB_TYPES = ("vai", "vii", "vti")
+FORMS = ("independent", "dependent", "imperative")
+NEGATIONS = (False, True)
+ALL_PRONOUNS = ANIMATE_PRONOUNS + PRONOUNS["vii"]
+OBJECTS = (None, "singular", "plural")
+
+VARIANT_SEPARATOR = "\x00"
+
+# --- 2. Cell keys ---
+def cell_key(form: str, negation: bool, tense: str, pronoun: str, direct_object: str | None) -> int:
+    """Packs a feature bundle into one integer; raises ValueError for a feature outside the format's code tables."""
+    try:
+        key = FORMS.index(form)
+        key = key * len(NEGATIONS) + NEGATIONS.index(bool(negation))
+        key = key * len(TENSES) + TENSES.index(tense)
+        key = key * len(ALL_PRONOUNS) + ALL_PRONOUNS.index(pronoun)
+        return key * len(OBJECTS) + OBJECTS.index(direct_object)
+    except ValueError:
+        raise ValueError(f"Feature bundle not representable: {form}/{negation}/{tense}/{pronoun}/{direct_object}") from None
+
+def decode_cell_key(key: int) -> tuple[str, bool, str, str, str | None]:
+    key, obj = divmod(key, len(OBJECTS))
+    key, pronoun = divmod(key, len(ALL_PRONOUNS))
+    key, tense = divmod(key, len(TENSES))
+    form, neg = divmod(key, len(NEGATIONS))
+    return FORMS[form], NEGATIONS[neg], TENSES[tense], ALL_PRONOUNS[pronoun], OBJECTS[obj]
+
+# --- 3. Writer ---
+class StringPool:
+    def __init__(self):
+        self.offsets = {}
+        self.data = bytearray()
+
+    def add(self, text: str) -> tuple[int, int]:
+        encoded = text.encode("utf-8")
+        offset = self.offsets.get(encoded)
+        if offset is None:
+            offset = self.offsets[encoded] = len(self.data)
+            self.data += encoded
+        return offset, len(encoded)
+
+def write_paradigm_table(entries: Iterable[tuple[str, str]], path: str | Path,
+                         skipped: list[tuple[str, str]] | None = None) -> int:
+    """
+    Generates the paradigm of every (verb, type) entry and writes the table to path; returns the lemma count.
+    Lemmas whose paradigm fails are logged, appended to skipped when given, and left out.
+    """
+    pool = StringPool()
+    lemmas = {}
+    for verb, verb_type, forms in iter_paradigms(entries, skipped):
+        cells = sorted((cell_key(form.form, form.negation, form.tense, form.pronoun, form.direct_object), form)
+                       for form in forms)
+        lemmas[verb.encode("utf-8"), VERB_TYPES.index(verb_type)] = (verb, cells)
+
+    lemma_records, cell_records = [], []
+    for (_, type_code), (verb, cells) in sorted(lemmas.items()):
+        lemma_records.append(LEMMA_FORMAT.pack(*pool.add(verb), type_code, len(cell_records), len(cells)))
+        for key, form in cells:
+            cell_records.append(CELL_FORMAT.pack(key, *pool.add(VARIANT_SEPARATOR.join(form.prefixes)),
+                                                 *pool.add(form.preverb), *pool.add(form.stem), *pool.add(form.suffix)))
+
+    lemma_offset = HEADER_FORMAT.size
+    cell_offset = lemma_offset + LEMMA_FORMAT.size * len(lemma_records)
+    pool_offset = cell_offset + CELL_FORMAT.size * len(cell_records)
+    with open(path, "wb") as f:
+        f.write(HEADER_FORMAT.pack(MAGIC, VERSION, len(lemma_records), len(cell_records), lemma_offset, cell_offset, pool_offset))
+        f.writelines(lemma_records)
+        f.writelines(cell_records)
+        f.write(pool.data)
+    return len(lemma_records)
+
+# --- 4. Reader ---
+class FixedWidthIndex:
+    # A read-only sequence view over fixed-width records, so bisect can search the mmap in place.
+    def __init__(self, sort_key, count: int):
+        self.sort_key = sort_key
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int):
+        return self.sort_key(i)
+
+class ParadigmTable:
+    def __init__(self, path: str | Path):
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.lemma_count, self.cell_count, self.lemma_offset, self.cell_offset, self.pool_offset = \
+            HEADER_FORMAT.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.buffer.close()
+            raise ValueError(f"{path}: not a version {VERSION} paradigm table")
+        self.lemmas = FixedWidthIndex(self.lemma_sort_key, self.lemma_count)
+
+    # --- Raw records ---
+    def string(self, offset: int, length: int) -> str:
+        start = self.pool_offset + offset
+        return self.buffer[start:start + length].decode("utf-8")
+
+    def lemma(self, i: int) -> tuple:
+        return LEMMA_FORMAT.unpack_from(self.buffer, self.lemma_offset + i * LEMMA_FORMAT.size)
+
+    def cell(self, i: int) -> tuple:
+        return CELL_FORMAT.unpack_from(self.buffer, self.cell_offset + i * CELL_FORMAT.size)
+
+    def lemma_sort_key(self, i: int) -> tuple[bytes, int]:
+        verb_offset, verb_length, type_code, _, _ = self.lemma(i)
+        start = self.pool_offset + verb_offset
+        return self.buffer[start:start + verb_length], type_code
+
+    def find_lemma(self, verb: str, verb_type: str) -> tuple[int, int] | None:
+        """(first cell, cell count) of a lemma, or None when it is not in the table."""
+        if verb_type not in VERB_TYPES:
+            return None
+        key = (verb.encode("utf-8"), VERB_TYPES.index(verb_type))
+        i = bisect_left(self.lemmas, key)
+        if i == self.lemma_count or self.lemmas[i] != key:
+            return None
+        _, _, _, first_cell, cell_count = self.lemma(i)
+        return first_cell, cell_count
+
+    def build_form(self, verb: str, verb_type: str, record: tuple) -> ConjugatedForm:
+        key, *refs = record
+        form, neg, tense, pronoun, obj = decode_cell_key(key)
+        prefixes, preverb, stem, suffix = (self.string(refs[i], refs[i + 1]) for i in range(0, 8, 2))
+        return ConjugatedForm(verb, verb_type, form, neg, tense, pronoun, obj,
+                              tuple(prefixes.split(VARIANT_SEPARATOR)), preverb, stem, suffix)
+
+    # --- Lookups ---
+    def lookup(self, verb: str, verb_type: str, form: str, negation: bool, tense: str, pronoun: str,
+               direct_object: str | None = None) -> ConjugatedForm | None:
+        """One cell, or None when the lemma or the cell is not in the table."""
+        cells = self.find_lemma(verb, verb_type)
+        if cells is None:
+            return None
+        try:
+            key = cell_key(form, negation, tense, pronoun, direct_object)
+        except ValueError:
+            return None
+        first_cell, cell_count = cells
+        keys = FixedWidthIndex(lambda i: self.cell(first_cell + i)[0], cell_count)
+        i = bisect_left(keys, key)
+        if i == cell_count or keys[i] != key:
+            return None
+        return self.build_form(verb, verb_type, self.cell(first_cell + i))
+
+    def paradigm(self, verb: str, verb_type: str) -> list[ConjugatedForm] | None:
+        """Every cell of a lemma in conjugate_paradigm_forms order, or None when the lemma is not in the table."""
+        cells = self.find_lemma(verb, verb_type)
+        if cells is None:
+            return None
+        first_cell, cell_count = cells
+        return [self.build_form(verb, verb_type, self.cell(i)) for i in range(first_cell, first_cell + cell_count)]
+
+    def __contains__(self, entry: tuple[str, str]) -> bool:
+        return self.find_lemma(*entry) is not None
+
+    def __len__(self) -> int:
+        return self.lemma_count
+
+    def close(self) -> None:
+        self.buffer.close()
+
+    def __enter__(self) -> "ParadigmTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
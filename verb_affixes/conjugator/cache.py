@@ -0,0 +1,117 @@
+# This file provides the memoization layer in front of the public conjugation functions.
+# Results are kept in a thread-safe LRU cache with a max-entries limit and hit/miss/eviction stats.
+# The cache is off by default; turn it on with configure_cache(maxsize=...).
+
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+DEFAULT_MAXSIZE = 4096
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+class ConjugationCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled and maxsize > 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        with self.lock:
+            try:
+                value = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def store(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def configure(self, maxsize: int | None = None, enabled: bool | None = None) -> None:
+        with self.lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+                    self.evictions += 1
+            if enabled is not None:
+                self.enabled = enabled
+            self.enabled = self.enabled and self.maxsize > 0
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self.lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self.entries), self.maxsize)
+
+CONJUGATION_CACHE = ConjugationCache(enabled=False)
+
+def configure_cache(maxsize: int | None = None, enabled: bool | None = True) -> None:
+    """Enables the shared cache (optionally resizing it); pass enabled=False to bypass it."""
+    CONJUGATION_CACHE.configure(maxsize=maxsize, enabled=enabled)
+
+def clear_cache() -> None:
+    CONJUGATION_CACHE.clear()
+
+def cache_stats() -> CacheStats:
+    return CONJUGATION_CACHE.stats()
+
+def copy_result(value: Any) -> Any:
+    # Lists of dialect variants (and per-tense dicts) are mutable; never hand out the cached object itself.
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+def args_key(*args, **kwargs) -> tuple:
+    return args + tuple(sorted(kwargs.items()))
+
+def input_key(input_data, *args, **kwargs) -> tuple:
+    return input_data.cache_key()
+
+def memoize(key: Callable[..., Hashable] = args_key) -> Callable:
+    """Puts the shared conjugation cache in front of a pure function."""
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = CONJUGATION_CACHE
+            if not cache.enabled:
+                return func(*args, **kwargs)
+            cache_key = (name, key(*args, **kwargs))
+            hit, value = cache.lookup(cache_key)
+            if not hit:
+                value = func(*args, **kwargs)
+                cache.store(cache_key, copy_result(value))
+            return copy_result(value)
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
@@ -0,0 +1,304 @@
+# This file stores every surface form of a lexicon in a minimal acyclic word graph (DAWG) for spell-checking:
+# words that share a start share states, and so do words that share an ending, so millions of forms take a few MB.
+#   - forms are streamed out of conjugate_paradigm_forms, sorted in bounded chunks (spilled to temporary files and
+#     merged back) and fed to DawgBuilder, which minimises as it goes (Daciuk et al. incremental construction),
+#   - the finished graph is written as flat arrays and read back through mmap, so opening a file loads nothing.
+#
+# Layout (little-endian, each section 4-byte aligned):
+#   header   HEADER_FORMAT: magic, version, word count, state count, edge count, alphabet size in bytes
+#   alphabet UTF-8 letters in code point order; an edge label is a letter's position in it
+#   offsets  uint32 per state plus one: the state's edges are edges[offsets[s]:offsets[s + 1]], sorted by label
+#   targets  uint32 per edge
+#   labels   uint16 per edge
+#   finals   one bit per state
+# State 0 is the start state.
+
+import heapq
+import mmap
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from .export import iter_paradigms
+
+# --- 1. Constants ---
+MAGIC = b"CJDG"
+VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHxxIIII")
+# Words sorted in memory at a time while building; larger inputs are merged from temporary files.
+DEFAULT_CHUNK_SIZE = 500_000
+
+def aligned(size: int) -> int:
+    return (size + 3) & ~3
+
+# --- 2. Sorted streaming ---
+def surface_forms(entries: Iterable[tuple[str, str]], skipped: list[tuple[str, str]] | None = None) -> Iterator[str]:
+    """
+    Every plain surface form (each prefix variant) of every (verb, type) entry, lemma by lemma.
+    Lemmas whose paradigm fails are logged, appended to skipped when given, and left out.
+    """
+    for _, _, forms in iter_paradigms(entries, skipped):
+        for form in forms:
+            yield from form.render_all()
+
+def sorted_unique(words: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Yields the distinct words in code point order, holding at most chunk_size of them in memory."""
+    iterator = iter(words)
+    runs = []
+    try:
+        while chunk := list(islice(iterator, chunk_size)):
+            if not runs and len(chunk) < chunk_size:
+                # Everything fit in one chunk: no temporary files needed.
+                yield from sorted(set(chunk))
+                return
+            run = tempfile.TemporaryFile("w+", encoding="utf-8")
+            run.writelines(word + "\n" for word in sorted(set(chunk)))
+            run.seek(0)
+            runs.append(run)
+        previous = None
+        for line in heapq.merge(*runs):
+            if line != previous:
+                yield line[:-1]
+                previous = line
+    finally:
+        for run in runs:
+            run.close()
+
+# --- 3. Builder ---
+class DawgBuilder:
+    """
+    Builds a minimal DAWG from words added in code point order. States whose words can no longer grow are
+    replaced by an equivalent registered state as soon as a later word leaves them, so only one path is ever unminimised.
+    States are kept in dicts keyed by state number and a replaced state is deleted, so memory follows the size of
+    the minimal graph, not the number of letters added.
+    """
+
+    def __init__(self):
+        self.finals = {0: False}
+        self.edges = {0: {}}
+        self.next_state = 1
+        self.register = {}
+        self.unchecked = []
+        self.previous = ""
+        self.word_count = 0
+
+    def add(self, word: str) -> None:
+        if word < self.previous:
+            raise ValueError(f"Words must be added in sorted order: {word!r} after {self.previous!r}")
+        if word == self.previous and self.word_count:
+            return
+        common = 0
+        for a, b in zip(word, self.previous):
+            if a != b:
+                break
+            common += 1
+        self.minimise(common)
+        state = self.unchecked[-1][2] if self.unchecked else 0
+        for letter in word[common:]:
+            child = self.next_state
+            self.next_state += 1
+            self.finals[child] = False
+            self.edges[child] = {}
+            self.edges[state][letter] = child
+            self.unchecked.append((state, letter, child))
+            state = child
+        self.finals[state] = True
+        self.previous = word
+        self.word_count += 1
+
+    def minimise(self, depth: int) -> None:
+        while len(self.unchecked) > depth:
+            parent, letter, child = self.unchecked.pop()
+            signature = (self.finals[child], tuple(self.edges[child].items()))
+            existing = self.register.get(signature)
+            if existing is None:
+                self.register[signature] = child
+            else:
+                self.edges[parent][letter] = existing
+                del self.edges[child], self.finals[child]
+
+    def to_bytes(self) -> bytes:
+        """Minimises the last word and serialises the reachable states in the file layout."""
+        self.minimise(0)
+        order, numbers = [0], {0: 0}
+        for state in order:
+            for child in self.edges[state].values():
+                if child not in numbers:
+                    numbers[child] = len(order)
+                    order.append(child)
+        alphabet = sorted({letter for state in order for letter in self.edges[state]})
+        positions = {letter: i for i, letter in enumerate(alphabet)}
+        if len(alphabet) > 0xFFFF:
+            raise ValueError(f"Alphabet of {len(alphabet)} letters does not fit 16-bit labels")
+        offsets, targets, labels = [0], [], []
+        finals = bytearray((len(order) + 7) // 8)
+        for number, state in enumerate(order):
+            for letter, child in sorted(self.edges[state].items(), key=lambda edge: positions[edge[0]]):
+                targets.append(numbers[child])
+                labels.append(positions[letter])
+            offsets.append(len(targets))
+            if self.finals[state]:
+                finals[number >> 3] |= 1 << (number & 7)
+        encoded_alphabet = "".join(alphabet).encode("utf-8")
+        sections = [
+            HEADER_FORMAT.pack(MAGIC, VERSION, self.word_count, len(order), len(targets), len(encoded_alphabet)),
+            encoded_alphabet,
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            struct.pack(f"<{len(targets)}I", *targets),
+            struct.pack(f"<{len(labels)}H", *labels),
+            bytes(finals)
+        ]
+        return b"".join(section + bytes(aligned(len(section)) - len(section)) for section in sections)
+
+def build_dawg(words: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> "Dawg":
+    """An in-memory DAWG of any iterable of words (order and duplicates do not matter)."""
+    builder = DawgBuilder()
+    for word in sorted_unique(words, chunk_size):
+        builder.add(word)
+    return Dawg(builder.to_bytes())
+
+def write_surface_dawg(entries: Iterable[tuple[str, str]], path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       skipped: list[tuple[str, str]] | None = None) -> int:
+    """
+    Streams every surface form of every (verb, type) entry into a DAWG file at path; returns the form count.
+    Lemmas whose paradigm fails are logged, appended to skipped when given, and left out.
+    """
+    builder = DawgBuilder()
+    for word in sorted_unique(surface_forms(entries, skipped), chunk_size):
+        builder.add(word)
+    data = builder.to_bytes()
+    with open(path, "wb") as f:
+        f.write(data)
+    return builder.word_count
+
+# --- 4. Reader ---
+class Dawg:
+    def __init__(self, data: bytes | mmap.mmap):
+        self.data = data
+        magic, version, self.word_count, self.state_count, self.edge_count, alphabet_size = HEADER_FORMAT.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} DAWG")
+        offset = aligned(HEADER_FORMAT.size)
+        self.alphabet = bytes(data[offset:offset + alphabet_size]).decode("utf-8")
+        self.positions = {letter: i for i, letter in enumerate(self.alphabet)}
+        offset += aligned(alphabet_size)
+        view = memoryview(data)
+        self.views = []
+        self.offsets = self.section(view, offset, "I", self.state_count + 1)
+        offset += aligned(4 * (self.state_count + 1))
+        self.targets = self.section(view, offset, "I", self.edge_count)
+        offset += aligned(4 * self.edge_count)
+        self.labels = self.section(view, offset, "H", self.edge_count)
+        offset += aligned(2 * self.edge_count)
+        self.finals = self.section(view, offset, "B", (self.state_count + 7) // 8)
+        view.release()
+
+    def section(self, view: memoryview, offset: int, item_format: str, count: int) -> memoryview:
+        size = struct.calcsize(item_format) * count
+        section = view[offset:offset + size].cast(item_format)
+        self.views.append(section)
+        return section
+
+    @classmethod
+    def open(cls, path: str | Path) -> "Dawg":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except ValueError:
+            buffer.close()
+            raise ValueError(f"{path}: not a version {VERSION} DAWG") from None
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as f:
+            f.write(self.data)
+
+    def close(self) -> None:
+        for view in self.views:
+            view.release()
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> "Dawg":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # --- Walking ---
+    def is_final(self, state: int) -> bool:
+        return bool(self.finals[state >> 3] & (1 << (state & 7)))
+
+    def step(self, state: int, letter: str) -> int | None:
+        label = self.positions.get(letter)
+        if label is None:
+            return None
+        start, end = self.offsets[state], self.offsets[state + 1]
+        i = bisect_left(self.labels, label, start, end)
+        if i == end or self.labels[i] != label:
+            return None
+        return self.targets[i]
+
+    def walk(self, text: str) -> int | None:
+        """The state reached by reading text from the start, or None when no word starts with it."""
+        state = 0
+        for letter in text:
+            state = self.step(state, letter)
+            if state is None:
+                return None
+        return state
+
+    def edges(self, state: int) -> Iterator[tuple[str, int]]:
+        alphabet, labels, targets = self.alphabet, self.labels, self.targets
+        for i in range(self.offsets[state], self.offsets[state + 1]):
+            yield alphabet[labels[i]], targets[i]
+
+    # --- Queries ---
+    def __contains__(self, word: str) -> bool:
+        state = self.walk(word)
+        return state is not None and self.is_final(state)
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def __iter__(self) -> Iterator[str]:
+        return self.complete("")
+
+    def complete(self, prefix: str, limit: int | None = None) -> Iterator[str]:
+        """Words starting with prefix, in code point order; at most limit of them when set."""
+        state = self.walk(prefix)
+        if state is None:
+            return iter(())
+        return islice(self.words_from(state, prefix), limit)
+
+    def words_from(self, state: int, prefix: str) -> Iterator[str]:
+        stack = [(state, prefix)]
+        while stack:
+            state, text = stack.pop()
+            if self.is_final(state):
+                yield text
+            # Pushed in reverse so the smallest letter is expanded first.
+            stack.extend((child, text + letter) for letter, child in reversed(list(self.edges(state))))
+
+    def suggest(self, word: str, max_distance: int = 1, limit: int | None = None) -> list[tuple[str, int]]:
+        """
+        Words within max_distance edits (insertions, deletions, substitutions) of word, as (word, distance) sorted by
+        distance then word. Walks the graph with one Levenshtein row per visited prefix and abandons a branch
+        as soon as every entry of its row exceeds max_distance.
+        """
+        found = {}
+        first_row = list(range(len(word) + 1))
+        stack = [(0, "", first_row)]
+        while stack:
+            state, text, row = stack.pop()
+            if row[-1] <= max_distance and self.is_final(state):
+                found[text] = row[-1]
+            for letter, child in self.edges(state):
+                next_row = [row[0] + 1]
+                for i, expected in enumerate(word, start=1):
+                    next_row.append(min(next_row[i - 1] + 1, row[i] + 1, row[i - 1] + (expected != letter)))
+                if min(next_row) <= max_distance:
+                    stack.append((child, text + letter, next_row))
+        return sorted(found.items(), key=lambda item: (item[1], item[0]))[:limit]
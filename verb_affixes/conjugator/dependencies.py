@@ -0,0 +1,113 @@
+# This file tracks which table entries a stored paradigm was generated from, so that after a table edit a rebuild
+# regenerates only what the edit can change (see ParadigmStore.rebuild).
+#   - every suffix rule declares the table entry it reads (Rule.table_key), and get_suffix_key in each suffix module
+#     names the entry one slot uses. A slot is (form, negation, pronoun, object); all five tenses share its suffix,
+#   - table_entries() flattens the tracked tables into 'TABLE/key/.../key' -> JSON value, so the tables of two builds
+#     can be diffed entry by entry,
+#   - lexical stem sets are tracked per stem: adding a stem to DUMMY_N reclassifies that one vii lemma,
+#   - the prefix tables feed every cell, so any change to them affects every lemma.
+# Rule code (matches/edit) is not data and is not tracked: after changing it, rebuild the store from scratch.
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from .lazy import LazyRegistry, load_attribute
+from .models import ConjugationInput
+from .paradigm import DIRECT_OBJECTS, FORMS, NEGATIONS, get_pronouns
+
+# --- 1. Tracked tables ---
+# Read afresh on every snapshot: use_lexicon and set_variant_policy rebind some of them.
+SUFFIX_TABLES = {
+    "VAI_SUFFIX_MAP": ".vai_suffixes_core:VAI_SUFFIX_MAP",
+    "VII_SUFFIX_MAP": ".vii_suffixes_core:VII_SUFFIX_MAP",
+    "PRONOUN_SUFFIX_MAP": ".vti_suffixes_core:PRONOUN_SUFFIX_MAP"
+}
+
+# Stem sets: table name -> (source, verb type of the lemmas a stem change affects).
+LEXICAL_TABLES = {
+    "DUMMY_N": (".vii_suffixes_core:DUMMY_N", "vii")
+}
+
+GLOBAL_TABLES = {
+    "TENSE_PREFIX_MAP": ".tense_prefix_core:TENSE_PREFIX_MAP",
+    "CONSONANT_SHIFT_MAP": ".tense_prefix_core:CONSONANT_SHIFT_MAP",
+    "PREFIX_TABLE": ".pronoun_prefix_core:PREFIX_TABLE"
+}
+
+SUFFIX_KEYS = LazyRegistry(__package__, {
+    "vai": ".vai_suffixes_core:get_suffix_key",
+    "vii": ".vii_suffixes_core:get_suffix_key",
+    "vti": ".vti_suffixes_core:get_suffix_key"
+})
+
+SEPARATOR = "/"
+
+# --- 2. Keys and snapshots ---
+def key_part(part: Any) -> str:
+    # Enum keys by value, except tuple-valued ones (WordEndingVowel), which go by name.
+    if isinstance(part, Enum):
+        part = part.value if isinstance(part.value, str) else part.name
+    return str(part)
+
+def format_key(path: Iterable[Any]) -> str:
+    return SEPARATOR.join(key_part(part) for part in path)
+
+def flatten(table: Any, path: tuple) -> Iterator[tuple[str, str]]:
+    if isinstance(table, dict):
+        for key, value in table.items():
+            yield from flatten(value, path + (key,))
+    else:
+        yield format_key(path), json.dumps(table)
+
+def table_entries() -> dict[str, str]:
+    """Every entry of the tracked tables as it stands now: key -> JSON value (stems of a stem set map to 'true')."""
+    entries = {}
+    for name, source in {**SUFFIX_TABLES, **GLOBAL_TABLES}.items():
+        entries.update(flatten(load_attribute(source, __package__), (name,)))
+    for name, (source, _) in LEXICAL_TABLES.items():
+        entries.update((format_key((name, stem)), "true") for stem in load_attribute(source, __package__))
+    return entries
+
+def changed_keys(old: dict[str, str], new: dict[str, str]) -> set[str]:
+    """Keys added, removed or given a different value between two snapshots."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+# --- 3. Impact ---
+@dataclass
+class Impact:
+    everything: bool = False
+    lemmas: set[tuple[str, str]] = field(default_factory=set)
+    suffix_keys: set[str] = field(default_factory=set)
+
+def assess_changes(changed: Iterable[str]) -> Impact:
+    """
+    Sorts changed keys by what they affect:
+      everything  - a global table changed, every lemma must be regenerated,
+      lemmas      - (verb, type) lemmas whose stem was added to or removed from a stem set,
+      suffix_keys - suffix table entries; the slots recorded with them must be regenerated.
+    """
+    impact = Impact()
+    for key in changed:
+        name, _, rest = key.partition(SEPARATOR)
+        if name in GLOBAL_TABLES:
+            impact.everything = True
+        elif name in LEXICAL_TABLES:
+            impact.lemmas.add((rest, LEXICAL_TABLES[name][1]))
+        else:
+            impact.suffix_keys.add(key)
+    return impact
+
+def slot_keys(verb: str, verb_type: str) -> list[tuple[str, bool, str, str | None, str | None]]:
+    """(form, negation, pronoun, object, suffix key) of every slot of a paradigm; the key is None when no rule applies."""
+    get_key = SUFFIX_KEYS[verb_type]
+    slots = []
+    for form in FORMS[verb_type]:
+        for neg in NEGATIONS:
+            for pronoun in get_pronouns(verb_type, form):
+                for obj in DIRECT_OBJECTS[verb_type]:
+                    key = get_key(ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun,
+                                                   negation=neg, direct_object=obj))
+                    slots.append((form, neg, pronoun, obj, None if key is None else format_key(key)))
+    return slots
@@ -0,0 +1,51 @@
+# This file compiles the VAI/VII rule registries into direct lookup tables.
+# A verb's ending is classified once (short vowel, long vowel, am, n, d, dummy-n, ...),
+# then the winning rule and its suffix are found with a single dict lookup keyed on (form, negation, class, pronoun).
+# The tables are built at import by running the rule lists over sample verbs of each class,
+# so first-match-wins order is preserved exactly.
+
+from typing import Callable, Iterable
+
+class RuleDispatcher:
+    def __init__(self, registry: dict, classify: Callable[[str], str], samples: dict, pronouns: Iterable[str]):
+        """
+        registry: (form, negation) -> ordered rule list
+        classify: verb -> ending class
+        samples:  ending class -> sample verbs of that class
+        pronouns: every pronoun the table should be compiled for
+        """
+        self.registry = registry
+        self.classify = classify
+        self.table = compile_dispatch(registry, samples, pronouns)
+
+    def find(self, form: str, neg: bool, verb: str, pronoun: str) -> tuple | None:
+        """Returns (rule, suffix) for the first matching rule, or None if no rule matches."""
+        key = (form, neg, self.classify(verb), pronoun)
+        try:
+            return self.table[key]
+        except KeyError:
+            # Pronouns outside the compiled table fall back to the linear scan.
+            return scan_rules(self.registry[form, neg], verb, pronoun)
+
+def scan_rules(rules: list, verb: str, pronoun: str) -> tuple | None:
+    for rule in rules:
+        if rule.matches(verb, pronoun):
+            return rule, rule.suffix(pronoun)
+    return None
+
+def compile_dispatch(registry: dict, samples: dict, pronouns: Iterable[str]) -> dict:
+    table = {}
+    pronouns = tuple(pronouns)
+    for (form, neg), rules in registry.items():
+        for ending_class, verbs in samples.items():
+            if not verbs:
+                # No samples (e.g. an empty lexicon): lookups for this class fall back to the linear scan.
+                continue
+            for pronoun in pronouns:
+                entries = {verb: scan_rules(rules, verb, pronoun) for verb in verbs}
+                winners = {entry[0] if entry else None for entry in entries.values()}
+                # Every sample of a class must pick the same rule, otherwise the class is too coarse.
+                if len(winners) != 1:
+                    raise ValueError(f"Ending class '{ending_class}' is ambiguous for {form}/{neg}/{pronoun}: {entries}")
+                table[form, neg, ending_class, pronoun] = next(iter(entries.values()))
+    return table
@@ -26,6 +26,22 @@ class WordEndingVAI(str, Enum):
     N = "n"
     N_AM = "n_am"
 
+class EndingClass(str, Enum):
+    SHORT_VOWEL = "short_vowel"
+    LONG_VOWEL = "long_vowel"
+    AM = "am"
+    N = "n"
+    D = "d"
+    DUMMY_N = "dummy_n"
+    AAN = "aan"
+    AN = "an"
+    OON = "oon"
+    IN = "in"
+    OTHER = "other"
+
+class LexicalFlag(str, Enum):
+    DUMMY_N = "dummy_n"
+
 class Pronoun(str, Enum):
     THIRD_SINGULAR_INANIMATE = "0s"
     THIRD_PLURAL_INANIMATE = "0p"
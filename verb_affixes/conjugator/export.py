@@ -0,0 +1,134 @@
+# This file exports full paradigms for a whole verb list as JSONL or CSV rows.
+# Verbs are sharded across a process pool; each worker formats its own rows, so the parent only writes text.
+# executor.map yields shards in submission order, so the output is the same for any number of workers.
+
+import csv
+import io
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TextIO
+from .models import ConjugatedForm
+from .paradigm import SUFFIX_FUNCTIONS, conjugate_paradigm_forms
+
+# --- 1. Constants ---
+EXPORT_FORMATS = ("jsonl", "csv")
+
+FIELDS = ("verb", "type", "form", "negation", "tense", "pronoun", "object", "surface", "prefix", "preverb", "stem", "suffix")
+
+# One regular verb per type: running its paradigm once builds every rule table and dispatch path a worker needs.
+WARM_UP_VERBS = {
+    "vai": "nibaa",
+    "vii": "dagwaagin",
+    "vti": "miijin"
+}
+
+# --- 2. Helpers ---
+def read_verb_list(path: str | Path) -> list[tuple[str, str]]:
+    """Reads 'verb<TAB>type' lines; blank lines and lines starting with '#' are skipped."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) != 2 or fields[1] not in SUFFIX_FUNCTIONS:
+                raise ValueError(f"{path}:{line_number}: expected 'verb<TAB>vai|vii|vti', got {line!r}")
+            entries.append((fields[0], fields[1]))
+    return entries
+
+def iter_paradigms(entries: Iterable[tuple[str, str]], skipped: list[tuple[str, str]] | None = None
+                   ) -> Iterator[tuple[str, str, list[ConjugatedForm]]]:
+    """
+    (verb, type, forms) of every (verb, type) entry, for the store builders. A lemma whose paradigm fails is logged,
+    appended to skipped when given, and left out, as export_entry does, so one bad lemma does not abort a long build.
+    """
+    for verb, verb_type in entries:
+        try:
+            forms = conjugate_paradigm_forms(verb, verb_type)
+        except Exception as e:
+            logging.error(f"error building {verb}/{verb_type}: {e}")
+            if skipped is not None:
+                skipped.append((verb, verb_type))
+            continue
+        yield verb, verb_type, forms
+
+def paradigm_rows(verb: str, verb_type: str) -> list[dict]:
+    """One row per surface form: a cell with dialect variants gives one row per prefix variant."""
+    rows = []
+    for form in conjugate_paradigm_forms(verb, verb_type):
+        for prefix, surface in zip(form.prefixes, form.render_all()):
+            rows.append({
+                "verb": verb,
+                "type": verb_type,
+                "form": form.form,
+                "negation": form.negation,
+                "tense": form.tense,
+                "pronoun": form.pronoun,
+                "object": form.direct_object,
+                "surface": surface,
+                "prefix": prefix,
+                "preverb": form.preverb,
+                "stem": form.stem,
+                "suffix": form.suffix
+            })
+    return rows
+
+def format_jsonl(rows: list[dict]) -> str:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+def format_csv(rows: list[dict]) -> str:
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+FORMATTERS = {
+    "jsonl": format_jsonl,
+    "csv": format_csv
+}
+
+def warm_worker():
+    """Process pool initializer: builds the rule tables once per worker instead of inside the first shard."""
+    for verb_type, verb in WARM_UP_VERBS.items():
+        conjugate_paradigm_forms(verb, verb_type)
+
+def export_entry(entry: tuple[str, str], fmt: str) -> str:
+    verb, verb_type = entry
+    try:
+        return FORMATTERS[fmt](paradigm_rows(verb, verb_type))
+    except Exception as e:
+        logging.error(f"error exporting {verb}/{verb_type}: {e}")
+        return ""
+
+# --- 3. Main Logic Functions ---
+def export_paradigms(entries: Iterable[tuple[str, str]], out: TextIO, fmt: str = "jsonl",
+                     workers: int | None = None, chunksize: int = 8) -> int:
+    """
+    Writes the paradigm of every (verb, type) entry to out, in entry order; returns the number of verbs written.
+    workers: process count (None uses every core, 1 runs in this process without a pool).
+    chunksize: verbs sent to a worker per task; larger values cut pickling overhead on long lists.
+    Verbs that fail are logged and skipped.
+    """
+    if fmt not in FORMATTERS:
+        raise ValueError(f"Unsupported export format '{fmt}', expected one of {EXPORT_FORMATS}")
+
+    if fmt == "csv":
+        csv.writer(out, lineterminator="\n").writerow(FIELDS)
+
+    export = partial(export_entry, fmt=fmt)
+    written = 0
+    if workers == 1:
+        for text in map(export, entries):
+            out.write(text)
+            written += bool(text)
+        return written
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker) as executor:
+        for text in executor.map(export, entries, chunksize=chunksize):
+            out.write(text)
+            written += bool(text)
+    return written
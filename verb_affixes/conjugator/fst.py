@@ -0,0 +1,586 @@
+# This file compiles the conjugation rules into one minimised subsequential finite-state transducer (FST).
+# Input is a cell tag (type, form, negation, tense, pronoun, object) followed by the stem letter by letter;
+# output is the plain surface form, so a lookup is one walk over a few dicts with no rule code.
+#   - head: the first letter or two decide the tense preverb, consonant shift and pronoun prefix (CONSONANT_SHIFT_MAP,
+#     TENSE_PREFIX_MAP, PERSON_PREFIX_MAP), which are emitted as soon as the initial is known,
+#   - body: letters are copied through; a letter that may end one of the ending-class patterns (and, for vii, the
+#     dummy-n lexicon) is held back one step, because the suffix rules may drop it,
+#   - final outputs carry the stem edit and suffix of the cell (VAI_SUFFIX_MAP, VII_SUFFIX_MAP, VTI PRONOUN_SUFFIX_MAP).
+# Every output is found by running the pipeline's own stage functions on probe stems, so the machine cannot drift from
+# them; letters no rule looks at share one "other" arc that copies them. The compiled machine is output-pushed and
+# minimised, and analysis walks it backwards along the surface, following a LemmaIndex trie when one is given so
+# that only listed stems are read.
+#
+# Scope: stems of at least MIN_STEM_LENGTH letters (shorter ones give None), first prefix variant of the variant
+# policy active at compile time (what ConjugatedForm.render() shows).
+
+import json
+from os.path import commonprefix
+from pathlib import Path
+from .lemma_index import LemmaIndex, type_mask
+from .models import Analysis, ConjugationInput
+from .paradigm import DIRECT_OBJECTS, FORMS, NEGATIONS, TENSES, get_pronouns
+from .pipeline import SUFFIX_PARTS, get_prefixes
+from .pronoun_prefix_core import PERSON_PREFIX_MAP, get_variant_policy
+from .tense_prefix_core import LONG_VOWEL_INITIALS, ONE_LETTER_SHIFTS, TWO_LETTER_SHIFTS, get_tense_parts
+
+# --- 1. Constants ---
+FORMAT = "conjugator-fst"
+VERSION = 1
+VERB_TYPES = ("vai", "vii", "vti")
+
+# The head needs two letters and the suffix rules drop at most one, so three letters keep them apart.
+MIN_STEM_LENGTH = 3
+# Stands for any letter no rule looks at while probing the stage functions.
+OTHER_LETTER = "\x01"
+# Word starts that still need a second letter to fix the initial (the "z" of "zh", the "a" of "aa", ...).
+OPEN_HEADS = frozenset(key[:1] for key in (*TWO_LETTER_SHIFTS, *LONG_VOWEL_INITIALS) if len(key) == 2)
+# Below this many lemmas under a LemmaIndex node, analysis checks each remaining stem with one forward walk instead of
+# branching letter by letter.
+FORWARD_CHECK_LEMMAS = 16
+# Preverbs are printed with a hyphen (gii-, wii-, ...): a guessed stem holding one has swallowed a preverb.
+PREVERB_HYPHEN = "-"
+
+# --- 2. Cells and ending patterns ---
+def paradigm_cells(verb_types: tuple[str, ...] = VERB_TYPES) -> list[tuple]:
+    """Every (type, form, negation, tense, pronoun, object) cell, in conjugate_paradigm order."""
+    return [(verb_type, form, neg, tense, pronoun, obj)
+            for verb_type in verb_types
+            for form in FORMS[verb_type]
+            for neg in NEGATIONS
+            for tense in TENSES
+            for pronoun in get_pronouns(verb_type, form)
+            for obj in DIRECT_OBJECTS[verb_type]]
+
+def cell_tag(verb_type: str, form: str, negation: bool, tense: str, pronoun: str, direct_object: str | None = None) -> str:
+    return f"<{verb_type}+{form}+{'neg' if negation else 'pos'}+{tense}+{pronoun}+{direct_object or '-'}>"
+
+def parse_tag(tag: str) -> tuple:
+    verb_type, form, neg, tense, pronoun, obj = tag[1:-1].split("+")
+    return verb_type, form, neg == "neg", tense, pronoun, None if obj == "-" else obj
+
+def ending_patterns(verb_type: str) -> tuple[str, ...]:
+    """The endings classify_ending tests for a verb type."""
+    if verb_type == "vai":
+        from . import vai_suffixes_core as module
+        return (*module.LONG_VOWEL_ENDINGS, *module.SHORT_VOWEL_ENDINGS, module.AM_ENDING, module.N_ENDING)
+    if verb_type == "vii":
+        from . import vii_suffixes_core as module
+        return (module.D_ENDING, module.N_ENDING, *module.LONG_VOWEL_ENDINGS, *module.SHORT_VOWEL_ENDINGS)
+    if verb_type == "vti":
+        from . import vti_suffixes_core as module
+        return (*module.THREE_LETTER_ENDINGS, *module.TWO_LETTER_ENDINGS)
+    raise ValueError(f"Unsupported verb type '{verb_type}'")
+
+def lexical_stems(verb_type: str) -> frozenset[str]:
+    """Stems classified by lexicon membership rather than by their ending."""
+    if verb_type == "vii":
+        from .vii_suffixes_core import DUMMY_N
+        return frozenset(DUMMY_N)
+    return frozenset()
+
+class EndingTracker:
+    # Aho-Corasick over a verb type's ending patterns: the state is the longest suffix of the text read so far that is
+    # the start of a pattern, which is all classify_ending can see of a word.
+    def __init__(self, patterns: tuple[str, ...]):
+        self.starts = frozenset(pattern[:i] for pattern in patterns for i in range(len(pattern) + 1))
+        self.moves = {}
+
+    def step(self, node: str, letter: str) -> str:
+        key = (node, letter)
+        moved = self.moves.get(key)
+        if moved is None:
+            moved = node + letter
+            while moved not in self.starts:
+                moved = moved[1:]
+            self.moves[key] = moved
+        return moved
+
+    def walk(self, text: str) -> str:
+        node = ""
+        for letter in text:
+            node = self.step(node, letter)
+        return node
+
+# --- 3. Compiler ---
+class Compiler:
+    """
+    Builds the transducer by exploring configurations:
+      ("start",), ("head", cell, letters read), ("body", tail, ending node, lexicon prefix, held, depth)
+    where tail is the cell without its tense (the suffix stage never reads it) and depth counts letters up to three.
+    """
+
+    def __init__(self, verb_types: tuple[str, ...] = VERB_TYPES):
+        self.cells = paradigm_cells(verb_types)
+        self.trackers = {verb_type: EndingTracker(ending_patterns(verb_type)) for verb_type in verb_types}
+        self.lexicons = {verb_type: lexical_stems(verb_type) for verb_type in verb_types}
+        self.lexicon_starts = {verb_type: frozenset(stem[:i] for stem in stems for i in range(len(stem) + 1))
+                               for verb_type, stems in self.lexicons.items()}
+        letters = set(OPEN_HEADS) | set(TWO_LETTER_SHIFTS) | set("".join(LONG_VOWEL_INITIALS))
+        letters.update(*(tracker.starts for tracker in self.trackers.values()))
+        letters.update(*self.lexicons.values())
+        letters.update(*ONE_LETTER_SHIFTS, *(initial for table in PERSON_PREFIX_MAP.values() for initial in table))
+        self.alphabet = "".join(sorted(set("".join(letters))))
+
+    # --- Stage probes ---
+    def head_output(self, cell: tuple, head: str) -> str | None:
+        """Prefix + preverb + shifted head letters of a cell, or None when the cell has no prefix for that initial."""
+        verb_type, form, _, tense, pronoun, _ = cell
+        probe = head + OTHER_LETTER * MIN_STEM_LENGTH
+        preverb, stem, initial = get_tense_parts(probe, pronoun, tense)
+        try:
+            prefix = get_prefixes(verb_type, form, pronoun, initial)[0]
+        except ValueError:
+            return None
+        return prefix + preverb + stem[:len(stem) - MIN_STEM_LENGTH]
+
+    def final_output(self, tail: tuple, node: str, lexical: str | None, held: bool) -> str | None:
+        """Stem edit + suffix still owed at the end of a word, or None when the suffix stage rejects the word."""
+        verb_type, form, neg, pronoun, obj = tail
+        probe = lexical if lexical in self.lexicons[verb_type] else OTHER_LETTER * MIN_STEM_LENGTH + node
+        input_data = ConjugationInput(type=verb_type, form=form, verb=probe, pronoun=pronoun, negation=neg, direct_object=obj)
+        try:
+            stem, suffix = SUFFIX_PARTS[verb_type](input_data)
+        except Exception:
+            return None
+        emitted = probe[:-1] if held else probe
+        if not stem.startswith(emitted) or OTHER_LETTER in stem[len(emitted):]:
+            raise ValueError(f"Stem edit {probe!r} -> {stem!r} ({tail}) reaches past the held letter")
+        return stem[len(emitted):] + suffix
+
+    # --- Configurations ---
+    def enter_body(self, cell: tuple, head: str) -> tuple:
+        verb_type, form, neg, _, pronoun, obj = cell
+        lexical = head if head in self.lexicon_starts[verb_type] else None
+        return ("body", (verb_type, form, neg, pronoun, obj), self.trackers[verb_type].walk(head), lexical, False, len(head))
+
+    def head_arc(self, cell: tuple, head: str):
+        if head in OPEN_HEADS:
+            return ("head", cell, head), ""
+        output = self.head_output(cell, head)
+        if output is None:
+            return None
+        return self.enter_body(cell, head), output
+
+    def expand(self, config: tuple) -> tuple:
+        """(final output, {label: (target, output)}, other-letter arc (target, before, after)) of a configuration."""
+        if config[0] == "start":
+            return None, {cell_tag(*cell): (("head", cell, ""), "") for cell in self.cells}, None
+
+        if config[0] == "head":
+            _, cell, read = config
+            arcs = {}
+            for letter in self.alphabet:
+                arc = self.head_arc(cell, read + letter)
+                if arc is not None:
+                    arcs[letter] = arc
+            other = self.head_arc(cell, read + OTHER_LETTER)
+            if other is not None:
+                target, output = other
+                other = (target, output[:-1], "")
+            return None, arcs, other
+
+        _, tail, node, lexical, held, depth = config
+        verb_type = tail[0]
+        tracker = self.trackers[verb_type]
+        owed = node[-1] if held else ""
+        next_depth = min(depth + 1, MIN_STEM_LENGTH)
+        arcs = {}
+        for letter in self.alphabet:
+            next_node = tracker.step(node, letter)
+            next_lexical = None if lexical is None else lexical + letter
+            if next_lexical not in self.lexicon_starts[verb_type]:
+                next_lexical = None
+            hold = next_node != "" and next_depth == MIN_STEM_LENGTH
+            arcs[letter] = (("body", tail, next_node, next_lexical, hold, next_depth), owed + ("" if hold else letter))
+        other = (("body", tail, "", None, False, next_depth), owed, "")
+        final = self.final_output(tail, node, lexical, held) if depth == MIN_STEM_LENGTH else None
+        return final, arcs, other
+
+    def explore(self) -> tuple[list, list, list]:
+        ids = {("start",): 0}
+        configs = [("start",)]
+        finals, arcs, others = [], [], []
+        for config in configs:
+            final, config_arcs, other = self.expand(config)
+            numbered = {}
+            for label, (target, output) in config_arcs.items():
+                if target not in ids:
+                    ids[target] = len(configs)
+                    configs.append(target)
+                numbered[label] = (ids[target], output)
+            if other is not None:
+                target, before, after = other
+                if target not in ids:
+                    ids[target] = len(configs)
+                    configs.append(target)
+                other = (ids[target], before, after)
+            finals.append(final)
+            arcs.append(numbered)
+            others.append(other)
+        return finals, arcs, others
+
+    def compile(self) -> "Transducer":
+        finals, arcs, others = self.explore()
+        finals, arcs, others = trim(finals, arcs, others)
+        drop_covered_arcs(arcs, others)
+        initial, finals, arcs, others = push_outputs(finals, arcs, others)
+        finals, arcs, others = minimise(finals, arcs, others)
+        drop_covered_arcs(arcs, others)
+        return Transducer(initial, finals, arcs, others, get_variant_policy().preferred)
+
+# --- 4. Optimisation passes ---
+# States are numbered lists: finals[i] (output or None), arcs[i] {label: (target, output)},
+# others[i] (target, before, after) or None for the arc copying any letter without an arc of its own. State 0 starts.
+def trim(finals: list, arcs: list, others: list) -> tuple[list, list, list]:
+    """Drops states from which no final state can be reached, and the arcs into them."""
+    incoming = [[] for _ in finals]
+    for state, state_arcs in enumerate(arcs):
+        for target, _ in state_arcs.values():
+            incoming[target].append(state)
+        if others[state] is not None:
+            incoming[others[state][0]].append(state)
+    live = {state for state, final in enumerate(finals) if final is not None}
+    stack = list(live)
+    while stack:
+        for source in incoming[stack.pop()]:
+            if source not in live:
+                live.add(source)
+                stack.append(source)
+    if 0 not in live:
+        raise ValueError("The transducer accepts no input")
+    order = [0] + sorted(live - {0})
+    renumber = {state: i for i, state in enumerate(order)}
+    return ([finals[state] for state in order],
+            [{label: (renumber[target], output) for label, (target, output) in arcs[state].items() if target in live}
+             for state in order],
+            [None if others[state] is None or others[state][0] not in live else (renumber[others[state][0]], *others[state][1:])
+             for state in order])
+
+def drop_covered_arcs(arcs: list, others: list) -> None:
+    """Removes letter arcs that do exactly what the state's other-letter arc would do."""
+    for state_arcs, other in zip(arcs, others):
+        if other is None:
+            continue
+        target, before, after = other
+        for label in [label for label, arc in state_arcs.items() if arc == (target, before + label + after)]:
+            del state_arcs[label]
+
+def push_outputs(finals: list, arcs: list, others: list) -> tuple[str, list, list, list]:
+    """
+    Moves output as close to the start as it can go (each state's output becomes the longest prefix shared by all its
+    continuations), so analysis can match the surface early instead of guessing letters that print nothing yet.
+    """
+    shared = [None] * len(finals)
+    changed = True
+    while changed:
+        changed = False
+        for state in reversed(range(len(finals))):
+            candidates = [] if finals[state] is None else [finals[state]]
+            candidates += [output + shared[target] for target, output in arcs[state].values() if shared[target] is not None]
+            if others[state] is not None:
+                # The copied letter can be anything, so nothing after it is shared.
+                candidates.append(others[state][1])
+            if candidates:
+                prefix = commonprefix(candidates)
+                if prefix != shared[state]:
+                    shared[state] = prefix
+                    changed = True
+    pushed_finals = [None if final is None else final[len(shared[state]):] for state, final in enumerate(finals)]
+    pushed_arcs = [{label: (target, (output + shared[target])[len(shared[state]):]) for label, (target, output) in state_arcs.items()}
+                   for state, state_arcs in enumerate(arcs)]
+    pushed_others = [None if other is None else (other[0], other[1][len(shared[state]):], other[2] + shared[other[0]])
+                     for state, other in enumerate(others)]
+    return shared[0], pushed_finals, pushed_arcs, pushed_others
+
+def minimise(finals: list, arcs: list, others: list) -> tuple[list, list, list]:
+    """Moore partition refinement: merges states with the same final output and the same arcs into the same blocks."""
+    arc_items = [tuple(sorted(state_arcs.items())) for state_arcs in arcs]
+    blocks = [0] * len(finals)
+    count = 0
+    while True:
+        signatures = {}
+        refined = []
+        for state in range(len(finals)):
+            other = others[state]
+            signature = (blocks[state], finals[state],
+                         tuple((label, blocks[target], output) for label, (target, output) in arc_items[state]),
+                         None if other is None else (blocks[other[0]], other[1], other[2]))
+            refined.append(signatures.setdefault(signature, len(signatures)))
+        blocks = refined
+        if len(signatures) == count:
+            break
+        count = len(signatures)
+    # One representative per block, with the start state's block first.
+    representatives = {}
+    for state, block in enumerate(blocks):
+        representatives.setdefault(block, state)
+    order = sorted(representatives, key=lambda block: (block != blocks[0], representatives[block]))
+    renumber = {block: i for i, block in enumerate(order)}
+    states = [representatives[block] for block in order]
+    return ([finals[state] for state in states],
+            [{label: (renumber[blocks[target]], output) for label, (target, output) in arcs[state].items()} for state in states],
+            [None if others[state] is None else (renumber[blocks[others[state][0]]], *others[state][1:]) for state in states])
+
+def compile_fst(verb_types: tuple[str, ...] = VERB_TYPES) -> "Transducer":
+    """Compiles the rules of the given verb types into a minimised transducer; takes a few seconds."""
+    return Compiler(verb_types).compile()
+
+# --- 5. Transducer ---
+class Transducer:
+    # A compiled machine: generate() walks it forwards from a cell tag and a stem, analyze() walks it backwards
+    # along a surface form. Load a saved one with Transducer.load instead of recompiling.
+    def __init__(self, initial: str, finals: list, arcs: list, others: list, preferred_variant: str):
+        self.initial = initial
+        self.finals = finals
+        self.arcs = arcs
+        self.others = others
+        self.preferred_variant = preferred_variant
+        self.cell_arcs = None
+        self.surface_index = None
+
+    def __len__(self) -> int:
+        return len(self.finals)
+
+    # --- Generation ---
+    def generate(self, verb: str, verb_type: str, form: str, negation: bool, tense: str, pronoun: str,
+                 direct_object: str | None = None) -> str | None:
+        """The plain surface form of one cell (ConjugatedForm.render()), or None when the pipeline has none."""
+        if len(verb) < MIN_STEM_LENGTH:
+            return None
+        arc = self.arcs[0].get(cell_tag(verb_type, form, negation, tense, pronoun, direct_object))
+        if arc is None:
+            return None
+        state, output = arc
+        parts = [self.initial, output]
+        arcs, others = self.arcs, self.others
+        for letter in verb:
+            arc = arcs[state].get(letter)
+            if arc is not None:
+                state, output = arc
+                parts.append(output)
+                continue
+            other = others[state]
+            if other is None:
+                return None
+            state, before, after = other
+            parts += (before, letter, after)
+        final = self.finals[state]
+        if final is None:
+            return None
+        parts.append(final)
+        return "".join(parts)
+
+    def generate_paradigm(self, verb: str, verb_type: str) -> dict[tuple, str]:
+        """
+        Surface form of every cell of a lemma that has one, by (type, form, negation, tense, pronoun, object) in
+        paradigm order. Cells share the walk over the stem after its first MIN_STEM_LENGTH letters, which only
+        depends on the state reached there.
+        """
+        if len(verb) < MIN_STEM_LENGTH:
+            return {}
+        head, rest = verb[:MIN_STEM_LENGTH], verb[MIN_STEM_LENGTH:]
+        if self.cell_arcs is None:
+            self.cell_arcs = {}
+            for tag, arc in self.arcs[0].items():
+                cell = parse_tag(tag)
+                self.cell_arcs.setdefault(cell[0], []).append((cell, *arc))
+        tails = {}
+        forms = {}
+        for cell, state, output in self.cell_arcs.get(verb_type, ()):
+            parts = [self.initial, output]
+            state = self.walk(state, head, parts)
+            if state is None:
+                continue
+            tail = tails.get(state, False)
+            if tail is False:
+                tail_parts = []
+                end = self.walk(state, rest, tail_parts)
+                tail = tails[state] = None if end is None or self.finals[end] is None else "".join(tail_parts) + self.finals[end]
+            if tail is not None:
+                forms[cell] = "".join(parts) + tail
+        return forms
+
+    def walk(self, state: int, letters: str, parts: list[str]) -> int | None:
+        """Reads letters from state, appending the output to parts; returns the state reached, or None."""
+        arcs, others = self.arcs, self.others
+        for letter in letters:
+            arc = arcs[state].get(letter)
+            if arc is not None:
+                state, output = arc
+                parts.append(output)
+                continue
+            other = others[state]
+            if other is None:
+                return None
+            state, before, after = other
+            parts += (before, letter, after)
+        return state
+
+    # --- Analysis ---
+    def build_surface_index(self) -> tuple[dict, int, list]:
+        """
+        What analysis looks up instead of scanning arcs:
+          - start arcs by their output, then by target, each with its cells and their LemmaIndex type mask (the cells
+            of one start arc share every analysis below it), plus the longest start output,
+          - per state, the letter arcs by what they print, the lengths of those outputs, and the arcs that print nothing.
+        """
+        cells = {}
+        for tag, arc in self.arcs[0].items():
+            cells.setdefault(arc, []).append(parse_tag(tag))
+        starts = {}
+        for (target, output), arc_cells in cells.items():
+            starts.setdefault(output, []).append((target, arc_cells, type_mask(cell[0] for cell in arc_cells)))
+        index = []
+        for state_arcs in self.arcs:
+            by_letter, silent = {}, []
+            for label, (target, output) in state_arcs.items():
+                if output:
+                    by_letter.setdefault(output[0], []).append((label, target, output))
+                else:
+                    silent.append((label, target))
+            index.append((by_letter, silent))
+        return starts, max(map(len, starts)), index
+
+    def reads_to_end(self, surface: str, state: int, position: int, letters: str) -> bool:
+        """Whether reading letters from state prints exactly the rest of surface from position, then stops."""
+        arcs, others = self.arcs, self.others
+        for letter in letters:
+            arc = arcs[state].get(letter)
+            if arc is not None:
+                state, output = arc
+            else:
+                other = others[state]
+                if other is None:
+                    return False
+                state, before, after = other
+                output = before + letter + after
+            if not surface.startswith(output, position):
+                return False
+            position += len(output)
+        final = self.finals[state]
+        return final is not None and len(surface) - position == len(final) and surface.endswith(final)
+
+    def analyze(self, surface: str, lemmas: LemmaIndex | None = None) -> list[Analysis]:
+        """
+        Every (stem, cell) the transducer maps to this plain surface form.
+        Matches the surface exactly as generate() prints it (hyphenated preverbs, first prefix variant).
+        lemmas: only stems listed there, in cells of a verb type they are listed under. The walk follows the index's
+        trie, so it stops as soon as the stem read so far starts no lemma; use it for corpus-scale analysis.
+        Without it any stem is guessed, except one holding a preverb hyphen.
+        """
+        if not surface.startswith(self.initial):
+            return []
+        if self.surface_index is None:
+            self.surface_index = self.build_surface_index()
+        (starts, longest_start, index), arcs, others, finals = self.surface_index, self.arcs, self.others, self.finals
+        end = len(surface)
+        if lemmas is None:
+            # Every stem stays at the root of a one-node "trie" that takes any letter but the hyphen.
+            def step(node: int, letter: str, types: int) -> int | None:
+                return None if letter == PREVERB_HYPHEN else node
+
+            def complete(node: int) -> bool:
+                return True
+
+            def few_stems(node: int, depth: int, types: int) -> list[str] | None:
+                return None
+        else:
+            child, exact, type_masks, type_codes = lemmas.child, lemmas.exact, lemmas.type_masks, lemmas.type_codes
+            first_lemma, end_lemma = lemmas.starts, lemmas.ends
+
+            def step(node: int, letter: str, types: int) -> int | None:
+                below = child(node, letter)
+                return below if below is not None and type_masks[below] & types else None
+
+            def complete(node: int) -> bool:
+                return exact[node] > 0
+
+            def few_stems(node: int, depth: int, types: int) -> list[str] | None:
+                """The rest of every stem of the given types below node, when there are few enough to check one by one."""
+                if end_lemma[node] - first_lemma[node] > FORWARD_CHECK_LEMMAS:
+                    return None
+                # Lemmas are in (verb, type) order, so a verb listed under two types comes twice in a row.
+                return list(dict.fromkeys(lemmas.verb(lemma)[depth:] for lemma in range(first_lemma[node], end_lemma[node])
+                                          if 1 << type_codes[lemma] & types))
+
+        # Stems readable from (state, position, stem node, verb types) to the end of the surface; many cells reach the
+        # same key. depth is the number of stem letters read so far, which the node implies.
+        memo = {}
+
+        def walk(state: int, position: int, node: int, depth: int, types: int) -> list[str]:
+            key = (state, position, node, types)
+            stems = memo.get(key)
+            if stems is not None:
+                return stems
+            rests = few_stems(node, depth, types)
+            if rests is not None:
+                stems = memo[key] = [rest for rest in rests if self.reads_to_end(surface, state, position, rest)]
+                return stems
+            stems = memo[key] = []
+            final = finals[state]
+            if final is not None and end - position == len(final) and surface.endswith(final) and complete(node):
+                stems.append("")
+            by_letter, silent = index[state]
+            for label, target in silent:
+                below = step(node, label, types)
+                if below is not None:
+                    stems += [label + stem for stem in walk(target, position, below, depth + 1, types)]
+            if position < end:
+                for label, target, output in by_letter.get(surface[position], ()):
+                    if surface.startswith(output, position):
+                        below = step(node, label, types)
+                        if below is not None:
+                            stems += [label + stem for stem in walk(target, position + len(output), below, depth + 1, types)]
+                other = others[state]
+                if other is not None and surface.startswith(other[1], position):
+                    target, before, after = other
+                    copied = position + len(before)
+                    letter = surface[copied:copied + 1]
+                    if letter and letter not in arcs[state] and surface.startswith(after, copied + 1):
+                        below = step(node, letter, types)
+                        if below is not None:
+                            stems += [letter + stem for stem in walk(target, copied + 1 + len(after), below, depth + 1, types)]
+            return stems
+
+        analyses = []
+        position = len(self.initial)
+        stem_types = {}
+        for length in range(min(longest_start, end - position) + 1):
+            for target, cells, types in starts.get(surface[position:position + length], ()):
+                stems = walk(target, position + length, 0, 0, types)
+                for cell in cells if stems else ():
+                    for stem in stems:
+                        if lemmas is not None:
+                            listed = stem_types.get(stem)
+                            if listed is None:
+                                listed = stem_types[stem] = {entry.type for entry in lemmas.lookup(stem)}
+                            if cell[0] not in listed:
+                                continue
+                        analyses.append(Analysis(stem, *cell))
+        return analyses
+
+    # --- Storage ---
+    def save(self, path: str | Path) -> None:
+        data = {
+            "format": FORMAT,
+            "version": VERSION,
+            "preferred_variant": self.preferred_variant,
+            "min_stem_length": MIN_STEM_LENGTH,
+            "initial": self.initial,
+            "finals": self.finals,
+            "arcs": self.arcs,
+            "others": self.others
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Transducer":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != FORMAT or data.get("version") != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} conjugation transducer")
+        arcs = [{label: tuple(arc) for label, arc in state_arcs.items()} for state_arcs in data["arcs"]]
+        others = [None if other is None else tuple(other) for other in data["others"]]
+        return cls(data["initial"], data["finals"], arcs, others, data["preferred_variant"])
@@ -0,0 +1,21 @@
+# This file lets optional tooling (instrumentation.py) reach the suffix modules without importing them.
+# Each suffix module announces itself here as the last step of its import; a hook sees every module announced
+# before it was added and every one announced after, whichever code path did the import.
+
+from types import ModuleType
+from typing import Callable
+
+SUFFIX_MODULES: dict[str, ModuleType] = {}
+SUFFIX_MODULE_HOOKS: list[Callable[[str, ModuleType], None]] = []
+
+def suffix_module_loaded(verb_type: str, module: ModuleType) -> None:
+    SUFFIX_MODULES[verb_type] = module
+    for hook in list(SUFFIX_MODULE_HOOKS):
+        hook(verb_type, module)
+
+def on_suffix_module(hook: Callable[[str, ModuleType], None]) -> Callable[[], None]:
+    """Calls hook(verb type, module) for every suffix module, loaded now or later; returns a function removing the hook."""
+    SUFFIX_MODULE_HOOKS.append(hook)
+    for verb_type, module in list(SUFFIX_MODULES.items()):
+        hook(verb_type, module)
+    return lambda: SUFFIX_MODULE_HOOKS.remove(hook)
@@ -0,0 +1,147 @@
+# This file streams large lexicon files (TSV or CSV) into clean, tagged lemma entries.
+#   - rows are read one at a time and handed out in chunks, so memory stays flat however large the file is,
+#   - stems are normalised to double-vowel orthography (one apostrophe, doubled long vowels, no accents),
+#   - the verb type is checked against the endings its rules expect, and each entry's ending class is precomputed,
+#   - a stem of a type that takes pronoun prefixes must start with a letter the prefix tables cover,
+#   - a bad row is written to the reject file with its line number and reason, and the run carries on.
+# Entries come out as LemmaEntry, ready for LemmaIndex or, as (verb, type) pairs, for the paradigm builders.
+
+import csv
+import re
+import unicodedata
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+from .enum import EndingClass, Form
+from .models import LemmaEntry
+from .planner import classify_lemma
+from .pronoun_prefix_core import PERSON_PREFIX_MAP, takes_pronoun_prefix
+from .tense_prefix_core import get_initial
+
+# --- 1. Constants ---
+VERB_TYPES = ("vai", "vii", "vti")
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Letters of the double-vowel alphabet, plus the apostrophe (glottal stop) and the hyphen of compound stems.
+ALPHABET = frozenset("abcdeghijkmnopstwyz'-")
+APOSTROPHES = str.maketrans(dict.fromkeys("’‘ʼʻ`´", "'"))
+# Long vowels written with a diacritic in other orthographies.
+MARKED_VOWELS = str.maketrans({
+    "ā": "aa", "á": "aa", "â": "aa", "à": "aa",
+    "ī": "ii", "í": "ii", "î": "ii", "ì": "ii",
+    "ō": "oo", "ó": "oo", "ô": "oo", "ò": "oo",
+    "ē": "e", "é": "e", "ê": "e", "è": "e"
+})
+# A vowel is short or doubled: "aaa" is a typo for "aa"; e is always long and never doubled.
+OVERLONG_VOWELS = re.compile(r"([aio])\1{2,}")
+DOUBLED_E = re.compile(r"e{2,}")
+
+# What each type's rules expect a stem to end in (the classes classify_ending can return other than OTHER).
+EXPECTED_ENDINGS = {
+    "vai": "-am, -n or a vowel",
+    "vii": "-d, -n or a vowel",
+    "vti": "-an, -aan, -oon or -in"
+}
+
+REJECT_HEADER = "# line\treason\trow\n"
+
+# --- 2. Normalising and validating ---
+def normalize_stem(text: str) -> str:
+    """Double-vowel spelling of a stem: lowercase, one apostrophe character, accents spelled out as double vowels."""
+    text = unicodedata.normalize("NFC", text.strip().lower())
+    text = text.translate(APOSTROPHES).translate(MARKED_VOWELS)
+    text = OVERLONG_VOWELS.sub(r"\1\1", text)
+    return DOUBLED_E.sub("e", text)
+
+def tag_entry(verb: str, verb_type: str) -> str:
+    """Returns the ending class of a normalised stem; raises ValueError when the stem does not fit its type."""
+    if verb_type not in VERB_TYPES:
+        raise ValueError(f"unknown verb type '{verb_type}', expected one of {VERB_TYPES}")
+    if not verb:
+        raise ValueError("empty stem")
+    letters = set(verb) - ALPHABET
+    if letters:
+        raise ValueError(f"stem '{verb}' has letters outside the double-vowel alphabet: {''.join(sorted(letters))}")
+    # The present tense attaches the prefix to the stem itself; every person's table has the same initials.
+    initial = get_initial(verb)
+    if takes_pronoun_prefix(verb_type, Form.INDEPENDENT_CLAUSE) and initial not in PERSON_PREFIX_MAP["first"]:
+        raise ValueError(f"{verb_type} stem '{verb}' starts with '{initial}', which takes no pronoun prefix")
+    ending_class = classify_lemma(verb_type, verb)
+    if ending_class is None or ending_class == EndingClass.OTHER:
+        raise ValueError(f"{verb_type} stem '{verb}' must end in {EXPECTED_ENDINGS[verb_type]}")
+    return EndingClass(ending_class).value
+
+def parse_row(fields: list[str]) -> LemmaEntry:
+    """verb, type[, frequency] fields to a tagged entry; raises ValueError naming what is wrong with the row."""
+    if len(fields) not in (2, 3):
+        raise ValueError(f"expected verb, type[, frequency], got {len(fields)} fields")
+    frequency = 0
+    if len(fields) == 3:
+        if not fields[2].strip().isdigit():
+            raise ValueError(f"frequency '{fields[2]}' is not a whole number")
+        frequency = int(fields[2])
+    verb, verb_type = normalize_stem(fields[0]), fields[1].strip().lower()
+    return LemmaEntry(verb, verb_type, tag_entry(verb, verb_type), frequency)
+
+# --- 3. Streaming ---
+class LexiconReader:
+    """
+    Iterates over a lexicon file as lists of at most chunk_size LemmaEntry, writing bad rows to reject_path.
+    Files ending in .csv are read as CSV, anything else as tab-separated; blank lines, '#' comments and a
+    'verb, type' header row are skipped. Counts are up to date after each chunk:
+      read (data rows seen), accepted, rejected.
+    """
+
+    def __init__(self, path: str | Path, reject_path: str | Path | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+        self.path = Path(path)
+        self.reject_path = reject_path
+        self.chunk_size = chunk_size
+        self.delimiter = "," if self.path.suffix.lower() == ".csv" else "\t"
+        self.read = self.accepted = self.rejected = 0
+
+    def rows(self, file: TextIO) -> Iterator[tuple[int, str, list[str]]]:
+        """(line number, raw line, fields) of every data row."""
+        for line_number, line in enumerate(file, start=1):
+            raw = line.rstrip("\r\n")
+            if not raw.strip() or raw.lstrip().startswith("#"):
+                continue
+            fields = next(csv.reader([raw], delimiter=self.delimiter))
+            if line_number == 1 and [field.strip().lower() for field in fields[:2]] == ["verb", "type"]:
+                continue
+            yield line_number, raw, fields
+
+    def entries(self, file: TextIO, rejects: TextIO | None) -> Iterator[LemmaEntry]:
+        for line_number, raw, fields in self.rows(file):
+            self.read += 1
+            try:
+                entry = parse_row(fields)
+            except ValueError as e:
+                self.rejected += 1
+                if rejects is not None:
+                    rejects.write(f"{line_number}\t{e}\t{raw}\n")
+                continue
+            self.accepted += 1
+            yield entry
+
+    def __iter__(self) -> Iterator[list[LemmaEntry]]:
+        rejects = None
+        with open(self.path, encoding="utf-8", newline="") as file:
+            try:
+                if self.reject_path is not None:
+                    rejects = open(self.reject_path, "w", encoding="utf-8")
+                    rejects.write(REJECT_HEADER)
+                entries = self.entries(file, rejects)
+                while chunk := list(islice(entries, self.chunk_size)):
+                    yield chunk
+            finally:
+                if rejects is not None:
+                    rejects.close()
+
+def iter_lexicon(path: str | Path, reject_path: str | Path | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[LemmaEntry]:
+    """Every accepted entry of a lexicon file, one at a time (see LexiconReader)."""
+    for chunk in LexiconReader(path, reject_path, chunk_size):
+        yield from chunk
@@ -0,0 +1,230 @@
+# This file provides opt-in instrumentation for tuning: which rules fire on a lexicon, and where the time goes.
+#   - per rule: matches() attempts and hits, as the first-match-wins scan over its rule list would make them;
+#     vti rules, which all share one class, are named by their position in their (form, negation) group and stem edit,
+#   - per pipeline stage (suffix, tense, pronoun): calls and total time spent in conjugate() / conjugate_many()
+#     and in conjugate_paradigm() / conjugate_paradigm_forms().
+# Enabling installs wrappers on the stage functions and suffix registries of pipeline.py and paradigm.py, and rule
+# counters on every suffix module, loaded now or later by any caller (see hooks.py), so direct calls such as
+# get_vai_suffix() are counted too. conjugate_paradigm_forms times its tense stage per get_all_tense_parts call,
+# which covers all five tenses. Disabling removes everything, so the hot path runs exactly the uninstrumented code
+# when instrumentation is off. Suffix modules not loaded yet stay unloaded until their verb type is first used.
+# Counters are not locked: instrument single-threaded runs.
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import wraps
+from importlib import import_module
+from types import ModuleType
+from typing import Callable
+from . import paradigm, pipeline
+from .hooks import on_suffix_module
+from .lazy import LazyRegistry
+
+STAGES = ("suffix", "tense", "pronoun")
+# (module, function name, stage) of every stage function that is looked up by name at call time.
+STAGE_FUNCTIONS = (
+    (pipeline, "get_tense_parts", "tense"),
+    (pipeline, "get_prefixes", "pronoun"),
+    (paradigm, "get_all_tense_parts", "tense"),
+    (paradigm, "get_prefixes", "pronoun"),
+    (paradigm, "get_pronoun_prefixes", "pronoun")
+)
+# Registries of suffix stage functions, verb type -> function.
+SUFFIX_REGISTRIES = (pipeline.SUFFIX_PARTS, paradigm.SUFFIX_FUNCTIONS)
+
+@dataclass
+class RuleStats:
+    attempts: int = 0
+    hits: int = 0
+
+    @property
+    def misses(self) -> int:
+        return self.attempts - self.hits
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+def late_bound(source: str, package: str) -> Callable:
+    """Calls the "module:attribute" source as it is at call time, so a function replaced by a rule counter is used."""
+    module_name, attribute = source.split(":")
+    modules = []
+
+    def call(input_data):
+        if not modules:
+            modules.append(import_module(module_name, package))
+        return getattr(modules[0], attribute)(input_data)
+    return call
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.rules = {}
+        self.stages = {stage: StageStats() for stage in STAGES}
+        self.no_match = 0
+        self.restore = []
+
+    # --- Rule counters ---
+    def count(self, rule_stats: list[RuleStats], winner: int | None) -> None:
+        """Every rule up to the winner (all of them when none matches) is attempted; only the winner hits."""
+        if winner is None:
+            self.no_match += 1
+            attempted = len(rule_stats)
+        else:
+            rule_stats[winner].hits += 1
+            attempted = winner + 1
+        for rule in rule_stats[:attempted]:
+            rule.attempts += 1
+
+    def rule_stats(self, verb_type: str, key: tuple, label: str) -> RuleStats:
+        form, neg = key
+        name = f"{verb_type}.{getattr(form, 'value', form)}.{'negative' if neg else 'positive'}.{label}"
+        return self.rules.setdefault(name, RuleStats())
+
+    def wrap_dispatcher(self, verb_type: str, dispatcher) -> Callable:
+        find = dispatcher.find
+        positions = {key: {id(rule): i for i, rule in enumerate(rules)} for key, rules in dispatcher.registry.items()}
+        stats = {key: [self.rule_stats(verb_type, key, type(rule).__name__) for rule in rules]
+                 for key, rules in dispatcher.registry.items()}
+
+        @wraps(find)
+        def counted_find(form, neg, verb, pronoun):
+            entry = find(form, neg, verb, pronoun)
+            self.count(stats[form, neg], None if entry is None else positions[form, neg][id(entry[0])])
+            return entry
+        return counted_find
+
+    def wrap_vti(self, module: ModuleType) -> Callable:
+        # The compiled RULE_INDEX names the winning rule; its group is the order the rules are listed in.
+        get_parts, classify, index = module.get_vti_parts, module.classify_ending, module.RULE_INDEX
+        groups = {}
+        for rule in module.VTI_RULES:
+            groups.setdefault((rule.form, rule.negation), []).append(rule)
+        positions = {id(rule): i for rules in groups.values() for i, rule in enumerate(rules)}
+        stats = {key: [self.rule_stats("vti", key, f"{i + 1}.{rule.edit.__name__}") for i, rule in enumerate(rules)]
+                 for key, rules in groups.items()}
+
+        @wraps(get_parts)
+        def counted_parts(input_data):
+            neg = bool(input_data.negation)
+            winner = index.get((input_data.form, neg, input_data.direct_object, classify(input_data.verb), input_data.pronoun))
+            self.count(stats.get((input_data.form, neg), []), None if winner is None else positions[id(winner)])
+            return get_parts(input_data)
+        return counted_parts
+
+    # --- Stage timers ---
+    def wrap_stage(self, stage: str, func: Callable) -> Callable:
+        stats = self.stages[stage]
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.calls += 1
+                stats.seconds += time.perf_counter() - start
+        return timed
+
+    # --- Install / remove ---
+    def instrument_rules(self, verb_type: str, module: ModuleType) -> None:
+        """Installs the rule counters of a suffix module; called for each module as it is loaded (see hooks.py)."""
+        if verb_type == "vti":
+            get_parts = module.get_vti_parts
+            module.get_vti_parts = self.wrap_vti(module)
+            self.restore.append(lambda: setattr(module, "get_vti_parts", get_parts))
+        else:
+            dispatcher = module.DISPATCHER
+            # An instance attribute shadows RuleDispatcher.find; deleting it restores the plain method.
+            dispatcher.find = self.wrap_dispatcher(verb_type, dispatcher)
+            self.restore.append(lambda: delattr(dispatcher, "find"))
+
+    def time_suffix_stage(self, registry: LazyRegistry) -> None:
+        # Snapshot the registry itself: reading every entry would import every suffix module.
+        loaded, sources = dict(registry.loaded), dict(registry.sources)
+        for verb_type, source in sources.items():
+            # Entries set by hand have no source; the rest are looked up at call time (see late_bound).
+            get_suffix = loaded[verb_type] if source is None else late_bound(source, registry.package)
+            registry[verb_type] = self.wrap_stage("suffix", get_suffix)
+
+        def restore_registry():
+            registry.loaded.clear()
+            registry.loaded.update(loaded)
+            registry.sources.clear()
+            registry.sources.update(sources)
+        self.restore.append(restore_registry)
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        for registry in SUFFIX_REGISTRIES:
+            self.time_suffix_stage(registry)
+        for module, name, stage in STAGE_FUNCTIONS:
+            func = getattr(module, name)
+            setattr(module, name, self.wrap_stage(stage, func))
+            self.restore.append(lambda module=module, name=name, func=func: setattr(module, name, func))
+        self.restore.append(on_suffix_module(self.instrument_rules))
+        self.enabled = True
+
+    def disable(self) -> None:
+        while self.restore:
+            self.restore.pop()()
+        self.enabled = False
+
+    def reset(self) -> None:
+        self.rules.clear()
+        self.stages = {stage: StageStats() for stage in STAGES}
+        self.no_match = 0
+        if self.enabled:
+            # Wrappers hold references to the old counters: reinstall them against the new ones.
+            self.disable()
+            self.enable()
+
+    def report(self) -> dict:
+        return {
+            "rules": {name: {**asdict(stats), "misses": stats.misses} for name, stats in sorted(self.rules.items())},
+            "no_match": self.no_match,
+            "stages": {stage: asdict(stats) for stage, stats in self.stages.items()}
+        }
+
+INSTRUMENTATION = Instrumentation()
+
+def enable_instrumentation() -> None:
+    INSTRUMENTATION.enable()
+
+def disable_instrumentation() -> None:
+    INSTRUMENTATION.disable()
+
+def reset_instrumentation() -> None:
+    INSTRUMENTATION.reset()
+
+def instrumentation_report() -> dict:
+    return INSTRUMENTATION.report()
+
+@contextmanager
+def instrumented():
+    """Counts and times everything run inside the block, starting from zero; yields the Instrumentation."""
+    INSTRUMENTATION.reset()
+    INSTRUMENTATION.enable()
+    try:
+        yield INSTRUMENTATION
+    finally:
+        INSTRUMENTATION.disable()
+
+def report_to_json(report: dict) -> str:
+    return json.dumps(report, indent=2)
+
+def report_to_text(report: dict) -> str:
+    lines = [f"{'rule':<60}{'attempts':>10}{'hits':>10}{'misses':>10}"]
+    for name, stats in report["rules"].items():
+        lines.append(f"{name:<60}{stats['attempts']:>10}{stats['hits']:>10}{stats['misses']:>10}")
+    lines.append(f"{'no rule matched':<60}{report['no_match']:>10}")
+    lines.append("")
+    lines.append(f"{'stage':<60}{'calls':>10}{'total ms':>10}{'us/call':>10}")
+    for stage, stats in report["stages"].items():
+        per_call = stats["seconds"] / stats["calls"] * 1e6 if stats["calls"] else 0.0
+        lines.append(f"{stage:<60}{stats['calls']:>10}{stats['seconds'] * 1000:>10.2f}{per_call:>10.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,49 @@
+# This file provides lazy loading, so importing the package does not build every verb type's suffix tables.
+# A LazyRegistry maps keys to "module:attribute" sources and imports a module the first time one of its
+# entries is read; a verb type that is never conjugated never loads its suffix module or lexicon.
+
+from collections.abc import Iterator, MutableMapping
+from importlib import import_module
+from typing import Any
+
+def load_attribute(source: str, package: str) -> Any:
+    module, attribute = source.split(":")
+    return getattr(import_module(module, package), attribute)
+
+class LazyRegistry(MutableMapping):
+    def __init__(self, package: str, sources: dict[str, str]):
+        """
+        package: anchor for relative module names (pass __package__).
+        sources: key -> "module:attribute", e.g. {"vai": ".vai_suffixes_core:get_vai_parts"}.
+        """
+        self.package = package
+        self.sources = dict(sources)
+        self.loaded = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.loaded[key]
+        except KeyError:
+            value = self.loaded[key] = load_attribute(self.sources[key], self.package)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.sources.setdefault(key, None)
+        self.loaded[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.sources[key]
+        self.loaded.pop(key, None)
+
+    # Membership and iteration read the source table only: asking which types exist loads nothing.
+    def __contains__(self, key: object) -> bool:
+        return key in self.sources
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sources)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self.loaded
@@ -0,0 +1,209 @@
+# This file indexes a lemma list for autocomplete: a prefix trie over the verb stems, flattened into arrays.
+#   - nodes are numbered in depth-first order over the sorted lemmas, so the lemmas below a node are one contiguous
+#     range [start, end) of the lemma arrays and the lemmas spelled exactly by the node open that range,
+#   - nodes with a large subtree keep their TOP_K most frequent lemmas precomputed, so a keystroke costs a walk down
+#     the typed prefix plus a slice; small subtrees are ranked on the fly,
+#   - every lemma carries its paradigm entry point (type and ending class), resolved once at build time,
+#   - every node keeps a bit mask of the verb types listed below it, so a walk for one type can stop early (fst.py).
+# Should be pure and testable — no printing or user interaction; reading the list file is the only I/O.
+
+import heapq
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from .enum import EndingClass
+from .models import LemmaEntry
+from .planner import classify_lemma
+
+# --- 1. Constants ---
+VERB_TYPES = ("vai", "vii", "vti")
+# Completions precomputed per node, and the subtree size above which a node keeps them.
+TOP_K = 10
+SMALL_SUBTREE = 64
+
+# --- 2. Lemma lists ---
+def type_mask(verb_types: Iterable[str]) -> int:
+    """The LemmaIndex.type_masks bits of some verb types."""
+    return sum(1 << VERB_TYPES.index(verb_type) for verb_type in set(verb_types))
+
+def read_lemma_list(path: str | Path) -> list[tuple[str, str, int]]:
+    """
+    Reads 'verb<TAB>type' or 'verb<TAB>type<TAB>frequency' lines (frequency 0 when missing);
+    blank lines and lines starting with '#' are skipped.
+    """
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) not in (2, 3) or fields[1] not in VERB_TYPES or (len(fields) == 3 and not fields[2].isdigit()):
+                raise ValueError(f"{path}:{line_number}: expected 'verb<TAB>vai|vii|vti[<TAB>frequency]', got {line!r}")
+            entries.append((fields[0], fields[1], int(fields[2]) if len(fields) == 3 else 0))
+    return entries
+
+# --- 3. Index ---
+class LemmaIndex:
+    def __init__(self, entries: Iterable[tuple[str, str] | tuple[str, str, int]]):
+        """entries: (verb, type) or (verb, type, frequency); a lemma listed twice keeps its highest frequency."""
+        lemmas = {}
+        for verb, verb_type, *frequency in entries:
+            if verb_type not in VERB_TYPES:
+                raise ValueError(f"Unsupported verb type '{verb_type}' for '{verb}'")
+            key = (verb, VERB_TYPES.index(verb_type))
+            lemmas[key] = max(lemmas.get(key, 0), frequency[0] if frequency else 0)
+        ordered = sorted(lemmas)
+
+        # Lemma arrays, in (verb, type) order: verbs are one string cut by offsets.
+        self.text = "".join(verb for verb, _ in ordered)
+        self.text_offsets = array("I", [0])
+        for verb, _ in ordered:
+            self.text_offsets.append(self.text_offsets[-1] + len(verb))
+        self.type_codes = array("B", [type_code for _, type_code in ordered])
+        self.frequencies = array("Q", [lemmas[key] for key in ordered])
+        self.ending_classes = []
+        class_codes = {}
+        codes = []
+        for verb, type_code in ordered:
+            ending_class = classify_lemma(VERB_TYPES[type_code], verb)
+            if ending_class is not None:
+                ending_class = EndingClass(ending_class).value
+            if ending_class not in class_codes:
+                class_codes[ending_class] = len(self.ending_classes)
+                self.ending_classes.append(ending_class)
+            codes.append(class_codes[ending_class])
+        self.class_codes = array("B", codes)
+        self.build_trie([verb for verb, _ in ordered])
+        self.build_type_masks()
+        self.build_top_lists()
+
+    def build_trie(self, verbs: list[str]) -> None:
+        """Nodes in depth-first order; a node's edges are edge_labels/edge_targets[first_edge[n]:first_edge[n + 1]]."""
+        children = [[]]
+        starts, ends, exact = [0], [0], [0]
+        path = [0]
+        previous = ""
+        for i, verb in enumerate(verbs):
+            common = 0
+            for a, b in zip(verb, previous):
+                if a != b:
+                    break
+                common += 1
+            del path[common + 1:]
+            for letter in verb[common:]:
+                node = len(children)
+                children[path[-1]].append((letter, node))
+                children.append([])
+                starts.append(i)
+                ends.append(i)
+                exact.append(0)
+                path.append(node)
+            for node in path:
+                ends[node] = i + 1
+            exact[path[-1]] += 1
+            previous = verb
+        self.node_count = len(children)
+        self.starts = array("I", starts)
+        self.ends = array("I", ends)
+        self.exact = array("H", exact)
+        self.first_edge = array("I", [0])
+        labels, targets = [], []
+        for node_children in children:
+            for letter, child in node_children:
+                labels.append(letter)
+                targets.append(child)
+            self.first_edge.append(len(targets))
+        self.edge_labels = "".join(labels)
+        self.edge_targets = array("I", targets)
+
+    def build_type_masks(self) -> None:
+        """Per node, bit 1 << type code of every verb type listed at or below it."""
+        masks = array("B", bytes(self.node_count))
+        # Children are numbered after their parent, so walking backwards sees every child first.
+        for node in reversed(range(self.node_count)):
+            start = self.starts[node]
+            mask = 0
+            for lemma in range(start, start + self.exact[node]):
+                mask |= 1 << self.type_codes[lemma]
+            for edge in range(self.first_edge[node], self.first_edge[node + 1]):
+                mask |= masks[self.edge_targets[edge]]
+            masks[node] = mask
+        self.type_masks = masks
+
+    def rank(self, lemma: int) -> tuple[int, int]:
+        # Most frequent first, then (verb, type) order.
+        return -self.frequencies[lemma], lemma
+
+    def build_top_lists(self) -> None:
+        """TOP_K best lemmas of every node with more than SMALL_SUBTREE lemmas, merged up from its children's lists."""
+        tops = {}
+        # Children are numbered after their parent, so walking backwards sees every child first.
+        for node in reversed(range(self.node_count)):
+            start, end = self.starts[node], self.ends[node]
+            if end - start <= SMALL_SUBTREE:
+                continue
+            candidates = list(range(start, start + self.exact[node]))
+            for edge in range(self.first_edge[node], self.first_edge[node + 1]):
+                child = self.edge_targets[edge]
+                candidates.extend(tops.get(child) or range(self.starts[child], self.ends[child]))
+            tops[node] = heapq.nsmallest(TOP_K, candidates, key=self.rank)
+        self.top_offsets = array("I", [0])
+        top_lemmas = []
+        for node in range(self.node_count):
+            top_lemmas.extend(tops.get(node, ()))
+            self.top_offsets.append(len(top_lemmas))
+        self.top_lemmas = array("I", top_lemmas)
+
+    # --- Lookups ---
+    def find_node(self, prefix: str) -> int | None:
+        node = 0
+        labels, targets, first_edge = self.edge_labels, self.edge_targets, self.first_edge
+        for letter in prefix:
+            edge = labels.find(letter, first_edge[node], first_edge[node + 1])
+            if edge < 0:
+                return None
+            node = targets[edge]
+        return node
+
+    def child(self, node: int, letter: str) -> int | None:
+        """The node one letter below node, or None; for walks that choose their letters one at a time."""
+        edge = self.edge_labels.find(letter, self.first_edge[node], self.first_edge[node + 1])
+        return None if edge < 0 else self.edge_targets[edge]
+
+    def verb(self, lemma: int) -> str:
+        return self.text[self.text_offsets[lemma]:self.text_offsets[lemma + 1]]
+
+    def entry(self, lemma: int) -> LemmaEntry:
+        return LemmaEntry(self.verb(lemma), VERB_TYPES[self.type_codes[lemma]], self.ending_classes[self.class_codes[lemma]],
+                          self.frequencies[lemma])
+
+    def complete(self, prefix: str, k: int = TOP_K) -> list[LemmaEntry]:
+        """The k most frequent lemmas starting with prefix (ties in alphabetical order)."""
+        node = self.find_node(prefix)
+        if node is None or k <= 0:
+            return []
+        top_start, top_end = self.top_offsets[node], self.top_offsets[node + 1]
+        if top_start < top_end and k <= TOP_K:
+            lemmas = self.top_lemmas[top_start:min(top_end, top_start + k)]
+        else:
+            lemmas = heapq.nsmallest(k, range(self.starts[node], self.ends[node]), key=self.rank)
+        return [self.entry(lemma) for lemma in lemmas]
+
+    def lookup(self, verb: str) -> list[LemmaEntry]:
+        """Paradigm entry points of a whole stem, one per verb type it is listed under; [] when it is not listed."""
+        node = self.find_node(verb)
+        if node is None:
+            return []
+        start = self.starts[node]
+        return [self.entry(lemma) for lemma in range(start, start + self.exact[node])]
+
+    def __contains__(self, verb: str) -> bool:
+        node = self.find_node(verb)
+        return node is not None and self.exact[node] > 0
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+def load_lemma_index(path: str | Path) -> LemmaIndex:
+    return LemmaIndex(read_lemma_list(path))
@@ -0,0 +1,76 @@
+# This file holds the lexicon of verb stems that carry irregularity flags (e.g. VII dummy-n).
+# Stems are loaded from a data file and hash-indexed, so membership checks stay O(1) however large the lexicon grows.
+# A single lookup returns every flag of a stem, so new irregularities do not add more searches to the hot path.
+
+from pathlib import Path
+from .enum import LexicalFlag, WordEndingVII
+
+DEFAULT_LEXICON_PATH = Path(__file__).parent / "data" / "lexicon.tsv"
+
+class Lexicon:
+    def __init__(self, entries: dict[str, frozenset[str]] | None = None):
+        self.entries = dict(entries or {})
+        by_flag = {}
+        for stem, flags in self.entries.items():
+            for flag in flags:
+                by_flag.setdefault(flag, set()).add(stem)
+        self.by_flag = {flag: frozenset(stems) for flag, stems in by_flag.items()}
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Lexicon":
+        return cls(read_lexicon_file(path))
+
+    def merge(self, other: "Lexicon") -> "Lexicon":
+        """Returns a new lexicon; flags of stems present in both are combined."""
+        entries = dict(self.entries)
+        for stem, flags in other.entries.items():
+            entries[stem] = entries.get(stem, frozenset()) | flags
+        return Lexicon(entries)
+
+    def flags(self, verb: str) -> frozenset[str]:
+        return self.entries.get(verb, frozenset())
+
+    def has_flag(self, verb: str, flag: str) -> bool:
+        return verb in self.by_flag.get(flag, ())
+
+    def stems(self, flag: str) -> frozenset[str]:
+        return self.by_flag.get(flag, frozenset())
+
+    def __contains__(self, verb: str) -> bool:
+        return verb in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+def parse_flags(field: str) -> frozenset[str]:
+    return frozenset(flag.strip() for flag in field.split(",") if flag.strip())
+
+def validate_entry(stem: str, flags: frozenset[str]) -> None:
+    if LexicalFlag.DUMMY_N in flags and not stem.endswith(WordEndingVII.N):
+        raise ValueError(f"Dummy-n stem '{stem}' must end in '{WordEndingVII.N.value}'")
+
+def read_lexicon_file(path: str | Path) -> dict[str, frozenset[str]]:
+    """
+    Reads a lexicon file: one stem per line, stem<TAB>flag[,flag...].
+    Blank lines and lines starting with '#' are ignored.
+    """
+    entries = {}
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            stem, _, field = line.partition("\t")
+            stem = stem.strip()
+            flags = parse_flags(field)
+            if not stem or not flags:
+                raise ValueError(f"{path}:{line_number}: expected 'stem<TAB>flags', got '{line}'")
+            try:
+                validate_entry(stem, flags)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from None
+            entries[stem] = entries.get(stem, frozenset()) | flags
+    return entries
+
+def load_lexicon(path: str | Path = DEFAULT_LEXICON_PATH) -> Lexicon:
+    return Lexicon.from_file(path)
@@ -3,7 +3,28 @@
 # Makes input passing cleaner, consistent, and self-documenting.
 # May later grow to include validation or more model types.
 
+import sys
 from dataclasses import dataclass
+from typing import NamedTuple
+from .utils import render_segments
+
+# Small-int codes for CompactInput: a feature's code is its index in these tuples.
+# Optional features keep None at code 0, so an unset field costs nothing to encode.
+TYPE_CODES = ("vai", "vii", "vti")
+FORM_CODES = ("independent", "dependent", "imperative")
+TENSE_CODES = (None, "past", "present", "definitive", "desiderative", "conditional")
+PRONOUN_CODES = (None, "1s", "2s", "3s", "1p", "21", "2p", "3p", "0s", "0p", "0's", "0'p")
+OBJECT_CODES = (None, "singular", "plural")
+
+def code_table(values: tuple) -> dict:
+    # The str-mixin enums hash and compare like their values, so Form.IMPERATIVE finds the "imperative" code too.
+    return {value: code for code, value in enumerate(values)}
+
+TYPE_CODE = code_table(TYPE_CODES)
+FORM_CODE = code_table(FORM_CODES)
+TENSE_CODE = code_table(TENSE_CODES)
+PRONOUN_CODE = code_table(PRONOUN_CODES)
+OBJECT_CODE = code_table(OBJECT_CODES)
 
 @dataclass
 class ConjugationInput:
@@ -17,4 +38,146 @@ class ConjugationInput:
     negation: bool = False
     plural: bool = False
     suffix: str = None
-    tense: str = None
\ No newline at end of file
+    tense: str = None
+
+    def cache_key(self) -> tuple:
+        """Hashable key of every field, for memoizing conjugation results."""
+        return (self.type, self.form, self.verb, self.pronoun, self.direct_object, self.negation, self.plural, self.suffix, self.tense)
+
+    def compact(self) -> "CompactInput":
+        return CompactInput.encode(self.type, self.form, self.verb, self.negation, self.tense, self.pronoun, self.direct_object)
+
+class CompactInput(NamedTuple):
+    """
+    An immutable, hashable conjugation input for streaming jobs: a tuple of small-int feature codes plus the
+    interned verb, about a quarter of the memory of a ConjugationInput. It is its own cache key.
+    Carries no plural/suffix fields: no conjugation stage reads them.
+    """
+    type: int
+    form: int
+    verb: str
+    negation: bool = False
+    tense: int = 0
+    pronoun: int = 0
+    direct_object: int = 0
+
+    @classmethod
+    def encode(cls, type: str, form: str, verb: str, negation: bool = False, tense: str | None = None,
+               pronoun: str | None = None, direct_object: str | None = None) -> "CompactInput":
+        """Builds a CompactInput from string or Enum feature values; raises ValueError for an unknown value."""
+        try:
+            return cls(TYPE_CODE[type], FORM_CODE[form], sys.intern(verb), bool(negation), TENSE_CODE[tense],
+                       PRONOUN_CODE[pronoun], OBJECT_CODE[direct_object])
+        except KeyError as e:
+            raise ValueError(f"Unknown feature value {e.args[0]!r} for verb '{verb}'") from None
+
+    def decode(self) -> ConjugationInput:
+        """The equivalent ConjugationInput, for the stage functions that read string features."""
+        return ConjugationInput(type=TYPE_CODES[self.type], form=FORM_CODES[self.form], verb=self.verb,
+                                pronoun=PRONOUN_CODES[self.pronoun], direct_object=OBJECT_CODES[self.direct_object],
+                                negation=self.negation, tense=TENSE_CODES[self.tense])
+
+    def cache_key(self) -> tuple:
+        return self
+
+def full_input(input_data: ConjugationInput | CompactInput) -> ConjugationInput:
+    """
+    input_data itself, or the ConjugationInput a CompactInput decodes to. Memoized functions call it inside their
+    body, so a CompactInput is the cache key as it is and is decoded only on a miss.
+    """
+    return input_data.decode() if type(input_data) is CompactInput else input_data
+
+@dataclass
+class ParadigmCell:
+    # One inflected cell of a verb's paradigm.
+    form: str
+    negation: bool
+    tense: str
+    pronoun: str
+    direct_object: str | None
+    # A single surface form, or a list of dialect variants (e.g. 1s "ind-", "nid-", "nind-").
+    result: str | list[str]
+
+@dataclass(frozen=True)
+class Analysis:
+    # One reading of a surface form: the lemma and the feature bundle that generate it.
+    verb: str
+    type: str
+    form: str
+    negation: bool
+    tense: str
+    pronoun: str
+    direct_object: str | None = None
+
+@dataclass(frozen=True)
+class LemmaEntry:
+    # A lemma as the autocomplete index returns it: where its paradigm starts (type, ending class) and how common it is.
+    verb: str
+    type: str
+    ending_class: str | None
+    frequency: int = 0
+
+@dataclass
+class ConjugationError:
+    # Returned in place of a result by conjugate_many when one item fails, so a batch never stops half-way.
+    input: ConjugationInput
+    error: Exception
+
+    @property
+    def message(self) -> str:
+        return f"{type(self.error).__name__}: {self.error}"
+
+class ConjugatedForm:
+    """
+    A conjugated word kept as separate segments plus its feature bundle:
+      prefixes (pronoun prefix dialect variants, "" when none), preverb (tense), stem, suffix
+    Styling happens only in render(), so the generation path never builds escape codes.
+    """
+    __slots__ = ("verb", "type", "form", "negation", "tense", "pronoun", "direct_object",
+                 "prefixes", "preverb", "stem", "suffix")
+
+    def __init__(self, verb: str, type: str, form: str, negation: bool, tense: str | None, pronoun: str | None,
+                 direct_object: str | None, prefixes: tuple[str, ...], preverb: str, stem: str, suffix: str):
+        self.verb = verb
+        self.type = type
+        self.form = form
+        self.negation = negation
+        self.tense = tense
+        self.pronoun = pronoun
+        self.direct_object = direct_object
+        self.prefixes = prefixes
+        self.preverb = preverb
+        self.stem = stem
+        self.suffix = suffix
+
+    @property
+    def prefix(self) -> str:
+        return self.prefixes[0]
+
+    @property
+    def features(self) -> tuple[str, ...]:
+        tags = (self.type, self.form, "negative" if self.negation else "positive", self.tense, self.pronoun, self.direct_object)
+        return tuple(tag for tag in tags if tag is not None)
+
+    def segments(self) -> dict[str, str]:
+        return {"prefix": self.prefix, "preverb": self.preverb, "stem": self.stem, "suffix": self.suffix}
+
+    def render(self, style: str = "plain") -> str:
+        """Renders the first prefix variant: style is 'plain', 'ansi' or 'html'."""
+        return render_segments(self.prefix, self.preverb, self.stem, self.suffix, self.form, self.negation, style)
+
+    def render_all(self, style: str = "plain") -> list[str]:
+        """Renders one surface form per prefix variant."""
+        return [render_segments(prefix, self.preverb, self.stem, self.suffix, self.form, self.negation, style)
+                for prefix in self.prefixes]
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"ConjugatedForm({self.render()!r}, features={self.features!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConjugatedForm):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
@@ -0,0 +1,197 @@
+# This file generates the full paradigm of a verb in one call: every form × negation × tense × pronoun (× object) cell.
+# Shares the work that does not change between cells instead of re-running the whole pipeline per cell:
+#   - the suffix depends only on form, negation, pronoun (and object), so it is computed once for all five tenses,
+#   - the tense preverb and consonant shift only touch the start of the word, so all five tenses are computed
+#     in one get_all_tense_parts call per pronoun and word start,
+#   - the pronoun prefix depends only on the verb initial, so it is styled once per initial.
+# Should be pure and testable — no printing, user interaction, or I/O.
+
+from .enum import Form, Pronoun, Tense
+from .models import ConjugationInput, ConjugatedForm, ParadigmCell
+from .pipeline import NO_PREFIX, SUFFIX_PARTS, get_prefixes
+from .pronoun_prefix_core import get_initial_letter, get_pronoun_prefixes, takes_pronoun_prefix
+from .tense_prefix_core import get_all_tense_parts
+from .lazy import LazyRegistry
+from .utils import styled_text
+
+# --- 1. Constants ---
+FORMS = {
+    "vai": (Form.INDEPENDENT_CLAUSE.value, Form.DEPENDENT_CLAUSE.value, Form.IMPERATIVE.value),
+    "vii": (Form.INDEPENDENT_CLAUSE.value, Form.DEPENDENT_CLAUSE.value),
+    "vti": (Form.INDEPENDENT_CLAUSE.value, Form.DEPENDENT_CLAUSE.value, Form.IMPERATIVE.value)
+}
+
+NEGATIONS = (False, True)
+
+TENSES = (
+    Tense.PAST.value,
+    Tense.PRESENT.value,
+    Tense.FUTURE_DEFINITIVE.value,
+    Tense.FUTURE_DESIDERATIVE.value,
+    Tense.CONDITIONAL.value
+)
+
+ANIMATE_PRONOUNS = (
+    Pronoun.FIRST_SINGULAR_ANIMATE.value,
+    Pronoun.SECOND_SINGULAR_ANIMATE.value,
+    Pronoun.THIRD_SINGULAR_ANIMATE.value,
+    Pronoun.FIRST_PLURAL_EXC_ANIMATE.value,
+    Pronoun.FIRST_PLURAL_INC_ANIMATE.value,
+    Pronoun.SECOND_PLURAL_ANIMATE.value,
+    Pronoun.THIRD_PLURAL_ANIMATE.value
+)
+
+PRONOUNS = {
+    "vai": ANIMATE_PRONOUNS,
+    "vii": (Pronoun.THIRD_SINGULAR_INANIMATE.value, Pronoun.THIRD_PLURAL_INANIMATE.value),
+    "vti": ANIMATE_PRONOUNS
+}
+
+IMPERATIVE_PRONOUNS = (
+    Pronoun.SECOND_SINGULAR_ANIMATE.value,
+    Pronoun.FIRST_PLURAL_INC_ANIMATE.value,
+    Pronoun.SECOND_PLURAL_ANIMATE.value
+)
+
+DIRECT_OBJECTS = {
+    "vai": (None,),
+    "vii": (None,),
+    "vti": ("singular", "plural")
+}
+
+SUFFIX_FUNCTIONS = LazyRegistry(__package__, {
+    "vai": ".vai_suffixes_core:get_vai_suffix",
+    "vii": ".vii_suffixes_core:get_vii_suffix",
+    "vti": ".vti_suffixes_core:get_vti_suffix"
+})
+
+PRESENT = Tense.PRESENT.value
+
+# Consonant shift never looks past the first two letters (see CONSONANT_SHIFT_MAP).
+TENSE_HEAD_LENGTH = 2
+
+# --- 2. Helpers ---
+def get_pronouns(verb_type: str, form: str) -> tuple[str, ...]:
+    if form == Form.IMPERATIVE:
+        return IMPERATIVE_PRONOUNS
+    return PRONOUNS[verb_type]
+
+def attach_prefix(prefix: str | list[str], verb: str) -> str | list[str]:
+    if isinstance(prefix, list):
+        return [p + verb for p in prefix]
+    return prefix + verb
+
+# --- 3. Main Logic Functions ---
+def conjugate_paradigm(verb: str, verb_type: str) -> list[ParadigmCell]:
+    """
+    Returns every cell of the paradigm of a verb, in the same order as the *-main.py scripts:
+      form -> negation -> tense -> pronoun (-> direct object)
+    Each result is identical to running suffix -> tense prefix -> pronoun prefix for that cell.
+    """
+
+    if verb_type not in SUFFIX_FUNCTIONS:
+        raise ValueError(f"Unsupported verb type '{verb_type}'")
+
+    get_suffix = SUFFIX_FUNCTIONS[verb_type]
+    tense_heads = {}
+    pronoun_prefixes = {}
+    cells = []
+
+    for form in FORMS[verb_type]:
+        pronouns = get_pronouns(verb_type, form)
+        with_prefix = takes_pronoun_prefix(verb_type, form)
+        for neg in NEGATIONS:
+            # Suffixes do not depend on tense: compute each one once and reuse it for all five tenses.
+            suffixed = {}
+            for pronoun in pronouns:
+                for obj in DIRECT_OBJECTS[verb_type]:
+                    input_data = ConjugationInput(
+                        type=verb_type,
+                        form=form,
+                        verb=verb,
+                        pronoun=pronoun,
+                        negation=neg,
+                        direct_object=obj
+                    )
+                    suffixed[pronoun, obj] = get_suffix(input_data)
+
+            for tense in TENSES:
+                present = tense == PRESENT
+                for (pronoun, obj), word in suffixed.items():
+                    if present:
+                        initial = get_initial_letter(word) if with_prefix else None
+                    else:
+                        head_key = (pronoun, word[:TENSE_HEAD_LENGTH])
+                        heads = tense_heads.get(head_key)
+                        if heads is None:
+                            heads = tense_heads[head_key] = {
+                                fan_tense: (styled_text(preverb, "gray_normal") + shifted_head, initial)
+                                for fan_tense, (preverb, shifted_head, initial) in get_all_tense_parts(word[:TENSE_HEAD_LENGTH], pronoun).items()
+                            }
+                        head, initial = heads[tense]
+                        word = head + word[TENSE_HEAD_LENGTH:]
+
+                    if with_prefix:
+                        prefix_key = (neg, pronoun, initial)
+                        prefix = pronoun_prefixes.get(prefix_key)
+                        if prefix is None:
+                            prefix = get_pronoun_prefixes(verb_type, form, neg, pronoun, prefix_key[2])
+                            if prefix is None:
+                                raise ValueError(f"No valid prefix found for pronoun '{pronoun}' and verb '{word}'")
+                            pronoun_prefixes[prefix_key] = prefix
+                        word = attach_prefix(prefix, word)
+
+                    cells.append(ParadigmCell(form, neg, tense, pronoun, obj, word))
+
+    return cells
+
+def conjugate_paradigm_forms(verb: str, verb_type: str) -> list[ConjugatedForm]:
+    """
+    Same cells and order as conjugate_paradigm, returned as unstyled ConjugatedForm segments.
+    Nothing is styled on this path; render each form only when output is needed.
+    """
+
+    if verb_type not in SUFFIX_PARTS:
+        raise ValueError(f"Unsupported verb type '{verb_type}'")
+
+    get_parts = SUFFIX_PARTS[verb_type]
+    tense_heads = {}
+    prefix_variants = {}
+    forms = []
+
+    for form in FORMS[verb_type]:
+        pronouns = get_pronouns(verb_type, form)
+        with_prefix = takes_pronoun_prefix(verb_type, form)
+        for neg in NEGATIONS:
+            parts = {}
+            for pronoun in pronouns:
+                for obj in DIRECT_OBJECTS[verb_type]:
+                    input_data = ConjugationInput(
+                        type=verb_type,
+                        form=form,
+                        verb=verb,
+                        pronoun=pronoun,
+                        negation=neg,
+                        direct_object=obj
+                    )
+                    parts[pronoun, obj] = get_parts(input_data)
+
+            for tense in TENSES:
+                for (pronoun, obj), (stem, suffix) in parts.items():
+                    head_key = (pronoun, stem[:TENSE_HEAD_LENGTH])
+                    heads = tense_heads.get(head_key)
+                    if heads is None:
+                        heads = tense_heads[head_key] = get_all_tense_parts(stem[:TENSE_HEAD_LENGTH], pronoun)
+                    preverb, shifted_head, initial = heads[tense]
+                    tensed_stem = shifted_head + stem[TENSE_HEAD_LENGTH:]
+
+                    prefixes = NO_PREFIX
+                    if with_prefix:
+                        prefix_key = (pronoun, initial)
+                        prefixes = prefix_variants.get(prefix_key)
+                        if prefixes is None:
+                            prefixes = prefix_variants[prefix_key] = get_prefixes(verb_type, form, pronoun, initial)
+
+                    forms.append(ConjugatedForm(verb, verb_type, form, neg, tense, pronoun, obj, prefixes, preverb, tensed_stem, suffix))
+
+    return forms
@@ -0,0 +1,126 @@
+# This file runs the full conjugation pipeline (suffix -> tense preverb -> pronoun prefix) on plain segments.
+# Returns a ConjugatedForm instead of a styled string, so no escape codes are built or re-parsed on the way;
+# call ConjugatedForm.render("plain" | "ansi" | "html") when output is needed.
+# Should be pure and testable — no printing, user interaction, or I/O.
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from .models import CompactInput, ConjugationError, ConjugationInput, ConjugatedForm
+from .pronoun_prefix_core import get_prefix_variants, takes_pronoun_prefix
+from .tense_prefix_core import get_tense_parts
+from .lazy import LazyRegistry
+
+# Each suffix module (and the VII lexicon) is imported on the first conjugation of its verb type.
+SUFFIX_PARTS = LazyRegistry(__package__, {
+    "vai": ".vai_suffixes_core:get_vai_parts",
+    "vii": ".vii_suffixes_core:get_vii_parts",
+    "vti": ".vti_suffixes_core:get_vti_parts"
+})
+
+NO_PREFIX = ("",)
+
+def get_suffix_parts(input_data: ConjugationInput) -> tuple[str, str]:
+    if input_data.type not in SUFFIX_PARTS:
+        raise ValueError(f"Unsupported verb type '{input_data.type}'")
+    return SUFFIX_PARTS[input_data.type](input_data)
+
+def get_prefixes(verb_type: str, form: str, pronoun: str, initial: str) -> tuple[str, ...]:
+    """Pronoun stage: takes the initial reported by the tense stage, never re-reads the word."""
+    if not takes_pronoun_prefix(verb_type, form):
+        return NO_PREFIX
+    prefixes = get_prefix_variants(verb_type, pronoun, initial)
+    if prefixes is None:
+        raise ValueError(f"No valid prefix found for pronoun '{pronoun}' and initial '{initial}'")
+    return prefixes
+
+def build_form(input_data: ConjugationInput, prefixes: tuple[str, ...], preverb: str, stem: str, suffix: str) -> ConjugatedForm:
+    return ConjugatedForm(
+        verb=input_data.verb,
+        type=input_data.type,
+        form=input_data.form,
+        negation=input_data.negation,
+        tense=input_data.tense,
+        pronoun=input_data.pronoun,
+        direct_object=input_data.direct_object,
+        prefixes=prefixes,
+        preverb=preverb,
+        stem=stem,
+        suffix=suffix
+    )
+
+def conjugate(input_data: ConjugationInput | CompactInput) -> ConjugatedForm:
+    if type(input_data) is CompactInput:
+        input_data = input_data.decode()
+    stem, suffix = get_suffix_parts(input_data)
+    preverb, stem, initial = get_tense_parts(stem, input_data.pronoun, input_data.tense)
+    prefixes = get_prefixes(input_data.type, input_data.form, input_data.pronoun, initial)
+    return build_form(input_data, prefixes, preverb, stem, suffix)
+
+class BatchConjugator:
+    """
+    Runs conjugate() over one chunk of inputs, sharing each stage's result between the items that need it:
+      - suffix parts by every field but the tense (the suffix stage never reads it); a CompactInput keys on its own codes,
+      - tense parts by (stem, pronoun, tense),
+      - prefix variants by (type, form, pronoun, initial).
+    Dropped after its chunk, so memory stays bounded by the chunk size.
+    CompactInput items are decoded one at a time, so a stream of them never holds more than a chunk of full inputs.
+    """
+
+    def __init__(self):
+        self.suffix_parts = {}
+        self.tense_parts = {}
+        self.prefixes = {}
+
+    def conjugate(self, input_data: ConjugationInput | CompactInput) -> ConjugatedForm:
+        if type(input_data) is CompactInput:
+            # The tuple is already a key; only the tense code is cleared, as the suffix stage never reads it.
+            suffix_key = input_data._replace(tense=0)
+            input_data = input_data.decode()
+        else:
+            suffix_key = (input_data.type, input_data.form, input_data.verb, input_data.pronoun,
+                          input_data.direct_object, input_data.negation, input_data.plural, input_data.suffix)
+        parts = self.suffix_parts.get(suffix_key)
+        if parts is None:
+            parts = self.suffix_parts[suffix_key] = get_suffix_parts(input_data)
+        return self.finish(input_data, *parts)
+
+    def finish(self, input_data: ConjugationInput, stem: str, suffix: str) -> ConjugatedForm:
+        """Tense and pronoun stages for an item whose suffix stage already ran."""
+        tense_key = (stem, input_data.pronoun, input_data.tense)
+        tensed = self.tense_parts.get(tense_key)
+        if tensed is None:
+            tensed = self.tense_parts[tense_key] = get_tense_parts(stem, input_data.pronoun, input_data.tense)
+        preverb, stem, initial = tensed
+
+        prefix_key = (input_data.type, input_data.form, input_data.pronoun, initial)
+        prefixes = self.prefixes.get(prefix_key)
+        if prefixes is None:
+            prefixes = self.prefixes[prefix_key] = get_prefixes(input_data.type, input_data.form, input_data.pronoun, initial)
+
+        return build_form(input_data, prefixes, preverb, stem, suffix)
+
+def conjugate_or_error(conjugate_one, input_data: ConjugationInput | CompactInput) -> ConjugatedForm | ConjugationError:
+    try:
+        return conjugate_one(input_data)
+    except Exception as e:
+        return ConjugationError(input_data, e)
+
+def conjugate_many(inputs: Iterable[ConjugationInput | CompactInput], chunk_size: int | None = None) -> Iterator[ConjugatedForm | ConjugationError]:
+    """
+    Lazily conjugates an iterable of inputs, yielding one result per input in input order.
+    A failing item yields a ConjugationError instead of raising, so the rest of the stream keeps going.
+    chunk_size: when set, items are read that many at a time and share stage results within the chunk
+    (see BatchConjugator); when None, each item runs through conjugate() on its own.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+    if chunk_size is None:
+        return (conjugate_or_error(conjugate, input_data) for input_data in inputs)
+    return iter_chunks(inputs, chunk_size)
+
+def iter_chunks(inputs: Iterable[ConjugationInput | CompactInput], chunk_size: int) -> Iterator[ConjugatedForm | ConjugationError]:
+    iterator = iter(inputs)
+    while chunk := list(islice(iterator, chunk_size)):
+        batch = BatchConjugator()
+        for input_data in chunk:
+            yield conjugate_or_error(batch.conjugate, input_data)
@@ -0,0 +1,91 @@
+# This file plans bulk jobs around ending classes: in a large batch thousands of verbs share an ending class,
+# so the winning rule and suffix of a (type, form, negation, object, ending class, pronoun) cell are the same for all of them.
+# Inputs are grouped by that key, each group's rule and suffix are resolved once (plan_entry in the suffix modules),
+# and only the per-stem edit runs per input. Results come back in input order.
+# Groups the compiled tables cannot answer (unknown verb types, pronouns outside the table, cells where no rule
+# matches) run get_suffix_parts item by item, so results and errors are exactly those of the per-item pipeline.
+
+from collections.abc import Iterable
+from .lazy import LazyRegistry
+from .models import CompactInput, ConjugationError, ConjugationInput, ConjugatedForm
+from .pipeline import BatchConjugator, get_suffix_parts
+
+CLASSIFIERS = LazyRegistry(__package__, {
+    "vai": ".vai_suffixes_core:classify_ending",
+    "vii": ".vii_suffixes_core:classify_ending",
+    "vti": ".vti_suffixes_core:classify_ending"
+})
+
+PLANS = LazyRegistry(__package__, {
+    "vai": ".vai_suffixes_core:plan_entry",
+    "vii": ".vii_suffixes_core:plan_entry",
+    "vti": ".vti_suffixes_core:plan_entry"
+})
+
+def classify_lemma(verb_type: str, verb: str) -> str | None:
+    try:
+        return CLASSIFIERS[verb_type](verb)
+    except Exception:
+        # Left to get_suffix_parts, which raises the per-item error.
+        return None
+
+def group_inputs(inputs: list[ConjugationInput]) -> dict[tuple | None, list[int]]:
+    """Input positions by (type, form, negation, object, ending class, pronoun); None groups the unplannable ones."""
+    groups = {}
+    # Every cell of a paradigm shares its lemma's ending class: classify each lemma once per batch.
+    classes = {}
+    for i, input_data in enumerate(inputs):
+        lemma = (input_data.type, input_data.verb)
+        try:
+            ending_class = classes[lemma]
+        except KeyError:
+            ending_class = classes[lemma] = classify_lemma(*lemma)
+        if ending_class is None:
+            key = None
+        else:
+            key = (lemma[0], input_data.form, bool(input_data.negation), input_data.direct_object, ending_class, input_data.pronoun)
+        groups.setdefault(key, []).append(i)
+    return groups
+
+def plan_suffix_parts(inputs: list[ConjugationInput]) -> list[tuple[str, str] | Exception]:
+    """(stem, suffix) of every input in input order, or the exception the suffix stage raised for it."""
+    results = [None] * len(inputs)
+    for key, positions in group_inputs(inputs).items():
+        entry = None if key is None else PLANS[key[0]](*key[1:])
+        if entry is None:
+            for i in positions:
+                try:
+                    results[i] = get_suffix_parts(inputs[i])
+                except Exception as e:
+                    results[i] = e
+            continue
+        edit, suffix = entry
+        # A group holds each of its verbs once per tense: edit each verb once and share the (stem, suffix) pair.
+        parts = {}
+        for i in positions:
+            verb = inputs[i].verb
+            try:
+                results[i] = parts[verb]
+            except KeyError:
+                results[i] = parts[verb] = (verb if edit is None else edit(verb)), suffix
+    return results
+
+def conjugate_planned(inputs: Iterable[ConjugationInput | CompactInput]) -> list[ConjugatedForm | ConjugationError]:
+    """
+    conjugate_many for a whole batch at once: the suffix stage runs once per ending-class group, the tense and
+    pronoun stages share results through a BatchConjugator. A failing item gives a ConjugationError, in place.
+    The batch is held in memory; split very large jobs into batches of a few hundred thousand inputs.
+    """
+    originals = list(inputs)
+    decoded = [input_data.decode() if type(input_data) is CompactInput else input_data for input_data in originals]
+    batch = BatchConjugator()
+    results = []
+    for original, input_data, parts in zip(originals, decoded, plan_suffix_parts(decoded)):
+        if type(parts) is not tuple:
+            results.append(ConjugationError(original, parts))
+            continue
+        try:
+            results.append(batch.finish(input_data, *parts))
+        except Exception as e:
+            results.append(ConjugationError(original, e))
+    return results
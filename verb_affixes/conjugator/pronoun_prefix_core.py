@@ -1,174 +1,184 @@
-from conjugator.utils import styled_text
-from .enum import Form, Pronoun, WordEndingVowel
+from dataclasses import dataclass
+from conjugator.utils import styled_text, strip_styles
+from .enum import Form, Pronoun
+from .tense_prefix_core import get_initial
+from .cache import clear_cache, memoize
 
-PRONOUN_POSSESSIVE_PREFIX_MAP = {
-    Pronoun.FIRST_SINGULAR_ANIMATE: {
-        "b": ["im", "ni", "nim"],
-        "d": ["in", "ni", "nin"],
-        "g": ["in", "ni", "nin"],
-        "j": ["in", "ni", "nin"],
-        "z": ["in", "ni", "nin"],
-        "m": "ni",
-        "n": "ni",
-        "w": "ni",
-        "a": ["ind", "nid", "nind"],
-        "i": ["ind", "nid", "nind"],
-        "o": ["indo", "nido", "nindo"],
-        "aa": ["ind", "nid", "nind"],
-        "ii": ["ind", "nid", "nind"],
-        "oo": ["ind", "nid", "nind"],
-        "e": ["ind", "nid", "nind"]
-    },
-    Pronoun.FIRST_PLURAL_EXC_ANIMATE: {
-        "b": ["im", "ni", "nim"],
-        "d": ["in", "ni", "nin"],
-        "g": ["in", "ni", "nin"],
-        "j": ["in", "ni", "nin"],
-        "z": ["in", "ni", "nin"],
-        "m": "ni",
-        "n": "ni",
-        "w": "ni",
-        "a": ["ind", "nid", "nind"],
-        "i": ["ind", "nid", "nind"],
-        "o": ["indo", "nido", "nindo"],
-        "aa": ["ind", "nid", "nind"],
-        "ii": ["ind", "nid", "nind"],
-        "oo": ["ind", "nid", "nind"],
-        "e": ["ind", "nid", "nind"]
-    },
-    Pronoun.SECOND_SINGULAR_ANIMATE: {
-        "b": "gi",
-        "d": "gi",
-        "g": "gi",
-        "j": "gi",
-        "z": "gi",
-        "m": "gi",
-        "n": "gi",
-        "w": "gi",
-        "a": "gid",
-        "i": "gid",
-        "o": "gido",
-        "aa": "gid",
-        "ii": "gid",
-        "oo": "gid",
-        "e": "gid",
-    },
-    Pronoun.FIRST_PLURAL_INC_ANIMATE: {
-        "b": "gi",
-        "d": "gi",
-        "g": "gi",
-        "j": "gi",
-        "z": "gi",
-        "m": "gi",
-        "n": "gi",
-        "w": "gi",
-        "a": "gid",
-        "i": "gid",
-        "o": "gido",
-        "aa": "gid",
-        "ii": "gid",
-        "oo": "gid",
-        "e": "gid",
+# Every pronoun of a person shares one table (1s == 1p, 2s == 21 == 2p, 3s == 3p).
+# First-person variants are always listed in DIALECTS order.
+PERSON_PREFIX_MAP = {
+    "first": {
+        "b": ("im", "ni", "nim"),
+        "d": ("in", "ni", "nin"),
+        "g": ("in", "ni", "nin"),
+        "j": ("in", "ni", "nin"),
+        "z": ("in", "ni", "nin"),
+        "m": ("ni",),
+        "n": ("ni",),
+        "w": ("ni",),
+        "a": ("ind", "nid", "nind"),
+        "i": ("ind", "nid", "nind"),
+        "o": ("indo", "nido", "nindo"),
+        "aa": ("ind", "nid", "nind"),
+        "ii": ("ind", "nid", "nind"),
+        "oo": ("ind", "nid", "nind"),
+        "e": ("ind", "nid", "nind")
     },
-    Pronoun.SECOND_PLURAL_ANIMATE: {
-        "b": "gi",
-        "d": "gi",
-        "g": "gi",
-        "j": "gi",
-        "z": "gi",
-        "m": "gi",
-        "n": "gi",
-        "w": "gi",
-        "a": "gid",
-        "i": "gid",
-        "o": "gido",
-        "aa": "gid",
-        "ii": "gid",
-        "oo": "gid",
-        "e": "gid",
+    "second": {
+        "b": ("gi",),
+        "d": ("gi",),
+        "g": ("gi",),
+        "j": ("gi",),
+        "z": ("gi",),
+        "m": ("gi",),
+        "n": ("gi",),
+        "w": ("gi",),
+        "a": ("gid",),
+        "i": ("gid",),
+        "o": ("gido",),
+        "aa": ("gid",),
+        "ii": ("gid",),
+        "oo": ("gid",),
+        "e": ("gid",)
     },
-    Pronoun.THIRD_SINGULAR_ANIMATE: {
-        "b": "o",
-        "d": "o",
-        "g": "o",
-        "j": "o",
-        "z": "o",
-        "m": "o",
-        "n": "o",
-        "w": "o",
-        "a": "od",
-        "i": "od",
-        "o": "odo",
-        "aa": "od",
-        "ii": "od",
-        "oo": "od",
-        "e": "od",
-    },
-    Pronoun.THIRD_PLURAL_ANIMATE: {
-        "b": "o",
-        "d": "o",
-        "g": "o",
-        "j": "o",
-        "z": "o",
-        "m": "o",
-        "n": "o",
-        "w": "o",
-        "a": "od",
-        "i": "od",
-        "o": "odo",
-        "aa": "od",
-        "ii": "od",
-        "oo": "od",
-        "e": "od",
+    "third": {
+        "b": ("o",),
+        "d": ("o",),
+        "g": ("o",),
+        "j": ("o",),
+        "z": ("o",),
+        "m": ("o",),
+        "n": ("o",),
+        "w": ("o",),
+        "a": ("od",),
+        "i": ("od",),
+        "o": ("odo",),
+        "aa": ("od",),
+        "ii": ("od",),
+        "oo": ("od",),
+        "e": ("od",)
     }
 }
 
+PRONOUN_PERSON = {
+    Pronoun.FIRST_SINGULAR_ANIMATE.value: "first",
+    Pronoun.FIRST_PLURAL_EXC_ANIMATE.value: "first",
+    Pronoun.SECOND_SINGULAR_ANIMATE.value: "second",
+    Pronoun.FIRST_PLURAL_INC_ANIMATE.value: "second",
+    Pronoun.SECOND_PLURAL_ANIMATE.value: "second",
+    Pronoun.THIRD_SINGULAR_ANIMATE.value: "third",
+    Pronoun.THIRD_PLURAL_ANIMATE.value: "third"
+}
+
+# Legacy view of the same data: one dict per pronoun, a list where there are dialect variants.
+PRONOUN_POSSESSIVE_PREFIX_MAP = {
+    Pronoun(pronoun): {initial: list(variants) if len(variants) > 1 else variants[0]
+                       for initial, variants in PERSON_PREFIX_MAP[person].items()}
+    for pronoun, person in PRONOUN_PERSON.items()
+}
+
+# --- Dialect variant policy ---
+# First-person dialects, named by their form before d-, g-, j- and z- (in-/ind-, ni-/nid-, nin-/nind-).
+DIALECTS = ("in", "ni", "nin")
+
+@dataclass(frozen=True)
+class VariantPolicy:
+    # preferred: the dialect listed first; alternates: how many other dialects follow it (None = all of them).
+    preferred: str = DIALECTS[0]
+    alternates: int | None = None
+
+    def __post_init__(self):
+        if self.preferred not in DIALECTS:
+            raise ValueError(f"Unknown dialect '{self.preferred}', expected one of {DIALECTS}")
+        if self.alternates is not None and self.alternates < 0:
+            raise ValueError(f"alternates must be None or >= 0, got {self.alternates}")
+
+    def select(self, variants: tuple[str, ...]) -> tuple[str, ...]:
+        if len(variants) == 1:
+            return variants
+        preferred = DIALECTS.index(self.preferred)
+        ordered = (variants[preferred],) + variants[:preferred] + variants[preferred + 1:]
+        return ordered if self.alternates is None else ordered[:1 + self.alternates]
+
+ALL_VARIANTS = VariantPolicy()
+
+def compile_prefix_table(policy: VariantPolicy) -> dict[str, dict[str, tuple[str, ...]]]:
+    """pronoun -> initial -> the prefixes the policy keeps; persons share one compiled dict."""
+    by_person = {person: {initial: policy.select(variants) for initial, variants in table.items()}
+                 for person, table in PERSON_PREFIX_MAP.items()}
+    return {pronoun: by_person[person] for pronoun, person in PRONOUN_PERSON.items()}
+
+VARIANT_POLICY = ALL_VARIANTS
+PREFIX_TABLE = compile_prefix_table(VARIANT_POLICY)
+
+def set_variant_policy(policy: VariantPolicy) -> None:
+    """Chooses which dialect variants generation builds; the default keeps all of them, in-/ind- first."""
+    global VARIANT_POLICY, PREFIX_TABLE
+    VARIANT_POLICY = policy
+    PREFIX_TABLE = compile_prefix_table(policy)
+    clear_cache()
+
+def get_variant_policy() -> VariantPolicy:
+    return VARIANT_POLICY
+
 def get_initial_letter(verb: str) -> str:
-    pass
-
-def handle_first_prefix():
-    pass
-
-def handle_second_prefix():
-    pass
-
-def handle_third_prefix():
-    pass
-
-def get_pronoun_prefix(verb_type: str, verb: str, form: str, neg: bool, pronoun: str, tense: str) -> str:
-    if form in (Form.DEPENDENT_CLAUSE, Form.IMPERATIVE) or verb_type == "vii": return verb
-
-    pronoun_prefix_map = PRONOUN_POSSESSIVE_PREFIX_MAP.get(pronoun, {})
-    if tense == "present":
-        initial = verb[:2] if verb[:2] in WordEndingVowel.LONG_VOWEL else verb[0]
-    else:
-        initial = verb[7]
-    prefix = pronoun_prefix_map.get(initial)
-
-    if pronoun in (Pronoun.FIRST_SINGULAR_ANIMATE, Pronoun.FIRST_PLURAL_EXC_ANIMATE) and isinstance(prefix, list):
-        if form == Form.INDEPENDENT_CLAUSE and neg == False:
-            multi_pronoun_prefix = [styled_text(p, "green_normal") + verb for p in prefix]
-        elif form == Form.INDEPENDENT_CLAUSE and neg == True:
-            multi_pronoun_prefix = [styled_text(p, "red_normal") + verb for p in prefix]
-        return multi_pronoun_prefix
-    elif pronoun in (Pronoun.FIRST_SINGULAR_ANIMATE, Pronoun.FIRST_PLURAL_EXC_ANIMATE):
-        if form == Form.INDEPENDENT_CLAUSE and neg == False:
-            return styled_text(prefix, "green_normal") + verb
-        elif form == Form.INDEPENDENT_CLAUSE and neg == True:
-            return styled_text(prefix, "red_normal") + verb
-    
-    if pronoun in (Pronoun.SECOND_SINGULAR_ANIMATE, Pronoun.SECOND_PLURAL_ANIMATE, Pronoun.FIRST_PLURAL_INC_ANIMATE):
-        if form == Form.INDEPENDENT_CLAUSE and neg == False:
-            return styled_text(prefix, "green_normal") + verb
-        if form == Form.INDEPENDENT_CLAUSE and neg == True:
-            return styled_text(prefix, "red_normal") + verb
+    """
+    Finds the initial of a word that has already been through the tense stage.
+    Only needed when the caller did not pass the initial from get_tense_parts.
+    """
+    return get_initial(strip_styles(verb))
+
+def style_prefix(prefix: str, form: str, neg: bool) -> str | None:
+    if form == Form.INDEPENDENT_CLAUSE and neg == False:
+        return styled_text(prefix, "green_normal")
+    elif form == Form.INDEPENDENT_CLAUSE and neg == True:
+        return styled_text(prefix, "red_normal")
+    return None
 
+def get_prefix_variants(verb_type: str, pronoun: str, initial: str) -> tuple[str, ...] | None:
+    """
+    Returns the unstyled pronoun prefix dialect variants kept by the variant policy for a verb initial
+    ("" when the pronoun takes no prefix). Returns None when no prefix applies.
+    """
     if pronoun in (Pronoun.THIRD_SINGULAR_ANIMATE, Pronoun.THIRD_PLURAL_ANIMATE) and verb_type == "vai":
-        return verb
-    elif pronoun in (Pronoun.THIRD_SINGULAR_ANIMATE, Pronoun.THIRD_PLURAL_ANIMATE) and verb_type in ("vti", "vta"):
-        if form == Form.INDEPENDENT_CLAUSE and neg == False:
-            return styled_text(prefix, "green_normal") + verb
-        elif form == Form.INDEPENDENT_CLAUSE and neg == True:
-            return styled_text(prefix, "red_normal") + verb
+        return ("",)
+    if pronoun in (Pronoun.THIRD_SINGULAR_ANIMATE, Pronoun.THIRD_PLURAL_ANIMATE) and verb_type not in ("vti", "vta"):
+        return None
+
+    return PREFIX_TABLE.get(pronoun, {}).get(initial)
+
+def get_pronoun_prefixes(verb_type: str, form: str, neg: bool, pronoun: str, initial: str) -> str | list[str] | None:
+    """
+    Returns the styled pronoun prefix (or list of dialect variants) for a verb initial,
+    without attaching it to the verb. Returns None when no prefix applies.
+    """
+    variants = get_prefix_variants(verb_type, pronoun, initial)
+    if variants is None:
+        return None
+
+    styled = [style_prefix(p, form, neg) if p else "" for p in variants]
+    if None in styled:
+        return None
+    return styled if len(styled) > 1 else styled[0]
+
+def takes_pronoun_prefix(verb_type: str, form: str) -> bool:
+    return not (form in (Form.DEPENDENT_CLAUSE, Form.IMPERATIVE) or verb_type == "vii")
+
+@memoize()
+def get_pronoun_prefix(verb_type: str, verb: str, form: str, neg: bool, pronoun: str, tense: str, initial: str | None = None) -> str:
+    """
+    Attaches the pronoun prefix to a word that has already been through the tense stage.
+    initial: the initial reported by get_tense_parts; found from the word itself when omitted.
+    """
+    if not takes_pronoun_prefix(verb_type, form): return verb
+
+    if initial is None:
+        initial = get_initial_letter(verb)
+    prefix = get_pronoun_prefixes(verb_type, form, neg, pronoun, initial)
+
+    if isinstance(prefix, list):
+        return [p + verb for p in prefix]
+    elif prefix is not None:
+        return prefix + verb
 
     raise ValueError(f"No valid prefix found for pronoun '{pronoun}' and verb '{verb}'")
\ No newline at end of file
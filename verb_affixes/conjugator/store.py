@@ -0,0 +1,252 @@
+# This file keeps precomputed paradigms in a local SQLite database, so serving a paradigm is a query, not a regeneration.
+# build() materialises conjugate_paradigm_forms for a verb list with batched inserts inside transactions.
+# Queries read from the store and fall back to live generation for lemmas that were never built.
+# Rows are one per surface form: a cell with dialect variants has one row per prefix variant.
+# The store also records the suffix table entry behind every slot and a snapshot of the tables it was built from,
+# so rebuild() can regenerate only the cells a table edit touches (see dependencies.py).
+
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from .dependencies import SUFFIX_KEYS, assess_changes, changed_keys, format_key, slot_keys, table_entries
+from .export import iter_paradigms
+from .models import Analysis, ConjugatedForm, ConjugationInput
+from .paradigm import TENSES, conjugate_paradigm_forms
+from .pipeline import conjugate
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lemmas (
+    verb TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (verb, type)
+);
+CREATE TABLE IF NOT EXISTS forms (
+    id INTEGER PRIMARY KEY,
+    verb TEXT NOT NULL,
+    type TEXT NOT NULL,
+    form TEXT NOT NULL,
+    negation INTEGER NOT NULL,
+    tense TEXT NOT NULL,
+    pronoun TEXT NOT NULL,
+    object TEXT,
+    variant INTEGER NOT NULL,
+    surface TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    preverb TEXT NOT NULL,
+    stem TEXT NOT NULL,
+    suffix TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS forms_lemma ON forms (verb, type);
+CREATE INDEX IF NOT EXISTS forms_surface ON forms (surface);
+CREATE INDEX IF NOT EXISTS forms_features ON forms (type, form, negation, tense, pronoun, object);
+CREATE TABLE IF NOT EXISTS slots (
+    verb TEXT NOT NULL,
+    type TEXT NOT NULL,
+    form TEXT NOT NULL,
+    negation INTEGER NOT NULL,
+    pronoun TEXT NOT NULL,
+    object TEXT,
+    suffix_key TEXT
+);
+CREATE INDEX IF NOT EXISTS slots_lemma ON slots (verb, type);
+CREATE INDEX IF NOT EXISTS slots_suffix_key ON slots (suffix_key);
+CREATE TABLE IF NOT EXISTS table_entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+INSERT_FORM = """
+INSERT INTO forms (verb, type, form, negation, tense, pronoun, object, variant, surface, prefix, preverb, stem, suffix)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SLOT = "INSERT INTO slots (verb, type, form, negation, pronoun, object, suffix_key) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+FORM_COLUMNS = "verb, type, form, negation, tense, pronoun, object, prefix, preverb, stem, suffix"
+
+# The planner would otherwise pick forms_features and scan that cell of every lemma.
+SLOT_ROWS = """
+SELECT id, tense FROM forms INDEXED BY forms_lemma
+WHERE verb = ? AND type = ? AND form = ? AND negation = ? AND pronoun = ? AND object IS ? ORDER BY id
+"""
+
+DEFAULT_BATCH_SIZE = 1000
+
+def form_rows(form: ConjugatedForm) -> list[tuple]:
+    return [(form.verb, form.type, form.form, int(form.negation), form.tense, form.pronoun, form.direct_object,
+             variant, surface, prefix, form.preverb, form.stem, form.suffix)
+            for variant, (prefix, surface) in enumerate(zip(form.prefixes, form.render_all()))]
+
+def rows_to_forms(rows: Iterable[tuple]) -> list[ConjugatedForm]:
+    """Regroups variant rows (ordered by id) into one ConjugatedForm per cell."""
+    forms = []
+    for verb, verb_type, form, neg, tense, pronoun, obj, prefix, preverb, stem, suffix in rows:
+        cell = (verb, verb_type, form, bool(neg), tense, pronoun, obj)
+        if forms and forms[-1][0] == cell:
+            forms[-1][1].append(prefix)
+        else:
+            forms.append((cell, [prefix], (preverb, stem, suffix)))
+    return [ConjugatedForm(*cell, tuple(prefixes), *segments) for cell, prefixes, segments in forms]
+
+@dataclass
+class RebuildStats:
+    changed_keys: int
+    slots: int
+    lemmas: int
+
+class ParadigmStore:
+    def __init__(self, path: str | Path = ":memory:", write_through: bool = False):
+        """
+        path: SQLite database file (created if missing).
+        write_through: store paradigms generated on a miss, so the next query for the lemma is served from the store.
+        """
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+        self.write_through = write_through
+
+    # --- Build ---
+    def build(self, entries: Iterable[tuple[str, str]], batch_size: int = DEFAULT_BATCH_SIZE,
+              skipped: list[tuple[str, str]] | None = None) -> int:
+        """
+        Materialises the paradigm of every (verb, type) entry, replacing lemmas already in the store.
+        Rows are inserted batch_size at a time, one transaction per batch; returns the number of lemmas built.
+        Lemmas whose paradigm fails are logged, appended to skipped when given, and left as they were.
+        """
+        if self.connection.execute("SELECT 1 FROM table_entries LIMIT 1").fetchone() is None:
+            self.write_table_entries(table_entries())
+        built = 0
+        batch, slots, lemmas = [], [], []
+        # A lemma listed twice would be deleted once and inserted twice within the same batch.
+        for verb, verb_type, forms in iter_paradigms(dict.fromkeys(entries), skipped):
+            batch.extend(row for form in forms for row in form_rows(form))
+            slots.extend((verb, verb_type, *slot) for slot in slot_keys(verb, verb_type))
+            lemmas.append((verb, verb_type))
+            if len(batch) >= batch_size:
+                self.write_batch(lemmas, batch, slots)
+                built += len(lemmas)
+                batch, slots, lemmas = [], [], []
+        if lemmas:
+            self.write_batch(lemmas, batch, slots)
+            built += len(lemmas)
+        return built
+
+    def write_batch(self, lemmas: list[tuple[str, str]], rows: list[tuple], slots: list[tuple]) -> None:
+        with self.connection:
+            self.connection.executemany("DELETE FROM forms WHERE verb = ? AND type = ?", lemmas)
+            self.connection.executemany("DELETE FROM slots WHERE verb = ? AND type = ?", lemmas)
+            self.connection.executemany(INSERT_FORM, rows)
+            self.connection.executemany(INSERT_SLOT, slots)
+            self.connection.executemany("INSERT OR IGNORE INTO lemmas (verb, type) VALUES (?, ?)", lemmas)
+
+    def write_table_entries(self, entries: dict[str, str]) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM table_entries")
+            self.connection.executemany("INSERT INTO table_entries (key, value) VALUES (?, ?)", entries.items())
+
+    # --- Incremental rebuild ---
+    def rebuild(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RebuildStats:
+        """
+        Brings every stored lemma up to date with the current tables, regenerating only what changed since the tables
+        were last recorded:
+          - a changed suffix table entry regenerates the slots built from it (all five tenses), updating rows in place,
+          - a stem added to or removed from a stem set (DUMMY_N) rebuilds that stem's lemma,
+          - a changed prefix table, or a store built before tracking, rebuilds every lemma.
+        """
+        old = dict(self.connection.execute("SELECT key, value FROM table_entries"))
+        new = table_entries()
+        changed = changed_keys(old, new)
+        impact = assess_changes(changed)
+        stored = [tuple(row) for row in self.connection.execute("SELECT verb, type FROM lemmas ORDER BY rowid")]
+        if not old or impact.everything:
+            stale = set(stored)
+        else:
+            untracked = self.connection.execute(
+                "SELECT verb, type FROM lemmas WHERE NOT EXISTS "
+                "(SELECT 1 FROM slots WHERE slots.verb = lemmas.verb AND slots.type = lemmas.type)")
+            stale = (impact.lemmas & set(stored)) | {tuple(row) for row in untracked}
+
+        refreshed = 0
+        with self.connection:
+            for key in sorted(impact.suffix_keys):
+                slots = self.connection.execute(
+                    "SELECT rowid, verb, type, form, negation, pronoun, object FROM slots WHERE suffix_key = ?", (key,))
+                for slot_id, verb, verb_type, form, neg, pronoun, obj in slots.fetchall():
+                    if (verb, verb_type) in stale:
+                        continue
+                    if self.refresh_slot(slot_id, verb, verb_type, form, bool(neg), pronoun, obj):
+                        refreshed += 1
+                    else:
+                        stale.add((verb, verb_type))
+        lemmas = [lemma for lemma in stored if lemma in stale]
+        self.build(lemmas, batch_size)
+        self.write_table_entries(new)
+        return RebuildStats(len(changed), refreshed, len(lemmas))
+
+    def refresh_slot(self, slot_id: int, verb: str, verb_type: str, form: str, neg: bool, pronoun: str, obj: str | None) -> bool:
+        """
+        Regenerates the five tense cells of one slot and rewrites their rows in place, so paradigm order is kept.
+        Returns False, changing nothing, when a cell no longer has the same number of prefix variants.
+        """
+        ids_by_tense = {}
+        for row_id, tense in self.connection.execute(SLOT_ROWS, (verb, verb_type, form, int(neg), pronoun, obj)):
+            ids_by_tense.setdefault(tense, []).append(row_id)
+        updates = []
+        for tense in TENSES:
+            input_data = ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun, negation=neg,
+                                          tense=tense, direct_object=obj)
+            rows = form_rows(conjugate(input_data))
+            ids = ids_by_tense.get(tense, [])
+            if len(ids) != len(rows):
+                return False
+            updates.extend((surface, prefix, preverb, stem, suffix, row_id)
+                           for row_id, (*_, surface, prefix, preverb, stem, suffix) in zip(ids, rows))
+        self.connection.executemany(
+            "UPDATE forms SET surface = ?, prefix = ?, preverb = ?, stem = ?, suffix = ? WHERE id = ?", updates)
+        key = SUFFIX_KEYS[verb_type](ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun,
+                                                      negation=neg, direct_object=obj))
+        self.connection.execute("UPDATE slots SET suffix_key = ? WHERE rowid = ?",
+                                (None if key is None else format_key(key), slot_id))
+        return True
+
+    # --- Queries ---
+    def __contains__(self, entry: tuple[str, str]) -> bool:
+        return self.connection.execute("SELECT 1 FROM lemmas WHERE verb = ? AND type = ?", entry).fetchone() is not None
+
+    def paradigm(self, verb: str, verb_type: str) -> list[ConjugatedForm]:
+        """Same cells and order as conjugate_paradigm_forms; generated live when the lemma is not in the store."""
+        if (verb, verb_type) not in self:
+            if self.write_through:
+                self.build([(verb, verb_type)])
+            if (verb, verb_type) not in self:
+                return conjugate_paradigm_forms(verb, verb_type)
+        rows = self.connection.execute(
+            f"SELECT {FORM_COLUMNS} FROM forms WHERE verb = ? AND type = ? ORDER BY id", (verb, verb_type))
+        return rows_to_forms(rows)
+
+    def find_surface(self, surface: str) -> list[Analysis]:
+        """Every stored cell whose surface form (any prefix variant) is exactly surface."""
+        rows = self.connection.execute(
+            "SELECT DISTINCT verb, type, form, negation, tense, pronoun, object FROM forms WHERE surface = ? ORDER BY id",
+            (surface,))
+        return [Analysis(verb, verb_type, form, bool(neg), tense, pronoun, obj)
+                for verb, verb_type, form, neg, tense, pronoun, obj in rows]
+
+    def find_features(self, verb_type: str, form: str, negation: bool, tense: str, pronoun: str,
+                      direct_object: str | None = None) -> list[ConjugatedForm]:
+        """The cell with this feature bundle for every stored lemma of the type."""
+        rows = self.connection.execute(
+            f"SELECT {FORM_COLUMNS} FROM forms WHERE type = ? AND form = ? AND negation = ? AND tense = ? "
+            f"AND pronoun = ? AND object IS ? ORDER BY id",
+            (verb_type, form, int(negation), tense, pronoun, direct_object))
+        return rows_to_forms(rows)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ParadigmStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
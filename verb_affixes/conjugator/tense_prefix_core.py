@@ -1,5 +1,6 @@
 from conjugator.utils import styled_text
-from .enum import Pronoun, Tense
+from .enum import Pronoun, Tense, WordEndingVowel
+from .cache import memoize
 
 CONSONANT_SHIFT_MAP = {
     "zh": "sh",
@@ -17,39 +18,94 @@ TENSE_PREFIX_MAP = {
     Tense.PAST: "gii-"
 }
 
+LONG_VOWEL_INITIALS = frozenset(WordEndingVowel.LONG_VOWEL.value)
+
+def get_initial(word: str) -> str:
+    # Long vowels are keyed by both letters in PRONOUN_POSSESSIVE_PREFIX_MAP, so "aa" stays "aa".
+    return word[:2] if word[:2] in LONG_VOWEL_INITIALS else word[:1]
+
+# Only the past and desiderative preverbs shift the stem's initial consonant.
+SHIFTING_TENSES = frozenset((Tense.FUTURE_DESIDERATIVE.value, Tense.PAST.value))
+# Split by length so a stem needs at most two dict lookups; "zh" is tried before "z", as in CONSONANT_SHIFT_MAP.
+TWO_LETTER_SHIFTS = {initial: shifted for initial, shifted in CONSONANT_SHIFT_MAP.items() if len(initial) == 2}
+ONE_LETTER_SHIFTS = {initial: shifted for initial, shifted in CONSONANT_SHIFT_MAP.items() if len(initial) == 1}
+
+def shift_initial(verb: str) -> str:
+    shifted = TWO_LETTER_SHIFTS.get(verb[:2])
+    if shifted is not None:
+        return shifted + verb[2:]
+    shifted = ONE_LETTER_SHIFTS.get(verb[:1])
+    if shifted is not None:
+        return shifted + verb[1:]
+    return verb
+
 def consonant_shift(verb: str, tense: str) -> str:
-    if tense in (Tense.FUTURE_DESIDERATIVE, Tense.PAST):
-        for tense_prefix in CONSONANT_SHIFT_MAP:
-            if verb.startswith(tense_prefix):
-                replacement = CONSONANT_SHIFT_MAP[tense_prefix]
-                return replacement + verb[len(tense_prefix):]
+    if tense in SHIFTING_TENSES:
+        return shift_initial(verb)
     return verb
 
-def handle_conditional(verb: str, pronoun: str, tense: str) -> str:
-    return styled_text(TENSE_PREFIX_MAP[Tense.CONDITIONAL], "gray_normal") + consonant_shift(verb, tense)
+def handle_conditional(verb: str, pronoun: str, tense: str) -> tuple[str, str]:
+    return TENSE_PREFIX_MAP[Tense.CONDITIONAL], consonant_shift(verb, tense)
 
-def handle_future_definitive(verb: str, pronoun: str, tense: str) -> str:
+def handle_future_definitive(verb: str, pronoun: str, tense: str) -> tuple[str, str]:
     if pronoun in (Pronoun.THIRD_SINGULAR_ANIMATE, Pronoun.THIRD_PLURAL_ANIMATE):
-        return styled_text(TENSE_PREFIX_MAP[Tense.FUTURE_DEFINITIVE][0], "gray_normal") + consonant_shift(verb, tense)
+        return TENSE_PREFIX_MAP[Tense.FUTURE_DEFINITIVE][0], consonant_shift(verb, tense)
     else:
-        return styled_text(TENSE_PREFIX_MAP[Tense.FUTURE_DEFINITIVE][1], "gray_normal") + consonant_shift(verb, tense)
+        return TENSE_PREFIX_MAP[Tense.FUTURE_DEFINITIVE][1], consonant_shift(verb, tense)
 
-def handle_future_desiderative(verb: str, pronoun: str, tense: str) -> str:
-    return styled_text(TENSE_PREFIX_MAP[Tense.FUTURE_DESIDERATIVE], "gray_normal") + consonant_shift(verb, tense)
+def handle_future_desiderative(verb: str, pronoun: str, tense: str) -> tuple[str, str]:
+    return TENSE_PREFIX_MAP[Tense.FUTURE_DESIDERATIVE], consonant_shift(verb, tense)
 
-def handle_past(verb: str, pronoun: str, tense: str) -> str:
-    return styled_text(TENSE_PREFIX_MAP[Tense.PAST], "gray_normal") + consonant_shift(verb, tense)
+def handle_past(verb: str, pronoun: str, tense: str) -> tuple[str, str]:
+    return TENSE_PREFIX_MAP[Tense.PAST], consonant_shift(verb, tense)
 
-def get_tense_prefix(verb: str, pronoun: str, tense: str) -> str:
-    if tense == Tense.PRESENT:
-        return verb
-    elif tense == Tense.CONDITIONAL:
-        verb = handle_conditional(verb, pronoun, tense)
+def get_tense_parts(verb: str, pronoun: str, tense: str) -> tuple[str, str, str]:
+    """
+    Returns the unstyled (preverb, verb, initial) of the tense stage; the preverb is "" in the present tense.
+    initial is what the pronoun prefix attaches to: the preverb's initial, or the stem's when there is no preverb.
+    """
+    if tense == Tense.CONDITIONAL:
+        preverb, verb = handle_conditional(verb, pronoun, tense)
     elif tense == Tense.FUTURE_DEFINITIVE:
-        verb = handle_future_definitive(verb, pronoun, tense)
+        preverb, verb = handle_future_definitive(verb, pronoun, tense)
     elif tense == Tense.FUTURE_DESIDERATIVE:
-        verb = handle_future_desiderative(verb, pronoun, tense)
+        preverb, verb = handle_future_desiderative(verb, pronoun, tense)
     elif tense == Tense.PAST:
-        verb = handle_past(verb, pronoun, tense)
+        preverb, verb = handle_past(verb, pronoun, tense)
+    else:
+        preverb = ""
+    return preverb, verb, get_initial(preverb or verb)
+
+def get_all_tense_parts(verb: str, pronoun: str) -> dict[str, tuple[str, str, str]]:
+    """
+    Returns get_tense_parts(verb, pronoun, tense) for all five tenses at once, keyed by tense.
+    The consonant-shifted stem and the da-/ga- choice are computed once and shared between the tenses that use them.
+    """
+    shifted = shift_initial(verb)
+    definitive = handle_future_definitive(verb, pronoun, Tense.FUTURE_DEFINITIVE)[0]
+    past = TENSE_PREFIX_MAP[Tense.PAST]
+    conditional = TENSE_PREFIX_MAP[Tense.CONDITIONAL]
+    desiderative = TENSE_PREFIX_MAP[Tense.FUTURE_DESIDERATIVE]
+    return {
+        Tense.PRESENT.value: ("", verb, get_initial(verb)),
+        Tense.PAST.value: (past, shifted, get_initial(past)),
+        Tense.CONDITIONAL.value: (conditional, verb, get_initial(conditional)),
+        Tense.FUTURE_DEFINITIVE.value: (definitive, verb, get_initial(definitive)),
+        Tense.FUTURE_DESIDERATIVE.value: (desiderative, shifted, get_initial(desiderative))
+    }
+
+@memoize()
+def get_all_tense_prefixes(verb: str, pronoun: str) -> dict[str, str]:
+    """Styled counterpart of get_all_tense_parts: get_tense_prefix(verb, pronoun, tense) for every tense."""
+    return {tense: styled_text(preverb, "gray_normal") + stem if preverb else stem
+            for tense, (preverb, stem, _) in get_all_tense_parts(verb, pronoun).items()}
+
+@memoize()
+def get_tense_prefix(verb: str, pronoun: str, tense: str) -> str:
+    if tense == Tense.PRESENT:
+        return verb
 
-    return verb
\ No newline at end of file
+    preverb, verb, _ = get_tense_parts(verb, pronoun, tense)
+    if not preverb:
+        return verb
+    return styled_text(preverb, "gray_normal") + verb
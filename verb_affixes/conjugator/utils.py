@@ -31,6 +31,11 @@
 # bold blue (36) = animate bold
 # underline blue (36) = obviate
 
+import html
+import re
+
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
 def styled_text(text: str, style: str) -> str:
 
     styles = {
@@ -53,6 +58,9 @@ def styled_text(text: str, style: str) -> str:
     end = "\033[00m" if start else ""
     return f"{start}{text}{end}"
 
+def strip_styles(text: str) -> str:
+    return ANSI_ESCAPE.sub("", text)
+
 def get_style(form: str, neg: bool) -> str:
     style_map = {
         ("independent", False): "green_normal",
@@ -62,4 +70,40 @@ def get_style(form: str, neg: bool) -> str:
         ("imperative", False): "green_bold",
         ("imperative", True): "red_bold"
     }
-    return style_map.get((form, neg), "")
\ No newline at end of file
+    return style_map.get((form, neg), "")
+
+def get_prefix_style(neg: bool) -> str:
+    # Pronoun prefixes only appear in the independent form.
+    return "red_normal" if neg == True else "green_normal"
+
+def render_plain(prefix: str, preverb: str, stem: str, suffix: str, form: str, neg: bool) -> str:
+    return f"{prefix}{preverb}{stem}{suffix}"
+
+def render_ansi(prefix: str, preverb: str, stem: str, suffix: str, form: str, neg: bool) -> str:
+    styled_prefix = styled_text(prefix, get_prefix_style(neg)) if prefix else ""
+    return f"{styled_prefix}{styled_text(preverb, 'gray_normal')}{stem}{styled_text(suffix, get_style(form, neg))}"
+
+def render_html(prefix: str, preverb: str, stem: str, suffix: str, form: str, neg: bool) -> str:
+    polarity = "negative" if neg == True else "positive"
+    segments = (
+        ("prefix", prefix),
+        ("preverb", preverb),
+        ("stem", stem),
+        ("suffix", suffix)
+    )
+    return "".join(
+        f'<span class="{name} {form} {polarity}">{html.escape(text)}</span>'
+        for name, text in segments if text
+    )
+
+RENDERERS = {
+    "plain": render_plain,
+    "ansi": render_ansi,
+    "html": render_html
+}
+
+def render_segments(prefix: str, preverb: str, stem: str, suffix: str, form: str, neg: bool, style: str = "plain") -> str:
+    renderer = RENDERERS.get(style)
+    if renderer is None:
+        raise ValueError(f"Unknown render style '{style}', expected one of {sorted(RENDERERS)}")
+    return renderer(prefix, preverb, stem, suffix, form, neg)
@@ -3,10 +3,14 @@
 # Takes in data (via models.py), applies logic, and returns results.
 # Should be pure and testable — no printing, user interaction, or I/O.
 
+import sys
 from enum import Enum
-from .enum import Form, Negation, Pronoun, WordEndingVowel, WordEndingVAI
-from .models import ConjugationInput
+from .enum import EndingClass, Form, Negation, Pronoun, WordEndingVowel, WordEndingVAI
+from .models import CompactInput, ConjugationInput, full_input
 from .utils import styled_text, get_style
+from .dispatch import RuleDispatcher
+from .hooks import suffix_module_loaded
+from .cache import memoize, input_key
 
 # --- 1. Constants ---
 VAI_SUFFIX_MAP = {
@@ -122,6 +126,11 @@ VAI_SUFFIX_MAP = {
     }
 }
 
+LONG_VOWEL_ENDINGS = WordEndingVowel.LONG_VOWEL.value
+SHORT_VOWEL_ENDINGS = WordEndingVowel.SHORT_VOWEL.value
+AM_ENDING = WordEndingVAI.AM.value
+N_ENDING = WordEndingVAI.N.value
+
 # --- 2. Helpers ---
 def get_suffix(form: str | Enum, neg: bool | Enum, category: str | Enum, pronoun: str, key = None) -> str:
     return VAI_SUFFIX_MAP[form][neg][category].get(pronoun, "")
@@ -154,161 +163,164 @@ def remove_final_letter(verb: str) -> str:
     return verb[:-1]
 
 # --- 3. Rule Interface and Implementation ---
-class IndependentAffirmativeRule:
+class Rule:
+    # Declares which suffix table the rule reads from; subclasses add the ending category.
+    form = None
+    negation = None
+    category = None
+
     def matches(self, verb: str, pronoun: str) -> bool:
         raise NotImplementedError
 
+    def edit(self, verb: str, pronoun: str) -> str:
+        return verb
+
+    def suffix(self, pronoun: str) -> str:
+        return get_suffix(self.form, self.negation, self.category, pronoun)
+
+    def table_key(self, pronoun: str) -> tuple:
+        # The VAI_SUFFIX_MAP entry suffix() reads, for change tracking (dependencies.py).
+        return "VAI_SUFFIX_MAP", self.form, self.negation, self.category, pronoun
+
     def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+        return self.edit(verb, pronoun), self.suffix(pronoun)
+
+class IndependentAffirmativeRule(Rule):
+    form = Form.INDEPENDENT_CLAUSE
+    negation = Negation.AFFIRMATIVE
     
 class DropShortVowel(IndependentAffirmativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_short_vowel(verb) and not ends_with_long_vowel(verb) and pronoun in (Pronoun.FIRST_SINGULAR_ANIMATE, Pronoun.SECOND_SINGULAR_ANIMATE)
     
-    def apply(self, verb: str, pronoun: str):
-        return remove_final_letter(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
+    def edit(self, verb: str, pronoun: str):
+        return remove_final_letter(verb)
     
 class VowelEndIndPos(IndependentAffirmativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class AddAIndPos(IndependentAffirmativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_n(verb) and pronoun in (Pronoun.FIRST_PLURAL_EXC_ANIMATE, Pronoun.FIRST_PLURAL_INC_ANIMATE, Pronoun.SECOND_PLURAL_ANIMATE)
     
-    def apply(self, verb: str, pronoun: str):
-        return add_i(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
+    def edit(self, verb: str, pronoun: str):
+        return add_i(verb)
 
 class AddIIndPos(IndependentAffirmativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_n(verb) and pronoun in (Pronoun.FIRST_PLURAL_EXC_ANIMATE, Pronoun.FIRST_PLURAL_INC_ANIMATE, Pronoun.SECOND_PLURAL_ANIMATE)
     
-    def apply(self, verb: str, pronoun: str):
-        return add_i(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
+    def edit(self, verb: str, pronoun: str):
+        return add_i(verb)
 
 class EndNorAMIndPos(IndependentAffirmativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb) or ends_with_n(verb)
     
-    def apply(self, verb: str, pronoun: str):
+    def edit(self, verb: str, pronoun: str):
         if pronoun in (Pronoun.FIRST_PLURAL_EXC_ANIMATE, Pronoun.FIRST_PLURAL_INC_ANIMATE, Pronoun.SECOND_PLURAL_ANIMATE):
-            return add_a(remove_final_letter(verb)), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
-
-class IndependentNegativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
+            return add_a(remove_final_letter(verb))
+        return verb
 
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class IndependentNegativeRule(Rule):
+    form = Form.INDEPENDENT_CLAUSE
+    negation = Negation.NEGATIVE
     
 class EndVowelIndNeg(IndependentNegativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class EndAMIndNeg(IndependentNegativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb)
     
-    def apply(self, verb: str, pronoun: str):
-        return add_n(remove_final_letter(verb)), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVAI.N_AM, pronoun)
+    def edit(self, verb: str, pronoun: str):
+        return add_n(remove_final_letter(verb))
     
 class EndNIndNeg(IndependentNegativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_n(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVAI.N_AM, pronoun)
 
-class DependentAffirmativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class DependentAffirmativeRule(Rule):
+    form = Form.DEPENDENT_CLAUSE
+    negation = Negation.AFFIRMATIVE
 
 class EndVowelDepPos(DependentAffirmativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class EndNorAMDepPos(DependentAffirmativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb) or ends_with_n(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
 
-class DependentNegativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class DependentNegativeRule(Rule):
+    form = Form.DEPENDENT_CLAUSE
+    negation = Negation.NEGATIVE
 
 class EndVowelDepNeg(DependentNegativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class EndNorAMDepNeg(DependentNegativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb) or ends_with_n(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVAI.N_AM, pronoun)
-
-class ImperativeAffirmativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
 
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class ImperativeAffirmativeRule(Rule):
+    form = Form.IMPERATIVE
+    negation = Negation.AFFIRMATIVE
     
 class EndVowelImpPos(ImperativeAffirmativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.IMPERATIVE, Negation.AFFIRMATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class EndNorAMImpPos(ImperativeAffirmativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb) or ends_with_n(verb)
     
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.IMPERATIVE, Negation.AFFIRMATIVE, WordEndingVAI.N_AM, pronoun)
-    
-class ImperativeNegativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class ImperativeNegativeRule(Rule):
+    form = Form.IMPERATIVE
+    negation = Negation.NEGATIVE
 
 class EndVowelImpNeg(ImperativeNegativeRule):
+    category = WordEndingVAI.SHORT_LONG_VOWEL
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.IMPERATIVE, Negation.NEGATIVE, WordEndingVAI.SHORT_LONG_VOWEL, pronoun)
 
 class EndNorAMImpNeg(ImperativeNegativeRule):
+    category = WordEndingVAI.N_AM
+
     def matches(self, verb: str, pronoun: str):
         return ends_with_am(verb) or ends_with_n(verb)
-    
-    def apply(self, verb: str, pronoun: str):
-        return verb, get_suffix(Form.IMPERATIVE, Negation.NEGATIVE, WordEndingVAI.N_AM, pronoun)
 
 # --- 4. Rule Registry ---
 INDEPENDENT_AFFIRMATIVE_RULES = [
@@ -345,7 +357,53 @@ EndVowelImpNeg(),
 EndNorAMImpNeg()
 ]
 
-# --- 5. Main Logic Functions ---
+RULE_REGISTRY = {
+    (Form.INDEPENDENT_CLAUSE, False): INDEPENDENT_AFFIRMATIVE_RULES,
+    (Form.INDEPENDENT_CLAUSE, True): INDEPENDENT_NEGATIVE_RULES,
+    (Form.DEPENDENT_CLAUSE, False): DEPENDENT_AFFIRMATIVE_RULES,
+    (Form.DEPENDENT_CLAUSE, True): DEPENDENT_NEGATIVE_RULES,
+    (Form.IMPERATIVE, False): IMPERATIVE_AFFIRMATIVE_RULES,
+    (Form.IMPERATIVE, True): IMPERATIVE_NEGATIVE_RULES
+}
+
+# --- 5. Ending-Class Dispatch ---
+def classify_ending(verb: str) -> EndingClass:
+    if verb.endswith(LONG_VOWEL_ENDINGS):
+        return EndingClass.LONG_VOWEL
+    if verb.endswith(SHORT_VOWEL_ENDINGS):
+        return EndingClass.SHORT_VOWEL
+    if verb.endswith(AM_ENDING):
+        return EndingClass.AM
+    if verb.endswith(N_ENDING):
+        return EndingClass.N
+    return EndingClass.OTHER
+
+# Sample stems used to compile the dispatch table; every sample of a class must pick the same rule.
+ENDING_CLASS_SAMPLES = {
+    EndingClass.LONG_VOWEL: tuple("b" + ending for ending in LONG_VOWEL_ENDINGS),
+    EndingClass.SHORT_VOWEL: tuple("b" + ending for ending in SHORT_VOWEL_ENDINGS),
+    EndingClass.AM: ("bam",),
+    EndingClass.N: ("ban", "bin", "boon"),
+    EndingClass.OTHER: ("bad", "bag", "")
+}
+
+DISPATCHER = RuleDispatcher(RULE_REGISTRY, classify_ending, ENDING_CLASS_SAMPLES, [pronoun.value for pronoun in Pronoun])
+
+def plan_entry(form: str, neg: bool, direct_object: str | None, ending_class: str, pronoun: str) -> tuple | None:
+    """
+    (stem edit, suffix) shared by every vai verb of ending_class in one cell, for the bulk planner (planner.py).
+    The edit takes the verb, or is None when the stem is kept; None when the cell has to run verb by verb
+    (a pronoun outside the compiled table, or no matching rule).
+    """
+    entry = DISPATCHER.table.get((form, bool(neg), ending_class, pronoun))
+    if entry is None:
+        return None
+    rule, suffix = entry
+    if type(rule).edit is Rule.edit:
+        return None, suffix
+    return (lambda verb: rule.edit(verb, pronoun)), suffix
+
+# --- 6. Main Logic Functions ---
 def handle_independent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
     if not neg:
         return handle_independent_affirmative(verb, pronoun)
@@ -353,16 +411,10 @@ def handle_independent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
         return handle_independent_negative(verb, pronoun)
     
 def handle_independent_affirmative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in INDEPENDENT_AFFIRMATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
-    return verb, ""
+    return handle_rules(Form.INDEPENDENT_CLAUSE, False, verb, pronoun)
 
 def handle_independent_negative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in INDEPENDENT_NEGATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
-    return verb, ""
+    return handle_rules(Form.INDEPENDENT_CLAUSE, True, verb, pronoun)
 
 def handle_dependent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
     if not neg:
@@ -371,16 +423,10 @@ def handle_dependent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
         return handle_dependent_negative(verb, pronoun)
     
 def handle_dependent_affirmative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in DEPENDENT_AFFIRMATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
-    return verb, ""
+    return handle_rules(Form.DEPENDENT_CLAUSE, False, verb, pronoun)
 
 def handle_dependent_negative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in DEPENDENT_NEGATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
-    return verb, ""
+    return handle_rules(Form.DEPENDENT_CLAUSE, True, verb, pronoun)
 
 def handle_imperative(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
     if not neg:
@@ -389,18 +435,20 @@ def handle_imperative(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
         return handle_imperative_negative(verb, pronoun)
     
 def handle_imperative_affirmative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in IMPERATIVE_AFFIRMATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
-    return verb, ""
+    return handle_rules(Form.IMPERATIVE, False, verb, pronoun)
 
 def handle_imperative_negative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in IMPERATIVE_NEGATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
+    return handle_rules(Form.IMPERATIVE, True, verb, pronoun)
+
+def handle_rules(form: str, neg: bool, verb: str, pronoun: str) -> tuple[str, str]:
+    entry = DISPATCHER.find(form, neg, verb, pronoun)
+    if entry:
+        rule, suffix = entry
+        return rule.edit(verb, pronoun), suffix
     return verb, ""
 
-def get_vai_suffix(input_data: ConjugationInput) -> str:
+def get_vai_parts(input_data: ConjugationInput) -> tuple[str, str]:
+    """Returns the unstyled (stem, suffix) pair of a vai conjugation."""
 
     type = "vai"
     verb = input_data.verb
@@ -409,7 +457,7 @@ def get_vai_suffix(input_data: ConjugationInput) -> str:
     pronoun = input_data.pronoun
 
     if type != "vai":
-        return verb
+        return verb, ""
     
     if form == Form.INDEPENDENT_CLAUSE:
         verb, suffix = handle_independent(verb, neg, pronoun)
@@ -418,8 +466,26 @@ def get_vai_suffix(input_data: ConjugationInput) -> str:
     elif form == Form.IMPERATIVE:
         verb, suffix = handle_imperative(verb, neg, pronoun)
 
+    return verb, suffix
+
+def get_suffix_key(input_data: ConjugationInput) -> tuple | None:
+    """The VAI_SUFFIX_MAP entry get_vai_parts reads for this input; None when no rule applies."""
+    form = input_data.form
+    if form not in (Form.INDEPENDENT_CLAUSE, Form.DEPENDENT_CLAUSE, Form.IMPERATIVE):
+        return None
+    entry = DISPATCHER.find(form, bool(input_data.negation), input_data.verb, input_data.pronoun)
+    return entry[0].table_key(input_data.pronoun) if entry else None
+
+@memoize(input_key)
+def get_vai_suffix(input_data: ConjugationInput | CompactInput) -> str:
+    input_data = full_input(input_data)
+    verb, suffix = get_vai_parts(input_data)
+
     # green = affirmative, red = negative
     # regular = independent, italic = dependent, bold = imperative, underline = direct object
-    style = get_style(form, neg)
+    style = get_style(input_data.form, input_data.negation)
+
+    return verb + styled_text(suffix, style)
 
-    return verb + styled_text(suffix, style)
\ No newline at end of file
+# Last, so hooks see the finished module (see hooks.py).
+suffix_module_loaded("vai", sys.modules[__name__])
@@ -0,0 +1,167 @@
+# This file is the optional NumPy backend for corpus-scale suffix generation: arrays of stems and feature codes in,
+# arrays of (stem, suffix) out, with no per-cell Python call.
+#   - endings are classified for the whole batch in vectorised endswith passes (plus a lexicon isin for dummy-n),
+#   - every (form, negation, ending class, pronoun) cell is compiled once into flat index arrays of stem edits and
+#     suffixes, by running the scalar get_vai_parts / get_vii_parts on the dispatcher's sample stems,
+#   - stem edits (remove_final_letter, add_a, add_i, add_n and their combinations) become one "drop N final letters,
+#     append text" batch operation.
+# Feature codes are the CompactInput codes from models.py. NumPy is imported only here; the rest of the package never needs it.
+
+from functools import lru_cache
+from types import ModuleType
+from .enum import EndingClass
+from .models import ConjugationInput, FORM_CODES, PRONOUN_CODES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VERB_TYPES = ("vai", "vii")
+NEGATIONS = (False, True)
+# Longest edit the probe looks for; the rule modules drop at most one letter.
+MAX_DROP = 2
+
+# --- 1. Rule modules ---
+def suffix_module(verb_type: str) -> ModuleType:
+    if verb_type == "vai":
+        from . import vai_suffixes_core
+        return vai_suffixes_core
+    if verb_type == "vii":
+        from . import vii_suffixes_core
+        return vii_suffixes_core
+    raise ValueError(f"Unsupported verb type '{verb_type}' for the vectorised backend (expected one of {VERB_TYPES})")
+
+def ending_tests(verb_type: str) -> list[tuple[str, tuple[str, ...] | None]]:
+    """(ending class, endings) in classify_ending order; None marks the lexical dummy-n test."""
+    module = suffix_module(verb_type)
+    if verb_type == "vai":
+        return [(EndingClass.LONG_VOWEL.value, module.LONG_VOWEL_ENDINGS),
+                (EndingClass.SHORT_VOWEL.value, module.SHORT_VOWEL_ENDINGS),
+                (EndingClass.AM.value, (module.AM_ENDING,)),
+                (EndingClass.N.value, (module.N_ENDING,))]
+    return [(EndingClass.DUMMY_N.value, None),
+            (EndingClass.D.value, (module.D_ENDING,)),
+            (EndingClass.N.value, (module.N_ENDING,)),
+            (EndingClass.LONG_VOWEL.value, module.LONG_VOWEL_ENDINGS),
+            (EndingClass.SHORT_VOWEL.value, module.SHORT_VOWEL_ENDINGS)]
+
+def ending_classes(verb_type: str) -> tuple[str, ...]:
+    return tuple(ending_class for ending_class, _ in ending_tests(verb_type)) + (EndingClass.OTHER.value,)
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("The vectorised backend requires NumPy: pip install numpy")
+
+# --- 2. Table compilation ---
+def probe_edit(stem: str, edited: str) -> tuple[int, str] | None:
+    """The (drop, append) pair turning stem into edited, preferring the fewest dropped letters."""
+    for drop in range(min(MAX_DROP, len(stem)) + 1):
+        kept = stem[:len(stem) - drop]
+        if edited.startswith(kept):
+            return drop, edited[len(kept):]
+    return None
+
+def apply_edit(stem: str, drop: int, append: str) -> str:
+    return stem[:max(len(stem) - drop, 0)] + append
+
+def compile_cell(verb_type: str, form: str, neg: bool, pronoun: str | None, samples: tuple[str, ...]) -> tuple | None:
+    """(drop, append, suffix) shared by every sample stem, or None when the scalar path fails for the cell."""
+    get_parts = getattr(suffix_module(verb_type), f"get_{verb_type}_parts")
+    results = []
+    for stem in samples:
+        try:
+            edited, suffix = get_parts(ConjugationInput(type=verb_type, form=form, verb=stem, pronoun=pronoun, negation=neg))
+        except Exception:
+            return None
+        results.append((stem, edited, suffix))
+    # Probe on the longest sample (an empty stem cannot reveal a drop), then check the edit reproduces every sample.
+    stem, edited, suffix = max(results, key=lambda result: len(result[0]))
+    edit = probe_edit(stem, edited)
+    if edit is None or any(apply_edit(s, *edit) != e or x != suffix for s, e, x in results):
+        raise ValueError(f"Cell {verb_type}/{form}/{neg}/{pronoun} is not a uniform stem edit over {results}")
+    return (*edit, suffix)
+
+@lru_cache(maxsize=None)
+def compile_table(verb_type: str) -> dict:
+    """
+    Flat arrays indexed by cell_index(form, negation, ending class, pronoun):
+      drop (letters removed from the stem), append (text added to the stem), suffix, valid.
+    """
+    require_numpy()
+    samples = suffix_module(verb_type).ENDING_CLASS_SAMPLES
+    classes = ending_classes(verb_type)
+    cells = []
+    for form in FORM_CODES:
+        for neg in NEGATIONS:
+            for ending_class in classes:
+                class_samples = tuple(samples.get(ending_class, ()))
+                for pronoun in PRONOUN_CODES:
+                    cells.append(compile_cell(verb_type, form, neg, pronoun, class_samples) if class_samples else None)
+    return {
+        "drop": np.array([cell[0] if cell else 0 for cell in cells], dtype=np.int64),
+        "append": np.array([cell[1] if cell else "" for cell in cells], dtype=str),
+        "suffix": np.array([cell[2] if cell else "" for cell in cells], dtype=str),
+        "valid": np.array([cell is not None for cell in cells], dtype=bool),
+        "classes": classes
+    }
+
+def cell_index(form, negation, ending_class, pronoun, class_count: int):
+    return ((form * len(NEGATIONS) + negation) * class_count + ending_class) * len(PRONOUN_CODES) + pronoun
+
+# --- 3. Batch operations ---
+def classify_endings(verb_type: str, stems) -> "np.ndarray":
+    """Ending class code (index into ending_classes(verb_type)) of every stem, first matching test wins."""
+    require_numpy()
+    stems = np.asarray(stems, dtype=str)
+    tests = ending_tests(verb_type)
+    codes = np.full(stems.shape, len(tests), dtype=np.int64)
+    unmatched = np.ones(stems.shape, dtype=bool)
+    for code, (_, endings) in enumerate(tests):
+        if endings is None:
+            hits = np.isin(stems, list(suffix_module(verb_type).DUMMY_N))
+        else:
+            hits = np.zeros(stems.shape, dtype=bool)
+            for ending in endings:
+                hits |= np.char.endswith(stems, ending)
+        hits &= unmatched
+        codes[hits] = code
+        unmatched &= ~hits
+    return codes
+
+def drop_final_letters(stems: "np.ndarray", drop: "np.ndarray") -> "np.ndarray":
+    """stem[:len(stem) - drop] for every stem, by zeroing code points in a (stems, width) view of the array."""
+    width = max(stems.dtype.itemsize // 4, 1)
+    codes = stems.astype(f"<U{width}").view(np.uint32).reshape(len(stems), width).copy()
+    keep = np.maximum(np.char.str_len(stems) - drop, 0)
+    codes[np.arange(width) >= keep[:, None]] = 0
+    # Trailing NULs are padding in NumPy strings, so the zeroed tail disappears.
+    return codes.view(f"<U{width}").reshape(len(stems))
+
+def suffix_parts_array(verb_type: str, stems, form, negation, pronoun) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Vectorised get_vai_parts / get_vii_parts: returns (edited stems, suffixes) as string arrays.
+    stems: sequence of stems. form, negation, pronoun: CompactInput codes (FORM_CODE, bool, PRONOUN_CODE), each an
+    array of the same length or a scalar applied to every stem.
+    Raises ValueError when a cell has no scalar result (the scalar path raises for it too).
+    """
+    require_numpy()
+    table = compile_table(verb_type)
+    stems = np.atleast_1d(np.asarray(stems, dtype=str))
+    stems, form, negation, pronoun = np.broadcast_arrays(stems, np.asarray(form, dtype=np.int64),
+                                                         np.asarray(negation, dtype=bool).astype(np.int64),
+                                                         np.asarray(pronoun, dtype=np.int64))
+    if ((form < 0) | (form >= len(FORM_CODES)) | (pronoun < 0) | (pronoun >= len(PRONOUN_CODES))).any():
+        raise ValueError("Form or pronoun code out of range")
+    cells = cell_index(form, negation, classify_endings(verb_type, stems), pronoun, len(table["classes"]))
+    invalid = np.flatnonzero(~table["valid"][cells])
+    if len(invalid):
+        i = invalid[0]
+        raise ValueError(f"No {verb_type} suffix for '{stems[i]}' as {FORM_CODES[form[i]]}/{bool(negation[i])}/{PRONOUN_CODES[pronoun[i]]}")
+    edited = np.char.add(drop_final_letters(stems, table["drop"][cells]), table["append"][cells])
+    return edited, table["suffix"][cells]
+
+def surface_array(verb_type: str, stems, form, negation, pronoun) -> "np.ndarray":
+    """Unstyled stem + suffix of every cell: the plain text get_vai_suffix / get_vii_suffix would style."""
+    edited, suffixes = suffix_parts_array(verb_type, stems, form, negation, pronoun)
+    return np.char.add(edited, suffixes)
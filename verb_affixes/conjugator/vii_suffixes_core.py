@@ -3,118 +3,20 @@
 # Takes in data (via models.py), applies logic, and returns results.
 # Should be pure and testable — no printing, user interaction, or I/O.
 
+import sys
 from enum import Enum
-from .enum import Form, Negation, Pronoun, WordEndingVowel, WordEndingVII
-from .models import ConjugationInput
+from .enum import EndingClass, Form, LexicalFlag, Negation, Pronoun, WordEndingVowel, WordEndingVII
+from .lexicon import Lexicon, load_lexicon
+from .models import CompactInput, ConjugationInput, full_input
 from .utils import styled_text, get_style
+from .dispatch import RuleDispatcher
+from .hooks import suffix_module_loaded
+from .cache import clear_cache, memoize, input_key
 
 # --- 1. Constants ---
-DUMMY_N = (
-    "agaasademon",
-    "akwamon",
-    "animamon",
-    "animipon",
-    "azhashkiiwaagamin",
-    "aazhawamon",
-    "aazhawaandawemon",
-    "aazhoomon",
-    "babaamipon",
-    "babigwaagamin",
-    "babiikwadamon",
-    "bagakaagamin",
-    "bagamipon",
-    "bakemon",
-    "bakobiimon",
-    "bakobiiyaabiigamon",
-    "bakwebiigamin",
-    "bangishimon",
-    "bazagwaagamin",
-    "baapaagadamon",
-    "baashkadaawangamon",
-    "bengopon",
-    "bimamon",
-    "bimaabiigamon",
-    "bimidewaagamin",
-    "bimipon",
-    "biijipon",
-    "biinaagamin",
-    "biindigepon",
-    "biinisaagamin",
-    "biisipon",
-    "biitewaagamin",
-    "biiwipon",
-    "boonipon",
-    "boozaagamin",
-    "dagon",
-    "dagwaagin",
-    "dakaagamin",
-    "dakigamin",
-    "dakipon",
-    "dakwamon",
-    "gibaakwadin",
-    "gibichipon",
-    "ginoomon",
-    "gizhaagamin",
-    "giiwitaamon",
-    "giizhowaagamin",
-    "giizhoogamin",
-    "gopamon",
-    "inamon",
-    "inaabiigamon",
-    "inaagamin",
-    "inigokwademon",
-    "ishkwaapon",
-    "ishpi-dagwaagin",
-    "izhipon",
-    "jiigeweyaazhagaamemon",
-    "jiikaagamin",
-    "madaabiimon",
-    "madaagamin",
-    "makadewaagamin",
-    "mamaangadepon",
-    "mamaangipon",
-    "mangademon",
-    "mashkawaagamin",
-    "maajipon",
-    "maanadamon",
-    "maanamon",
-    "maanaagamin",
-    "maazhimaagwaagamin",
-    "minwamon",
-    "minwaagamin",
-    "miskwaagamin",
-    "miskwiiwaagamin",
-    "mishkawaagamin",
-    "naazibiimon",
-    "nibiiwaagamin",
-    "ningwaagonemon",
-    "niingidoomon",
-    "niiskaajipon",
-    "nookaagamin",
-    "ogidaakiiwemon",
-    "onaagoshin",
-    "ondadamon",
-    "ondamon",
-    "onjipon",
-    "ozhaashadamon",
-    "ozhaashamon",
-    "ozhaawashkwaagamin",
-    "ozaawaagamin",
-    "washkadamon",
-    "waabishkaagamin",
-    "waakamin",
-    "wekwaamon",
-    "wiinaagamin",
-    "wiisagaagamin",
-    "wiishkobaagamin",
-    "zanagamon",
-    "ziiwiskaagamin",
-    "zoogipon",
-    "zhakipon",
-    "zhaagwaagamin",
-    "zhiiwaagamin",
-    "zhiiwitaaganaagamin"
-)
+# Dummy-n stems are lexical, not predictable from spelling; they live in data/lexicon.tsv.
+LEXICON = load_lexicon()
+DUMMY_N = LEXICON.stems(LexicalFlag.DUMMY_N)
 
 VII_SUFFIX_MAP = {
     Form.INDEPENDENT_CLAUSE: {
@@ -191,6 +93,11 @@ VII_SUFFIX_MAP = {
     }
 }
 
+LONG_VOWEL_ENDINGS = WordEndingVowel.LONG_VOWEL.value
+SHORT_VOWEL_ENDINGS = WordEndingVowel.SHORT_VOWEL.value
+D_ENDING = WordEndingVII.D.value
+N_ENDING = WordEndingVII.N.value
+
 # --- 2. Helpers ---
 def get_suffix(form: str | Enum, neg: bool | Enum, category: str | Enum, pronoun: str, key = None) -> str:
     if key:
@@ -215,134 +122,160 @@ def ends_with_d_vowel(verb: str) -> bool:
 def remove_final_letter(verb: str) -> str:
     return verb[:-1]
 
+def use_lexicon(lexicon: Lexicon) -> None:
+    """Replaces the lexicon used for dummy-n (and other lexical) checks."""
+    global LEXICON, DUMMY_N
+    LEXICON = lexicon
+    DUMMY_N = lexicon.stems(LexicalFlag.DUMMY_N)
+    # Cached results may have been computed with the old dummy-n stems.
+    clear_cache()
+
 # --- 3. Rule Interface and Implementation ---
-class IndependentAffirmativeRule:
+class Rule:
+    # Declares which suffix table the rule reads from; subclasses add the ending category (and nested key).
+    form = None
+    negation = None
+    category = None
+    key = None
+
     def matches(self, verb: str, pronoun: str) -> bool:
         raise NotImplementedError
 
+    def edit(self, verb: str, pronoun: str) -> str:
+        return verb
+
+    def suffix(self, pronoun: str) -> str:
+        return get_suffix(self.form, self.negation, self.category, pronoun, key = self.key)
+
+    def table_key(self, pronoun: str) -> tuple:
+        # The VII_SUFFIX_MAP entry suffix() reads, for change tracking (dependencies.py).
+        if self.key:
+            return "VII_SUFFIX_MAP", self.form, self.negation, self.category, self.key, pronoun
+        return "VII_SUFFIX_MAP", self.form, self.negation, self.category, pronoun
+
     def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+        return self.edit(verb, pronoun), self.suffix(pronoun)
+
+class IndependentAffirmativeRule(Rule):
+    form = Form.INDEPENDENT_CLAUSE
+    negation = Negation.AFFIRMATIVE
     
 class EndDummyNPluralIndPos(IndependentAffirmativeRule):
+    category = WordEndingVowel.LONG_VOWEL
+
     def matches(self, verb, pronoun):
         return verb in DUMMY_N and pronoun == Pronoun.THIRD_PLURAL_INANIMATE
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVowel.LONG_VOWEL, pronoun)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
     
 class EndDorNIndPos(IndependentAffirmativeRule):
+    category = WordEndingVII.D_N
+
     def matches(self, verb, pronoun):
         return ends_with_d_or_n(verb)
-
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVII.D_N, pronoun)
     
 class EndLongVowelIndPos(IndependentAffirmativeRule):
+    category = WordEndingVowel.LONG_VOWEL
+
     def matches(self, verb, pronoun):
         return ends_with_long_vowel(verb)
-        
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVowel.LONG_VOWEL, pronoun)
     
 class EndShortVowelIndPos(IndependentAffirmativeRule):
+    category = WordEndingVowel.SHORT_VOWEL
+
     def matches(self, verb, pronoun):
         return ends_with_short_vowel(verb)
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVowel.SHORT_VOWEL, pronoun)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
     
-class IndependentNegativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-    
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class IndependentNegativeRule(Rule):
+    form = Form.INDEPENDENT_CLAUSE
+    negation = Negation.NEGATIVE
     
 class EndDorDummyNIndNeg(IndependentNegativeRule):
+    category = WordEndingVII.D_VOWEL
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.D) or verb in DUMMY_N
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.INDEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVII.D_VOWEL, pronoun)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
 
 class EndNIndNeg(IndependentNegativeRule):
+    category = WordEndingVII.N
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.N)
     
-    def apply(self, verb, pronoun):
-        category = WordEndingVII.N
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE, Negation.NEGATIVE, category, pronoun)
-    
 class EndVowelIndNeg(IndependentNegativeRule):
+    category = WordEndingVII.D_VOWEL
+
     def matches(self, verb, pronoun):
         return ends_with_vowel(verb)
     
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.INDEPENDENT_CLAUSE,  Negation.NEGATIVE, WordEndingVII.D_VOWEL, pronoun)
-    
-class DependentAffirmativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-    
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class DependentAffirmativeRule(Rule):
+    form = Form.DEPENDENT_CLAUSE
+    negation = Negation.AFFIRMATIVE
     
 class ENdDDepPos(DependentAffirmativeRule):
+    category = WordEndingVII.D_N
+    key = WordEndingVII.D
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.D) and pronoun in (Pronoun.THIRD_SINGULAR_INANIMATE, Pronoun.THIRD_PLURAL_INANIMATE)
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVII.D_N, pronoun, key = WordEndingVII.D)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
     
 class EndDummyNDepPos(DependentAffirmativeRule):
+    category = WordEndingVII.D_N
+    key = WordEndingVII.N
+
     def matches(self, verb, pronoun):
         return verb in DUMMY_N
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVII.D_N, pronoun, key = WordEndingVII.N)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
     
 class EndNDepPos(DependentAffirmativeRule):
+    category = WordEndingVII.D_N
+    key = WordEndingVII.N
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.N)
     
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVII.D_N, pronoun, key = WordEndingVII.N)
-    
 class ENdVowelDepPos(DependentAffirmativeRule):
+    category = WordEndingVowel.VOWEL
+
     def matches(self, verb, pronoun):
         return ends_with_vowel(verb)
     
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.AFFIRMATIVE, WordEndingVowel.VOWEL, pronoun)
-    
-class DependentNegativeRule:
-    def matches(self, verb: str, pronoun: str) -> bool:
-        raise NotImplementedError
-    
-    def apply(self, verb: str, pronoun: str) -> tuple[str, str]:
-        raise NotImplementedError
+class DependentNegativeRule(Rule):
+    form = Form.DEPENDENT_CLAUSE
+    negation = Negation.NEGATIVE
     
 class EndDorDummyNDepNeg(DependentNegativeRule):
+    category = WordEndingVII.D_VOWEL
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.D) or verb in DUMMY_N
     
-    def apply(self, verb, pronoun):
-        return remove_final_letter(verb), get_suffix(Form.DEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVII.D_VOWEL, pronoun)
+    def edit(self, verb, pronoun):
+        return remove_final_letter(verb)
     
 class EndNDepNeg(DependentNegativeRule):
+    category = WordEndingVII.N
+
     def matches(self, verb, pronoun):
         return verb.endswith(WordEndingVII.N)
     
-    def apply(self, verb, pronoun):
-        category = WordEndingVII.N
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.NEGATIVE, category, pronoun)
-    
 class EndVowelDepNeg(DependentNegativeRule):
+    category = WordEndingVII.D_VOWEL
+
     def matches(self, verb, pronoun):
         return ends_with_vowel(verb)
-    
-    def apply(self, verb, pronoun):
-        return verb, get_suffix(Form.DEPENDENT_CLAUSE, Negation.NEGATIVE, WordEndingVII.D_VOWEL, pronoun)
 
 # --- 4. Rule Registry --- 
 INDEPENDENT_AFFIRMATIVE_RULES = [
@@ -371,7 +304,57 @@ DEPENDENT_NEGATIVE_RULES = [
     EndVowelDepNeg()
 ]
 
-# --- 5. Main Logic Functions ---
+RULE_REGISTRY = {
+    (Form.INDEPENDENT_CLAUSE, False): INDEPENDENT_AFFIRMATIVE_RULES,
+    (Form.INDEPENDENT_CLAUSE, True): INDEPENDENT_NEGATIVE_RULES,
+    (Form.DEPENDENT_CLAUSE, False): DEPENDENT_AFFIRMATIVE_RULES,
+    (Form.DEPENDENT_CLAUSE, True): DEPENDENT_NEGATIVE_RULES
+}
+
+# --- 5. Ending-Class Dispatch ---
+def classify_ending(verb: str) -> EndingClass:
+    # Dummy-n is lexical, so it must be checked before the plain "n" ending.
+    if verb in DUMMY_N:
+        return EndingClass.DUMMY_N
+    if verb.endswith(D_ENDING):
+        return EndingClass.D
+    if verb.endswith(N_ENDING):
+        return EndingClass.N
+    if verb.endswith(LONG_VOWEL_ENDINGS):
+        return EndingClass.LONG_VOWEL
+    if verb.endswith(SHORT_VOWEL_ENDINGS):
+        return EndingClass.SHORT_VOWEL
+    return EndingClass.OTHER
+
+# Sample stems used to compile the dispatch table; every sample of a class must pick the same rule.
+ENDING_CLASS_SAMPLES = {
+    EndingClass.DUMMY_N: tuple(sorted(DUMMY_N))[:3],
+    EndingClass.D: ("bad", "baad"),
+    EndingClass.N: ("ban", "bin", "boon"),
+    EndingClass.LONG_VOWEL: tuple("b" + ending for ending in LONG_VOWEL_ENDINGS),
+    EndingClass.SHORT_VOWEL: tuple("b" + ending for ending in SHORT_VOWEL_ENDINGS),
+    EndingClass.OTHER: ("bam", "bag", "")
+}
+
+DISPATCHER = RuleDispatcher(RULE_REGISTRY, classify_ending, ENDING_CLASS_SAMPLES, [pronoun.value for pronoun in Pronoun])
+
+def plan_entry(form: str, neg: bool, direct_object: str | None, ending_class: str, pronoun: str) -> tuple | None:
+    """
+    (stem edit, suffix) shared by every vii verb of ending_class in one cell, for the bulk planner (planner.py).
+    The edit takes the verb, or is None when the stem is kept; None when the cell has to run verb by verb
+    (a pronoun outside the compiled table, or no matching rule).
+    """
+    # get_vii_parts runs every non-independent form through the dependent rules.
+    form = Form.INDEPENDENT_CLAUSE if form == Form.INDEPENDENT_CLAUSE else Form.DEPENDENT_CLAUSE
+    entry = DISPATCHER.table.get((form, bool(neg), ending_class, pronoun))
+    if entry is None:
+        return None
+    rule, suffix = entry
+    if type(rule).edit is Rule.edit:
+        return None, suffix
+    return (lambda verb: rule.edit(verb, pronoun)), suffix
+
+# --- 6. Main Logic Functions ---
 def handle_independent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
     if not neg:
         return handle_independent_affirmative(verb, pronoun)
@@ -379,15 +362,15 @@ def handle_independent(verb: str, neg: bool, pronoun: str) -> tuple[str, str]:
         return handle_independent_negative(verb, pronoun)
 
 def handle_independent_affirmative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in INDEPENDENT_AFFIRMATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
+    entry = DISPATCHER.find(Form.INDEPENDENT_CLAUSE, False, verb, pronoun)
+    if entry:
+        return apply_entry(entry, verb, pronoun)
     return verb, ""
     
 def handle_independent_negative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in INDEPENDENT_NEGATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
+    entry = DISPATCHER.find(Form.INDEPENDENT_CLAUSE, True, verb, pronoun)
+    if entry:
+        return apply_entry(entry, verb, pronoun)
     return verb, ""
 
 def handle_dependent(verb: str, neg: str, pronoun: str) -> tuple[str, str]:
@@ -397,19 +380,23 @@ def handle_dependent(verb: str, neg: str, pronoun: str) -> tuple[str, str]:
         return handle_dependent_negative(verb, pronoun)
     
 def handle_dependent_affirmative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in DEPENDENT_AFFIRMATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
+    entry = DISPATCHER.find(Form.DEPENDENT_CLAUSE, False, verb, pronoun)
+    if entry:
+        return apply_entry(entry, verb, pronoun)
     return verb, ""
     
 def handle_dependent_negative(verb: str, pronoun: str) -> tuple[str, str]:
-    for rule in DEPENDENT_NEGATIVE_RULES:
-        if rule.matches(verb, pronoun):
-            return rule.apply(verb, pronoun)
+    entry = DISPATCHER.find(Form.DEPENDENT_CLAUSE, True, verb, pronoun)
+    if entry:
+        return apply_entry(entry, verb, pronoun)
 
-def get_vii_suffix(input_data: ConjugationInput) -> str:
+def apply_entry(entry: tuple, verb: str, pronoun: str) -> tuple[str, str]:
+    rule, suffix = entry
+    return rule.edit(verb, pronoun), suffix
+
+def get_vii_parts(input_data: ConjugationInput) -> tuple[str, str]:
     """
-    Pure function that returns vii conjugation:
+    Pure function that returns the unstyled (stem, suffix) pair of a vii conjugation:
       form: independent, dependent
       negation: true, false
     """
@@ -421,15 +408,36 @@ def get_vii_suffix(input_data: ConjugationInput) -> str:
     pronoun = input_data.pronoun
 
     if type != "vii":
-        return verb
+        return verb, ""
     
     if form == Form.INDEPENDENT_CLAUSE:
         verb, suffix = handle_independent(verb, neg, pronoun)
     else:
         verb, suffix = handle_dependent(verb, neg, pronoun)
 
+    return verb, suffix
+
+def get_suffix_key(input_data: ConjugationInput) -> tuple | None:
+    """The VII_SUFFIX_MAP entry get_vii_parts reads for this input; None when no rule applies."""
+    form = Form.INDEPENDENT_CLAUSE if input_data.form == Form.INDEPENDENT_CLAUSE else Form.DEPENDENT_CLAUSE
+    entry = DISPATCHER.find(form, bool(input_data.negation), input_data.verb, input_data.pronoun)
+    return entry[0].table_key(input_data.pronoun) if entry else None
+
+@memoize(input_key)
+def get_vii_suffix(input_data: ConjugationInput | CompactInput) -> str:
+    """
+    Pure function that returns vii conjugation:
+      form: independent, dependent
+      negation: true, false
+    """
+    input_data = full_input(input_data)
+    verb, suffix = get_vii_parts(input_data)
+
     # green = affirmative, red = negative
     # regular = independent, italic = dependent, bold = imperative, underline = direct object
-    style = get_style(form, neg)
+    style = get_style(input_data.form, input_data.negation)
+
+    return verb + styled_text(suffix, style)
 
-    return verb + styled_text(suffix, style)
\ No newline at end of file
+# Last, so hooks see the finished module (see hooks.py).
+suffix_module_loaded("vii", sys.modules[__name__])
@@ -1,10 +1,20 @@
-# This file contains the core functionality of the program: the VAI (Verb Animate Intransitive) conjugation logic.
-# Implements all logic rules (suffixes, vowel handling, pronoun mapping).
+# This file contains the core functionality of the program: the VTI (Verb Transitive Inanimate) conjugation logic.
+# Implements all logic rules (suffixes, stem edits, pronoun mapping) as a declarative rule table,
+# compiled at import into a direct (form, negation, object, ending class, pronoun) -> (stem edit, suffix) lookup.
 # Takes in data (via models.py), applies logic, and returns results.
 # Should be pure and testable — no printing, user interaction, or I/O.
 
-from .models import ConjugationInput
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+from .enum import EndingClass, Form, Pronoun
+from .models import CompactInput, ConjugationInput, full_input
 from .utils import styled_text
+from .hooks import suffix_module_loaded
+from .cache import memoize, input_key
+
+# --- 1. Constants ---
 
 PRONOUN_SUFFIX_MAP = {
     "independent": {
@@ -149,230 +159,148 @@ PRONOUN_SUFFIX_MAP = {
     }
 }
 
-def get_vti_suffix(input_data: ConjugationInput) -> str:
+ALL_PRONOUNS = tuple(pronoun.value for pronoun in Pronoun if pronoun.value not in ("0s", "0p"))
+NON_THIRD_SINGULAR = tuple(pronoun for pronoun in ALL_PRONOUNS if pronoun != Pronoun.THIRD_SINGULAR_ANIMATE.value)
+FIRST_PLURALS = (Pronoun.FIRST_PLURAL_EXC_ANIMATE.value, Pronoun.FIRST_PLURAL_INC_ANIMATE.value)
+NON_FIRST_PLURALS = tuple(pronoun for pronoun in ALL_PRONOUNS if pronoun not in FIRST_PLURALS)
+OBJECTS = ("singular", "plural")
+
+# Plain string values: the classes are hashed on every lookup, and str hashing is much faster than Enum.__hash__.
+AAN, AN, OON, IN, OTHER = (ending.value for ending in (EndingClass.AAN, EndingClass.AN, EndingClass.OON, EndingClass.IN, EndingClass.OTHER))
+THREE_LETTER_ENDINGS = {"aan": AAN, "oon": OON}
+TWO_LETTER_ENDINGS = {"an": AN, "in": IN}
+AN_ENDINGS = (AAN, AN)
+OON_IN_ENDINGS = (OON, IN)
+
+# --- 2. Helpers ---
+# A lexicon has few distinct verbs and each is classified once per cell, so the class is cached per verb.
+@lru_cache(maxsize=8192)
+def classify_ending(verb: str) -> str:
+    # Checking the last three letters first keeps -aan out of -an (every -aan verb also ends in -an).
+    return THREE_LETTER_ENDINGS.get(verb[-3:]) or TWO_LETTER_ENDINGS.get(verb[-2:], OTHER)
+
+def keep(verb: str) -> str:
+    return verb
+
+def remove_final_letter(verb: str) -> str:
+    return verb[:-1]
+
+def replace_final_with_m(verb: str) -> str:
+    return verb[:-1] + "m"
+
+def lengthen_final_an(verb: str) -> str:
+    # mikan -> mikaan
+    return verb[:-1] + "an"
+
+# --- 3. Rule Table ---
+@dataclass(frozen=True)
+class Rule:
+    # A rule covers every (ending class, pronoun) pair it lists, for both objects, and reads
+    # its suffix from PRONOUN_SUFFIX_MAP[form][...][negation][category].
+    form: str
+    negation: bool
+    endings: tuple[str, ...]
+    pronouns: tuple[str, ...]
+    category: str
+    edit: Callable[[str], str] = keep
+
+    def object_key(self, obj: str) -> str:
+        # Only the independent order has separate singular/plural object tables.
+        return obj if self.form == Form.INDEPENDENT_CLAUSE else "singular_plural"
+
+    def suffix(self, obj: str, pronoun: str) -> str:
+        suffix = PRONOUN_SUFFIX_MAP[self.form][self.object_key(obj)][self.negation][self.category].get(pronoun, "")
+        if isinstance(suffix, list):
+            # Imperative 21 has one suffix per object: [singular, plural].
+            return suffix[0] if obj == "singular" else suffix[1]
+        return suffix
+
+    def table_key(self, obj: str, pronoun: str) -> tuple:
+        # The PRONOUN_SUFFIX_MAP entry suffix() reads, for change tracking (dependencies.py).
+        return "PRONOUN_SUFFIX_MAP", self.form, self.object_key(obj), self.negation, self.category, pronoun
+
+INDEPENDENT, DEPENDENT, IMPERATIVE = Form.INDEPENDENT_CLAUSE.value, Form.DEPENDENT_CLAUSE.value, Form.IMPERATIVE.value
+
+VTI_RULES = [
+    # Independent positive
+    Rule(INDEPENDENT, False, (AAN,) + OON_IN_ENDINGS, NON_FIRST_PLURALS, "an_aan_oon_in"),
+    Rule(INDEPENDENT, False, (AN,), NON_FIRST_PLURALS, "an_aan_oon_in", lengthen_final_an),
+    Rule(INDEPENDENT, False, AN_ENDINGS + OON_IN_ENDINGS, FIRST_PLURALS, "an_aan_oon_in", remove_final_letter),
+    # Independent negative
+    Rule(INDEPENDENT, True, AN_ENDINGS, ALL_PRONOUNS, "an_aan"),
+    Rule(INDEPENDENT, True, OON_IN_ENDINGS, ALL_PRONOUNS, "oon_in", remove_final_letter),
+    # Dependent positive
+    Rule(DEPENDENT, False, AN_ENDINGS, (Pronoun.THIRD_SINGULAR_ANIMATE.value,), "an_aan"),
+    Rule(DEPENDENT, False, AN_ENDINGS, NON_THIRD_SINGULAR, "an_aan", replace_final_with_m),
+    Rule(DEPENDENT, False, (OON,), ALL_PRONOUNS, "oon_in", remove_final_letter),
+    Rule(DEPENDENT, False, (IN,), (Pronoun.THIRD_SINGULAR_ANIMATE.value,), "oon_in"),
+    Rule(DEPENDENT, False, (IN,), NON_THIRD_SINGULAR, "oon_in", replace_final_with_m),
+    # Dependent negative
+    Rule(DEPENDENT, True, AN_ENDINGS, ALL_PRONOUNS, "an_aan"),
+    Rule(DEPENDENT, True, OON_IN_ENDINGS, ALL_PRONOUNS, "oon_in", remove_final_letter),
+    # Imperative positive
+    Rule(IMPERATIVE, False, AN_ENDINGS, ("2s", "21"), "an_aan"),
+    Rule(IMPERATIVE, False, AN_ENDINGS, ("2p",), "an_aan", replace_final_with_m),
+    Rule(IMPERATIVE, False, OON_IN_ENDINGS, ("2s",), "oon_in"),
+    Rule(IMPERATIVE, False, OON_IN_ENDINGS, ("21", "2p"), "oon_in", remove_final_letter),
+    # Imperative negative
+    Rule(IMPERATIVE, True, AN_ENDINGS, ("2s", "21"), "an_aan"),
+    Rule(IMPERATIVE, True, AN_ENDINGS, ("2p",), "an_aan", replace_final_with_m),
+    Rule(IMPERATIVE, True, OON_IN_ENDINGS, ("2s", "21", "2p"), "oon_in", remove_final_letter),
+]
 
+# --- 4. Compiled Lookup ---
+NO_RULE = (keep, "")
+
+def compile_rules(rules: list[Rule]) -> dict:
+    """(form, negation, object, ending class, pronoun) -> (stem edit, suffix); the first listed rule wins."""
+    table = {}
+    for rule in rules:
+        for ending in rule.endings:
+            for pronoun in rule.pronouns:
+                for obj in OBJECTS:
+                    table.setdefault((rule.form, rule.negation, obj, ending, pronoun), (rule.edit, rule.suffix(obj, pronoun)))
+    return table
+
+def compile_rule_index(rules: list[Rule]) -> dict:
+    """Same keys as compile_rules, mapped to the winning rule itself."""
+    index = {}
+    for rule in rules:
+        for ending in rule.endings:
+            for pronoun in rule.pronouns:
+                for obj in OBJECTS:
+                    index.setdefault((rule.form, rule.negation, obj, ending, pronoun), rule)
+    return index
+
+RULE_TABLE = compile_rules(VTI_RULES)
+RULE_INDEX = compile_rule_index(VTI_RULES)
+
+def plan_entry(form: str, neg: bool, direct_object: str | None, ending_class: str, pronoun: str) -> tuple:
+    """(stem edit or None to keep the stem, suffix) shared by every vti verb of ending_class in one cell, for planner.py."""
+    edit, suffix = RULE_TABLE.get((form, bool(neg), direct_object, ending_class, pronoun), NO_RULE)
+    return (None if edit is keep else edit), suffix
+
+# --- 5. Main Logic Functions ---
+def get_vti_parts(input_data: ConjugationInput) -> tuple[str, str]:
+    """Returns the unstyled (stem, suffix) pair of a vti conjugation; (verb, "") when no rule applies."""
     verb = input_data.verb
-    form = input_data.form
     neg = input_data.negation
-    pronoun = input_data.pronoun
-    obj = input_data.direct_object
+    key = (input_data.form, neg if neg.__class__ is bool else bool(neg), input_data.direct_object, classify_ending(verb), input_data.pronoun)
+    edit, suffix = RULE_TABLE.get(key, NO_RULE)
+    return (verb if edit is keep else edit(verb)), suffix
 
-    suffix = ""
-    base = verb
+def get_suffix_key(input_data: ConjugationInput) -> tuple | None:
+    """The PRONOUN_SUFFIX_MAP entry get_vti_parts reads for this input; None when no rule applies."""
+    obj = input_data.direct_object
+    rule = RULE_INDEX.get((input_data.form, bool(input_data.negation), obj, classify_ending(input_data.verb), input_data.pronoun))
+    return rule.table_key(obj, input_data.pronoun) if rule else None
 
-    if form == "independent":
-        if obj == "singular":
-            if not neg:
-                if verb.endswith("aan"):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                elif verb.endswith("an"):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        base = verb[:-1] + "an"
-                        if pronoun in ("1s", "2s", "3s"):
-                            suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                        elif pronoun in ("2p", "3p"):
-                            suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-            else:
-                if verb.endswith("an"):
-                    if pronoun in ("1s", "2s", "3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")):
-                    base = verb[:-1]
-                    if pronoun in ("1s", "2s", "3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-        else:
-            if not neg:
-                if verb.endswith("aan"):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                elif verb.endswith("an"):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        base = verb[:-1] + "an"
-                        if pronoun in ("1s", "2s", "3s"):
-                            suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                        elif pronoun in ("2p", "3p"):
-                            suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")):
-                    if pronoun in ("1s", "2s", "3s", "2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        base = verb[:-1]
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan_oon_in"].get(pronoun, "")
-            else:
-                if verb.endswith("an"):
-                    if pronoun in ("1s", "2s", "3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")):
-                    base = verb[:-1]
-                    if pronoun in ("1s", "2s", "3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p", "21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2p", "3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form][obj][neg]["oon_in"].get(pronoun, "")
-    
-    elif form == "dependent":
-        if obj in ("singular", "plural"):
-            if not neg:
-                if verb.endswith(("an", "aan")):
-                    if pronoun in ("1s", "2s", "1p", "21", "2p", "3p"):
-                        base = verb[:-1] + styled_text("m", "underline")
-                        if pronoun == "1s":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                        elif pronoun == "2s":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                        elif pronoun == "1p":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                        elif pronoun == "21":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                        elif pronoun == "2p":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                        elif pronoun == "3p":
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun == "3s":
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith("oon"):
-                    base = verb[:-1]
-                    if pronoun in ("1s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                elif verb.endswith("in"):
-                    if pronoun != "3s":
-                        base = verb[:-1] + styled_text("m", "underline")
-                        if pronoun in ("1s"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                        elif pronoun in ("2s"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                        elif pronoun in ("1p"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                        elif pronoun in ("21"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                        elif pronoun in ("2p"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                        elif pronoun in ("3p"):
-                            suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun == "3s":
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-            else:
-                if verb.endswith(("an", "aan")):
-                    if pronoun in ("1s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("2s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("1p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("2p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                    elif pronoun in ("3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")):
-                    base = verb[:-1]
-                    if pronoun in ("1s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("3s"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("1p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("21"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("2p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                    elif pronoun in ("3p"):
-                        suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-    
-    elif form == "imperative":
-        if obj in ("singular", "plural"):
-            if not neg:
-                if verb.endswith(("an", "aan")) and pronoun in ("2s", "2p"):
-                    if pronoun == "2p":
-                        base = verb[:-1] + styled_text("m", "underline")
-                    suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith(("an", "aan")) and pronoun == "21":
-                    suffix_list = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, [])
-                    if isinstance(suffix_list, list):
-                        suffix = suffix_list[0] if obj == "singular" else suffix_list[1]
-                    else:
-                        suffix = suffix_list
-                if verb.endswith(("oon", "in")) and pronoun in ("2s", "2p"):
-                    if pronoun == "2p":
-                        base = verb[:-1]
-                    suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")) and pronoun == "21":
-                    base = verb[:-1]
-                    suffix_list = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, [])
-                    if isinstance(suffix_list, list):
-                        suffix = suffix_list[0] if obj == "singular" else suffix_list[1]
-                    else:
-                        suffix = suffix_list
-            else:
-                if verb.endswith(("an", "aan")) and pronoun in ("2s", "2p"):
-                    if pronoun == "2p":
-                        base = verb[:-1] + styled_text("m", "underline")
-                    suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, "")
-                elif verb.endswith(("an", "aan")) and pronoun == "21":
-                    suffix_list = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["an_aan"].get(pronoun, [])
-                    if isinstance(suffix_list, list):
-                        suffix = suffix_list[0] if obj == "singular" else suffix_list[1]
-                    else:
-                        suffix = suffix_list
-                if verb.endswith(("oon", "in")) and pronoun in ("2s", "2p"):
-                    base = verb[:-1]
-                    suffix = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, "")
-                elif verb.endswith(("oon", "in")) and pronoun == "21":
-                    base = verb[:-1]
-                    suffix_list = PRONOUN_SUFFIX_MAP[form]["singular_plural"][neg]["oon_in"].get(pronoun, [])
-                    if isinstance(suffix_list, list):
-                        suffix = suffix_list[0] if obj == "singular" else suffix_list[1]
-                    else:
-                        suffix = suffix_list
+@memoize(input_key)
+def get_vti_suffix(input_data: ConjugationInput | CompactInput) -> str:
+    input_data = full_input(input_data)
+    base, suffix = get_vti_parts(input_data)
+    form = input_data.form
+    neg = input_data.negation
 
     if form == "independent" and neg == False:
         return base + styled_text(suffix, "green_normal")
@@ -387,4 +315,7 @@ def get_vti_suffix(input_data: ConjugationInput) -> str:
     if form == "imperative" and neg == False:
         return base + styled_text(suffix, "green_bold")
     if form == "imperative" and neg == True:
-        return base + styled_text(suffix, "red_bold")
\ No newline at end of file
+        return base + styled_text(suffix, "red_bold")
+
+# Last, so hooks see the finished module (see hooks.py).
+suffix_module_loaded("vti", sys.modules[__name__])
@@ -0,0 +1,28 @@
+# This is the entry point for bulk paradigm export.
+# Reads a 'verb<TAB>type' list and writes every paradigm cell as JSONL or CSV rows.
+# Run from verb_affixes/:  python export-main.py verbs.tsv paradigms.jsonl --workers 8
+
+import argparse
+import logging
+import time
+from conjugator.export import EXPORT_FORMATS, export_paradigms, read_verb_list
+
+logging.basicConfig(level=logging.INFO)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the full paradigm of every verb in a list.")
+    parser.add_argument("verbs", help="file of 'verb<TAB>type' lines (type is vai, vii or vti)")
+    parser.add_argument("output", help="file to write")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--chunksize", type=int, default=8, help="verbs per worker task")
+    args = parser.parse_args()
+
+    entries = read_verb_list(args.verbs)
+    start = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8", newline="") as out:
+        written = export_paradigms(entries, out, args.format, args.workers, args.chunksize)
+    logging.info(f"exported {written}/{len(entries)} verbs to {args.output} in {time.perf_counter() - start:.2f}s")
+
+if __name__ == "__main__":
+    main()
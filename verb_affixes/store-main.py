@@ -0,0 +1,54 @@
+# This is the entry point for building the precomputed paradigm store.
+# Reads a 'verb<TAB>type' list and materialises every paradigm into a SQLite database or a binary table,
+# or every surface form into a spell-check DAWG.
+# Run from verb_affixes/:  python store-main.py verbs.tsv paradigms.sqlite
+#                          python store-main.py verbs.tsv paradigms.bin --format binary
+#                          python store-main.py verbs.tsv forms.dawg --format dawg
+#                          python store-main.py verbs.tsv paradigms.sqlite --incremental
+
+import argparse
+import logging
+import time
+from conjugator.binary_table import write_paradigm_table
+from conjugator.dawg import write_surface_dawg
+from conjugator.export import read_verb_list
+from conjugator.store import DEFAULT_BATCH_SIZE, ParadigmStore
+
+logging.basicConfig(level=logging.INFO)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed paradigm store for a verb list.")
+    parser.add_argument("verbs", help="file of 'verb<TAB>type' lines (type is vai, vii or vti)")
+    parser.add_argument("database", help="SQLite file to create or update, or binary table or DAWG to write")
+    parser.add_argument("--format", choices=("sqlite", "binary", "dawg"), default="sqlite",
+                        help="binary writes a memory-mapped table for fast cold start (see conjugator/binary_table.py); "
+                             "dawg writes the surface forms only, for membership and spelling suggestions (see conjugator/dawg.py)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="rows per insert transaction")
+    parser.add_argument("--incremental", action="store_true",
+                        help="sqlite only: regenerate just the stored cells whose tables changed since the last build, "
+                             "then add the listed lemmas that are not stored yet")
+    args = parser.parse_args()
+
+    entries = read_verb_list(args.verbs)
+    # Lemmas whose paradigm fails are logged and skipped; the build carries on.
+    skipped = []
+    start = time.perf_counter()
+    if args.format == "binary":
+        built = write_paradigm_table(entries, args.database, skipped)
+    elif args.format == "dawg":
+        forms = write_surface_dawg(entries, args.database, skipped=skipped)
+        logging.info(f"stored {forms} surface forms in {args.database} in {time.perf_counter() - start:.2f}s, "
+                     f"skipped {len(skipped)} lemmas")
+        return
+    elif args.incremental:
+        with ParadigmStore(args.database) as store:
+            stats = store.rebuild(args.batch_size)
+            logging.info(f"{stats.changed_keys} table entries changed: refreshed {stats.slots} slots, rebuilt {stats.lemmas} lemmas")
+            built = store.build([entry for entry in entries if entry not in store], args.batch_size, skipped)
+    else:
+        with ParadigmStore(args.database) as store:
+            built = store.build(entries, args.batch_size, skipped)
+    logging.info(f"stored {built} lemmas in {args.database} in {time.perf_counter() - start:.2f}s, skipped {len(skipped)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import pytest
+from conjugator.analyzer import Analyzer
+from conjugator.models import Analysis
+from conjugator.paradigm import conjugate_paradigm_forms
+
+ENTRIES = [("nibaa", "vai"), ("ikido", "vai"), ("onaagoshin", "vii"), ("miijin", "vti")]
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return Analyzer(ENTRIES)
+
+@pytest.mark.parametrize("word, expected", [
+    ("nindikidosiimin", Analysis("ikido", "vai", "independent", True, "present", "1p")),
+    ("ningii-nibaa", Analysis("nibaa", "vai", "independent", False, "past", "1s")),
+    ("NINGIINIBAA", Analysis("nibaa", "vai", "independent", False, "past", "1s")),
+])
+def test_analyze(analyzer, word, expected):
+    assert analyzer.analyze(word) == [expected]
+
+def test_ambiguous_form_returns_every_analysis(analyzer):
+    # 0s and 0p share the independent negative suffix.
+    assert analyzer.analyze("gii-onaagoshisinoon") == [
+        Analysis("onaagoshin", "vii", "independent", True, "past", "0s"),
+        Analysis("onaagoshin", "vii", "independent", True, "past", "0p"),
+    ]
+
+def test_unknown_form(analyzer):
+    assert analyzer.analyze("waabam") == []
+    assert "waabam" not in analyzer
+
+@pytest.mark.parametrize("verb, verb_type", ENTRIES)
+def test_every_generated_surface_analyzes_back(analyzer, verb, verb_type):
+    for form in conjugate_paradigm_forms(verb, verb_type):
+        expected = Analysis(verb, verb_type, form.form, form.negation, form.tense, form.pronoun, form.direct_object)
+        for surface in form.render_all():
+            assert expected in analyzer.analyze(surface)
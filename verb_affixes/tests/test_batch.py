@@ -0,0 +1,58 @@
+import itertools
+import pytest
+import sys
+from conjugator.enum import Form, Pronoun, Tense
+from conjugator.models import CompactInput, ConjugationInput, ConjugationError
+from conjugator.paradigm import conjugate_paradigm_forms
+from conjugator.pipeline import conjugate, conjugate_many
+
+def paradigm_inputs(verb: str, verb_type: str) -> list[ConjugationInput]:
+    return [ConjugationInput(type=verb_type, form=form.form, verb=verb, pronoun=form.pronoun, tense=form.tense,
+                             negation=form.negation, direct_object=form.direct_object)
+            for form in conjugate_paradigm_forms(verb, verb_type)]
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 1000])
+@pytest.mark.parametrize("verb, verb_type", [("nibaa", "vai"), ("dagwaagin", "vii"), ("miijin", "vti")])
+def test_conjugate_many_matches_conjugate(verb, verb_type, chunk_size):
+    inputs = paradigm_inputs(verb, verb_type)
+    assert list(conjugate_many(inputs, chunk_size)) == [conjugate(input_data) for input_data in inputs]
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_errors_are_values_in_input_order(chunk_size):
+    inputs = [
+        ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1s", tense="present"),
+        ConjugationInput(type="vta", form="independent", verb="waabam", pronoun="1s", tense="present"),
+        ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="3s", tense="past"),
+    ]
+    results = list(conjugate_many(inputs, chunk_size))
+    assert [result.render() for result in (results[0], results[2])] == ["ninibaa", "gii-nibaa"]
+    assert isinstance(results[1], ConjugationError)
+    assert results[1].input is inputs[1]
+    assert results[1].message == "ValueError: Unsupported verb type 'vta'"
+
+def test_streams_lazily():
+    inputs = itertools.repeat(ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1s", tense="present"))
+    results = conjugate_many(inputs, chunk_size=10)
+    assert [result.render() for result in itertools.islice(results, 25)] == ["ninibaa"] * 25
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        conjugate_many([], chunk_size=0)
+
+@pytest.mark.parametrize("chunk_size", [None, 7])
+@pytest.mark.parametrize("verb, verb_type", [("nibaa", "vai"), ("dagwaagin", "vii"), ("miijin", "vti")])
+def test_compact_inputs_conjugate_like_full_inputs(verb, verb_type, chunk_size):
+    inputs = paradigm_inputs(verb, verb_type)
+    compact = [input_data.compact() for input_data in inputs]
+    assert [c.decode() for c in compact] == inputs
+    assert list(conjugate_many(compact, chunk_size)) == [conjugate(input_data) for input_data in inputs]
+
+def test_compact_input_encoding():
+    compact = CompactInput.encode("vti", Form.IMPERATIVE, "".join(["mii", "jin"]), True, Tense.PRESENT,
+                                  Pronoun.FIRST_PLURAL_INC_ANIMATE, "plural")
+    assert compact == (2, 2, "miijin", True, 2, 5, 2)
+    assert compact.verb is sys.intern("miijin")
+    assert {compact: 1}[compact.decode().compact()] == 1
+    assert compact.cache_key() is compact
+    with pytest.raises(ValueError, match="Unknown feature value 'vta'"):
+        CompactInput.encode("vta", "independent", "waabam")
@@ -0,0 +1,60 @@
+import pytest
+from conjugator.binary_table import ParadigmTable, cell_key, decode_cell_key, write_paradigm_table
+from conjugator.paradigm import conjugate_paradigm_forms
+
+ENTRIES = [("nibaa", "vai"), ("ikido", "vai"), ("onaagoshin", "vii"), ("miijin", "vti"), ("nibaa", "vai")]
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "paradigms.bin"
+    assert write_paradigm_table(ENTRIES, path) == 4
+    with ParadigmTable(path) as table:
+        yield table
+
+@pytest.mark.parametrize("verb, verb_type", ENTRIES)
+def test_table_paradigm_matches_generation(table, verb, verb_type):
+    assert (verb, verb_type) in table
+    assert table.paradigm(verb, verb_type) == conjugate_paradigm_forms(verb, verb_type)
+
+@pytest.mark.parametrize("args, expected", [
+    (("nibaa", "vai", "independent", False, "past", "3s"), "gii-nibaa"),
+    (("ikido", "vai", "independent", True, "present", "1p"), "indikidosiimin"),
+    (("onaagoshin", "vii", "dependent", False, "present", "0p"), None),
+    (("miijin", "vti", "imperative", True, "present", "21", "plural"), None),
+])
+def test_lookup_matches_generation(table, args, expected):
+    verb, verb_type, form, neg, tense, pronoun, *obj = args
+    cell = (form, neg, tense, pronoun, obj[0] if obj else None)
+    generated = next(f for f in conjugate_paradigm_forms(verb, verb_type)
+                     if (f.form, f.negation, f.tense, f.pronoun, f.direct_object) == cell)
+    assert table.lookup(*args) == generated
+    if expected is not None:
+        assert table.lookup(*args).render() == expected
+
+@pytest.mark.parametrize("args", [
+    ("waabam", "vta", "independent", False, "present", "1s"),
+    ("waabi", "vai", "independent", False, "present", "1s"),
+    ("nibaa", "vai", "imperative", False, "present", "3p"),
+    ("nibaa", "vai", "independent", False, "present", "0s"),
+])
+def test_lookup_miss(table, args):
+    assert table.lookup(*args) is None
+
+def test_cell_key_round_trip():
+    features = ("dependent", True, "conditional", "21", "plural")
+    assert decode_cell_key(cell_key(*features)) == features
+    with pytest.raises(ValueError, match="not representable"):
+        cell_key("conjunct", False, "present", "1s", None)
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError, match="not a version 1 paradigm table"):
+        ParadigmTable(path)
+
+def test_failing_lemma_is_skipped(tmp_path):
+    path, skipped = tmp_path / "paradigms.bin", []
+    assert write_paradigm_table([("nibaa", "vai"), ("sagaswaa", "vai"), ("ikido", "vai")], path, skipped) == 2
+    assert skipped == [("sagaswaa", "vai")]
+    with ParadigmTable(path) as table:
+        assert ("ikido", "vai") in table and ("sagaswaa", "vai") not in table
@@ -0,0 +1,89 @@
+import threading
+import pytest
+from conjugator import cache
+from conjugator.cache import ConjugationCache, configure_cache, clear_cache, cache_stats
+from conjugator.lazy import load_attribute
+from conjugator.models import ConjugationInput
+from conjugator.vai_suffixes_core import get_vai_suffix
+from conjugator.pronoun_prefix_core import get_pronoun_prefix
+
+@pytest.fixture
+def enabled_cache():
+    configure_cache(maxsize=128)
+    clear_cache()
+    yield
+    clear_cache()
+    configure_cache(maxsize=cache.DEFAULT_MAXSIZE, enabled=False)
+
+def test_lru_eviction_and_stats():
+    lru = ConjugationCache(maxsize=2)
+    lru.store("a", 1)
+    lru.store("b", 2)
+    assert lru.lookup("a") == (True, 1)
+    lru.store("c", 3)
+    assert lru.lookup("b") == (False, None)
+    assert lru.lookup("c") == (True, 3)
+    stats = lru.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size, stats.maxsize) == (2, 1, 1, 2, 2)
+    lru.clear()
+    assert lru.stats().size == 0
+
+def test_disabled_cache_is_bypassed():
+    clear_cache()
+    get_vai_suffix(ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1p"))
+    assert cache_stats().misses == 0
+
+def test_cached_results_match(enabled_cache):
+    input_data = ConjugationInput(type="vai", form="independent", verb="jiikendam", pronoun="2p", negation=True)
+    first = get_vai_suffix(input_data)
+    second = get_vai_suffix(input_data)
+    assert first == second == get_vai_suffix.uncached(input_data)
+    stats = cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+def test_cached_lists_are_copies(enabled_cache):
+    first = get_pronoun_prefix("vai", "ikido", "independent", False, "1s", "present")
+    first.append("mutated")
+    second = get_pronoun_prefix("vai", "ikido", "independent", False, "1s", "present")
+    assert "mutated" not in second
+    assert len(second) == 3
+
+def test_eviction_is_bounded(enabled_cache):
+    configure_cache(maxsize=4)
+    for pronoun in ("1s", "2s", "3s", "1p", "21", "2p", "3p"):
+        get_vai_suffix(ConjugationInput(type="vai", form="dependent", verb="nibaa", pronoun=pronoun))
+    stats = cache_stats()
+    assert stats.size == 4
+    assert stats.evictions == 3
+
+def test_cache_is_thread_safe(enabled_cache):
+    inputs = [ConjugationInput(type="vai", form="independent", verb=verb, pronoun=pronoun)
+              for verb in ("nibaa", "ikido", "jiikendam") for pronoun in ("1s", "2s", "3s", "1p", "21", "2p", "3p")]
+    expected = [get_vai_suffix.uncached(input_data) for input_data in inputs]
+    errors = []
+
+    def worker():
+        for _ in range(50):
+            if [get_vai_suffix(input_data) for input_data in inputs] != expected:
+                errors.append("mismatch")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    stats = cache_stats()
+    assert stats.hits + stats.misses == 8 * 50 * len(inputs)
+
+@pytest.mark.parametrize("verb, verb_type, pronoun", [("nibaa", "vai", "1p"), ("dagwaagin", "vii", "0p"), ("miijin", "vti", "1p")])
+def test_compact_input_is_a_cache_key(enabled_cache, verb, verb_type, pronoun):
+    get_suffix = load_attribute(f".{verb_type}_suffixes_core:get_{verb_type}_suffix", "conjugator")
+    input_data = ConjugationInput(type=verb_type, form="independent", verb=verb, pronoun=pronoun, negation=True,
+                                  direct_object="plural" if verb_type == "vti" else None)
+    compact = input_data.compact()
+    expected = get_suffix.uncached(input_data)
+    assert get_suffix(compact) == expected
+    assert get_suffix(compact) == expected
+    assert cache_stats().hits == 1
+    assert get_suffix.uncached(compact) == expected
@@ -0,0 +1,90 @@
+import pytest
+from conjugator.dawg import Dawg, DawgBuilder, build_dawg, sorted_unique, surface_forms, write_surface_dawg
+from conjugator.paradigm import conjugate_paradigm_forms
+
+WORDS = ["tap", "taps", "top", "tops", "nibaa", "ninibaa", "gii-nibaa", "nibaamin"]
+ENTRIES = [("nibaa", "vai"), ("ikido", "vai"), ("onaagoshin", "vii"), ("miijin", "vti")]
+
+@pytest.fixture
+def dawg():
+    return build_dawg(WORDS + WORDS[:3])
+
+def test_membership(dawg):
+    assert len(dawg) == len(WORDS)
+    assert all(word in dawg for word in WORDS)
+    assert not any(word in dawg for word in ("", "ta", "tapss", "nibaaq", "Nibaa"))
+    assert list(dawg) == sorted(WORDS)
+
+def test_shared_endings_are_merged():
+    # tap/top and taps/tops share their last states: start, t, (a|o), p, s.
+    assert build_dawg(["tap", "taps", "top", "tops"]).state_count == 5
+
+def test_builder_rejects_unsorted_input():
+    builder = DawgBuilder()
+    builder.add("b")
+    builder.add("b")
+    with pytest.raises(ValueError, match="sorted order"):
+        builder.add("a")
+
+def test_builder_frees_replaced_states():
+    builder = DawgBuilder()
+    words = list(sorted_unique(surface_forms(ENTRIES)))
+    for word in words:
+        builder.add(word)
+    dawg = Dawg(builder.to_bytes())
+    # Every letter added made a state; only the ones in the minimal graph may still be alive.
+    assert sum(map(len, words)) > 10 * dawg.state_count
+    assert len(builder.edges) == len(builder.finals) == dawg.state_count
+
+@pytest.mark.parametrize("prefix, limit, expected", [
+    ("t", None, ["tap", "taps", "top", "tops"]),
+    ("ta", 1, ["tap"]),
+    ("nibaa", None, ["nibaa", "nibaamin"]),
+    ("x", None, []),
+])
+def test_complete(dawg, prefix, limit, expected):
+    assert list(dawg.complete(prefix, limit)) == expected
+
+@pytest.mark.parametrize("word, distance, expected", [
+    ("tap", 0, [("tap", 0)]),
+    ("tip", 1, [("tap", 1), ("top", 1)]),
+    ("nibaq", 1, [("nibaa", 1)]),
+    ("niibaa", 1, [("nibaa", 1), ("ninibaa", 1)]),
+    ("zzz", 1, []),
+])
+def test_suggest(dawg, word, distance, expected):
+    assert dawg.suggest(word, distance) == expected
+
+def test_sorted_unique_merges_spilled_chunks():
+    words = ["delta", "alpha", "charlie", "alpha", "bravo", "echo", "delta"]
+    assert list(sorted_unique(words, chunk_size=2)) == sorted(set(words))
+    assert list(sorted_unique(words)) == sorted(set(words))
+
+def test_surface_dawg_file(tmp_path):
+    path = tmp_path / "forms.dawg"
+    expected = {surface for verb, verb_type in ENTRIES
+                for form in conjugate_paradigm_forms(verb, verb_type) for surface in form.render_all()}
+    assert write_surface_dawg(ENTRIES, path, chunk_size=500) == len(expected)
+    with Dawg.open(path) as dawg:
+        assert set(dawg) == expected
+        assert "gii-nibaa" in dawg and "gii-nibaaq" not in dawg
+        assert set(dawg.complete("gii-nib")) == {surface for surface in surface_forms(ENTRIES[:1]) if surface.startswith("gii-nib")}
+
+def test_failing_lemma_is_skipped(tmp_path):
+    path, skipped = tmp_path / "forms.dawg", []
+    write_surface_dawg([("nibaa", "vai"), ("sagaswaa", "vai"), ("ikido", "vai")], path, skipped=skipped)
+    assert skipped == [("sagaswaa", "vai")]
+    with Dawg.open(path) as dawg:
+        assert "gii-ikido" in dawg and "sagaswaa" not in dawg
+
+def test_save_round_trip(dawg, tmp_path):
+    path = tmp_path / "words.dawg"
+    dawg.save(path)
+    with Dawg.open(path) as loaded:
+        assert list(loaded) == list(dawg)
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError, match="not a version 1 DAWG"):
+        Dawg.open(path)
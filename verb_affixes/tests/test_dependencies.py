@@ -0,0 +1,41 @@
+import json
+import pytest
+from conjugator.dependencies import Impact, assess_changes, changed_keys, slot_keys, table_entries
+from conjugator.models import ConjugationInput
+from conjugator.pipeline import get_suffix_parts
+from conjugator.vii_suffixes_core import DUMMY_N
+
+VERBS = {
+    "vai": ["nibaa", "ikido", "jiikendam", "egwaan", "wiisini", "bakade"],
+    "vii": ["noodin", "niiskadad", "mino", "gimiwan", "aabawaa"] + sorted(DUMMY_N)[:2],
+    "vti": ["mamoon", "miijin", "ayaan", "na'inan", "ikid"]
+}
+
+@pytest.mark.parametrize("verb_type", sorted(VERBS))
+def test_slot_keys_name_the_suffix_each_slot_uses(verb_type):
+    entries = table_entries()
+    for verb in VERBS[verb_type]:
+        for form, neg, pronoun, obj, key in slot_keys(verb, verb_type):
+            _, suffix = get_suffix_parts(ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun,
+                                                          negation=neg, direct_object=obj))
+            # A rule reading a pronoun missing from its table gets "".
+            value = json.loads(entries[key]) if key in entries else ""
+            if isinstance(value, list):
+                value = value[0] if obj == "singular" else value[1]
+            assert value == suffix, (verb, form, neg, pronoun, obj, key)
+
+def test_table_entries_track_stems_and_prefixes():
+    entries = table_entries()
+    assert entries["VAI_SUFFIX_MAP/independent/False/short_long_vowel/3p"] == '"wag"'
+    assert entries["VII_SUFFIX_MAP/independent/False/LONG_VOWEL/0p"] == '"wan"'
+    assert entries["TENSE_PREFIX_MAP/definitive"] == '["da-", "ga-"]'
+    assert all(entries[f"DUMMY_N/{stem}"] == "true" for stem in DUMMY_N)
+
+def test_changed_keys():
+    assert changed_keys({"a": "1", "b": "2", "c": "3"}, {"a": "1", "b": "4", "d": "5"}) == {"b", "c", "d"}
+
+def test_assess_changes():
+    assert assess_changes([]) == Impact()
+    assert assess_changes(["DUMMY_N/noodin", "VAI_SUFFIX_MAP/imperative/True/n_am/2s"]) == Impact(
+        False, {("noodin", "vii")}, {"VAI_SUFFIX_MAP/imperative/True/n_am/2s"})
+    assert assess_changes(["PREFIX_TABLE/1s/b"]).everything
@@ -0,0 +1,45 @@
+import pytest
+from conjugator import vai_suffixes_core, vii_suffixes_core
+from conjugator.dispatch import scan_rules
+from conjugator.enum import EndingClass, Pronoun
+
+VERBS = [
+    # vai
+    "debisinii", "giishkaabaagwe", "jiibaakwe", "zhoomiingweni", "minikwe", "nibaa", "wiisini",
+    "bakade", "ashange", "ikido", "aagade", "ojibwemo", "jiikendam", "wiisinin", "nagamo",
+    # vii
+    "onaagoshin", "zoogipon", "gimiwan", "noodin", "aabawaa", "maajibiisaa", "dagwaagin",
+    "ishkwaabiisaa", "niiskadad", "bakaanad", "gisinaa", "wanisin", "dakaagamin", "mino-giizhigad",
+    # edge cases
+    "", "a", "n", "am", "d", "bag", "ba", "be"
+]
+
+PRONOUNS = [pronoun.value for pronoun in Pronoun] + [None, "x"]
+
+@pytest.mark.parametrize("module", [vai_suffixes_core, vii_suffixes_core])
+def test_dispatch_matches_linear_scan(module):
+    for (form, neg), rules in module.RULE_REGISTRY.items():
+        for verb in VERBS:
+            for pronoun in PRONOUNS:
+                expected = scan_rules(rules, verb, pronoun)
+                actual = module.DISPATCHER.find(form, neg, verb, pronoun)
+                assert actual == expected, f"{form}/{neg}/{verb}/{pronoun}: expected {expected}, got {actual}"
+
+# Test data format:
+# (module, verb, expected_class)
+
+classify_cases = [
+    (vai_suffixes_core, "nibaa", EndingClass.LONG_VOWEL),
+    (vai_suffixes_core, "bakade", EndingClass.LONG_VOWEL),
+    (vai_suffixes_core, "ikido", EndingClass.SHORT_VOWEL),
+    (vai_suffixes_core, "jiikendam", EndingClass.AM),
+    (vai_suffixes_core, "wiisinin", EndingClass.N),
+    (vii_suffixes_core, "dakaagamin", EndingClass.DUMMY_N),
+    (vii_suffixes_core, "noodin", EndingClass.N),
+    (vii_suffixes_core, "niiskadad", EndingClass.D),
+    (vii_suffixes_core, "aabawaa", EndingClass.LONG_VOWEL),
+]
+
+@pytest.mark.parametrize("module, verb, expected_class", classify_cases)
+def test_classify_ending(module, verb, expected_class):
+    assert module.classify_ending(verb) == expected_class
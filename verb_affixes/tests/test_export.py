@@ -0,0 +1,45 @@
+import csv
+import io
+import json
+import pytest
+from conjugator.export import FIELDS, export_paradigms, read_verb_list
+from conjugator.paradigm import conjugate_paradigm_forms
+
+ENTRIES = [("nibaa", "vai"), ("dagwaagin", "vii"), ("miijin", "vti"), ("ikido", "vai")]
+
+def export(entries, fmt, workers):
+    out = io.StringIO()
+    written = export_paradigms(entries, out, fmt, workers=workers, chunksize=1)
+    return written, out.getvalue()
+
+def test_jsonl_rows_match_paradigm():
+    written, text = export(ENTRIES[:1], "jsonl", workers=1)
+    rows = [json.loads(line) for line in text.splitlines()]
+    surfaces = [surface for form in conjugate_paradigm_forms("nibaa", "vai") for surface in form.render_all()]
+    assert written == 1
+    assert [row["surface"] for row in rows] == surfaces
+    assert all(tuple(row) == FIELDS for row in rows)
+    assert rows[0]["prefix"] + rows[0]["preverb"] + rows[0]["stem"] + rows[0]["suffix"] == rows[0]["surface"]
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_pool_output_is_deterministic(fmt):
+    assert export(ENTRIES, fmt, workers=2) == export(ENTRIES, fmt, workers=1)
+
+def test_csv_header_and_failed_verbs_skipped():
+    written, text = export([("nibaa", "vai"), ("waabam", "vta")], "csv", workers=1)
+    rows = list(csv.reader(io.StringIO(text)))
+    assert written == 1
+    assert tuple(rows[0]) == FIELDS
+    assert {row[0] for row in rows[1:]} == {"nibaa"}
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        export(ENTRIES, "xml", workers=1)
+
+def test_read_verb_list(tmp_path):
+    path = tmp_path / "verbs.tsv"
+    path.write_text("# verb\ttype\nnibaa\tvai\n\nmiijin\tvti\n", encoding="utf-8")
+    assert read_verb_list(path) == [("nibaa", "vai"), ("miijin", "vti")]
+    path.write_text("nibaa\tvta\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="verbs.tsv:1"):
+        read_verb_list(path)
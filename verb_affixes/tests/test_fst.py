@@ -0,0 +1,118 @@
+import pytest
+from conjugator.fst import PREVERB_HYPHEN, Transducer, cell_tag, compile_fst, paradigm_cells, parse_tag
+from conjugator.lemma_index import LemmaIndex
+from conjugator.models import Analysis, ConjugationInput
+from conjugator.paradigm import conjugate_paradigm_forms
+from conjugator.pipeline import conjugate
+from conjugator.vii_suffixes_core import DUMMY_N
+
+VERBS = {
+    "vai": ["debisinii", "giishkaabaagwe", "jiibaakwe", "ziikawidoon", "zhoomiingweni", "minikwe", "nibaa", "wiisini",
+            "bakade", "ashange", "ikido", "aagade", "ojibwemo", "jiikendam", "oodena", "izhaa", "egwaan"],
+    "vii": ["onaagoshin", "zoogipon", "gimiwan", "noodin", "aabawaa", "maajibiisaa", "dagwaagin", "ishkwaabiisaa",
+            "niiskadad", "mino", "abi"] + sorted(DUMMY_N)[:20],
+    "vti": ["mamoon", "miijin", "giziibiiginan", "biitwaabaawidoon", "na'inan", "ayaan", "zhaabwiin", "ikid", "odaapin"]
+}
+
+@pytest.fixture(scope="module")
+def fst():
+    return compile_fst()
+
+def expected_surface(verb: str, cell: tuple) -> str | None:
+    verb_type, form, neg, tense, pronoun, obj = cell
+    try:
+        return conjugate(ConjugationInput(type=verb_type, form=form, verb=verb, pronoun=pronoun, negation=neg,
+                                          tense=tense, direct_object=obj)).render()
+    except ValueError:
+        return None
+
+@pytest.mark.parametrize("verb_type", sorted(VERBS))
+def test_generation_matches_pipeline_cell_for_cell(fst, verb_type):
+    for cell in paradigm_cells((verb_type,)):
+        for verb in VERBS[verb_type]:
+            assert fst.generate(verb, *cell) == expected_surface(verb, cell), (verb, cell)
+
+@pytest.mark.parametrize("verb, verb_type", [("wiisini", "vai"), ("ojibwemo", "vai"), ("niiskadad", "vii"), ("ayaan", "vti")])
+def test_paradigm_matches_conjugate_paradigm_forms(fst, verb, verb_type):
+    expected = {(f.type, f.form, f.negation, f.tense, f.pronoun, f.direct_object): f.render()
+                for f in conjugate_paradigm_forms(verb, verb_type)}
+    assert fst.generate_paradigm(verb, verb_type) == expected
+
+@pytest.mark.parametrize("verb, cell", [
+    ("bwaaqa", ("vai", "independent", True, "past", "1p", None)),
+    ("Zhaaga", ("vai", "dependent", False, "present", "3p", None)),
+    ("jiiman", ("vti", "independent", False, "conditional", "2s", "plural")),
+    ("odaapinan", ("vti", "imperative", False, "present", "2p", "singular")),
+])
+def test_letters_outside_the_rules_are_copied(fst, verb, cell):
+    assert fst.generate(verb, *cell) == expected_surface(verb, cell)
+
+@pytest.mark.parametrize("args", [
+    ("ab", "vai", "independent", False, "present", "1s"),
+    ("nibaa", "vai", "imperative", False, "present", "3p"),
+    ("nibaa", "vta", "independent", False, "present", "1s"),
+])
+def test_generation_outside_the_machine(fst, args):
+    assert fst.generate(*args) is None
+
+def test_tags_round_trip():
+    for cell in paradigm_cells():
+        assert parse_tag(cell_tag(*cell)) == cell
+
+@pytest.mark.parametrize("verb, verb_type", [("nibaa", "vai"), ("ojibwemo", "vai"), ("gimiwan", "vii"), ("miijin", "vti")])
+def test_analysis_inverts_generation(fst, verb, verb_type):
+    for cell in paradigm_cells((verb_type,))[::3]:
+        surface = fst.generate(verb, *cell)
+        if surface is None:
+            continue
+        analyses = fst.analyze(surface)
+        assert Analysis(verb, *cell) in analyses
+        assert all(fst.generate(a.verb, a.type, a.form, a.negation, a.tense, a.pronoun, a.direct_object) == surface
+                   for a in analyses)
+
+def test_analysis_guesses_unknown_stems(fst):
+    assert fst.analyze("") == []
+    assert fst.analyze("k") == []
+    assert Analysis("xyzk", "vai", "independent", False, "present", "3s") in fst.analyze("xyzk")
+
+def test_guessed_stems_never_swallow_a_preverb(fst):
+    analyses = fst.analyze("gii-nibaa")
+    assert Analysis("nibaa", "vai", "independent", False, "past", "3s") in analyses
+    assert not any(PREVERB_HYPHEN in a.verb for a in analyses)
+
+@pytest.fixture(scope="module")
+def lemmas():
+    return LemmaIndex((verb, verb_type) for verb_type, verbs in VERBS.items() for verb in verbs)
+
+@pytest.mark.parametrize("verb, verb_type", [("nibaa", "vai"), ("ikido", "vai"), ("gimiwan", "vii"), ("miijin", "vti")])
+def test_analysis_with_lemmas(fst, lemmas, verb, verb_type):
+    for cell in paradigm_cells((verb_type,))[::3]:
+        surface = fst.generate(verb, *cell)
+        if surface is None:
+            continue
+        analyses = fst.analyze(surface, lemmas)
+        assert Analysis(verb, *cell) in analyses
+        assert set(analyses) <= set(fst.analyze(surface))
+        assert all(a.type in {entry.type for entry in lemmas.lookup(a.verb)} for a in analyses)
+
+def test_analysis_with_lemmas_reads_only_listed_stems(fst, lemmas):
+    assert fst.analyze("gii-nibaa", lemmas) == [Analysis("nibaa", "vai", "independent", False, "past", "3s")]
+    assert fst.analyze("xyzk", lemmas) == []
+    # A stem is only read in cells of the types it is listed under.
+    assert Analysis("mino", "vii", "independent", False, "present", "0p") in fst.analyze("minoon", lemmas)
+    assert not any(a.type == "vii" for a in fst.analyze("minoon", LemmaIndex([("mino", "vai")])))
+
+def test_save_and_load(fst, tmp_path):
+    path = tmp_path / "conjugator.fst.json"
+    fst.save(path)
+    loaded = Transducer.load(path)
+    assert len(loaded) == len(fst)
+    for cell in paradigm_cells()[::5]:
+        assert loaded.generate("wiisini", *cell) == fst.generate("wiisini", *cell)
+    assert loaded.analyze("gii-nibaa") == fst.analyze("gii-nibaa")
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text('{"format": "something-else"}')
+    with pytest.raises(ValueError, match="not a version 1 conjugation transducer"):
+        Transducer.load(path)
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+import pytest
+import conjugator
+from conjugator import pipeline
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+from import_time import IMPORT_BUDGETS, best_of, loaded_modules
+
+SUFFIX_MODULES = {"vai": "conjugator.vai_suffixes_core", "vii": "conjugator.vii_suffixes_core", "vti": "conjugator.vti_suffixes_core"}
+
+def test_package_import_loads_no_verb_type():
+    modules = loaded_modules("import conjugator")
+    assert not modules & {*SUFFIX_MODULES.values(), "conjugator.lexicon", "conjugator.store", "sqlite3"}
+
+@pytest.mark.parametrize("verb_type, call", [
+    ("vai", "conjugate(ConjugationInput(type='vai', form='independent', verb='nibaa', pronoun='3s'))"),
+    ("vii", "conjugate(ConjugationInput(type='vii', form='independent', verb='onaagoshin', pronoun='0s'))"),
+    ("vti", "conjugate(ConjugationInput(type='vti', form='independent', verb='miijin', pronoun='3s', direct_object='singular'))"),
+])
+def test_conjugating_one_type_loads_only_its_tables(verb_type, call):
+    modules = loaded_modules(f"from conjugator import conjugate, ConjugationInput\n{call}")
+    assert SUFFIX_MODULES[verb_type] in modules
+    assert not modules & (set(SUFFIX_MODULES.values()) - {SUFFIX_MODULES[verb_type]})
+
+@pytest.mark.parametrize("statement, budget", IMPORT_BUDGETS.items())
+def test_import_time_budget(statement, budget):
+    total, _ = best_of(statement, repeat=3)
+    assert total <= budget, f"{statement} took {total} us (budget {budget} us)"
+
+def test_lazy_exports():
+    assert conjugator.conjugate is pipeline.conjugate
+    assert set(conjugator.__all__) <= set(dir(conjugator))
+    with pytest.raises(AttributeError, match="no attribute 'conjugate_all'"):
+        conjugator.conjugate_all
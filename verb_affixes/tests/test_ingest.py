@@ -0,0 +1,75 @@
+import pytest
+from conjugator.ingest import LexiconReader, iter_lexicon, normalize_stem, tag_entry
+from conjugator.models import LemmaEntry
+
+TSV = """verb\ttype\tfrequency
+nibaa\tvai\t120
+# comment
+
+Na’inan\tvti\t4
+nibā\tvai
+gimiwan\tvii\t7
+ikid\tvti\t3
+nibaa\tvta\t1
+noodin\tvii\tmany
+jiikendam\tvai\t9\textra
+bakadee\tvai\t2
+"""
+
+@pytest.mark.parametrize("text, expected", [
+    ("Na’inan", "na'inan"), ("naʼinan", "na'inan"), ("nibā", "nibaa"), ("nibaaa", "nibaa"), ("miijín", "miijiin"),
+    (" bakadee ", "bakade"), ("zhōomiingweni", "zhoomiingweni"),
+])
+def test_normalize_stem(text, expected):
+    assert normalize_stem(text) == expected
+
+@pytest.mark.parametrize("verb, verb_type, expected", [
+    ("nibaa", "vai", "long_vowel"), ("jiikendam", "vai", "am"), ("egwaan", "vai", "n"), ("ikido", "vai", "short_vowel"),
+    ("niiskadad", "vii", "d"), ("noodin", "vii", "n"), ("mino", "vii", "short_vowel"),
+    ("mamoon", "vti", "oon"), ("ayaan", "vti", "aan"), ("na'inan", "vti", "an"), ("miijin", "vti", "in"),
+])
+def test_tag_entry(verb, verb_type, expected):
+    assert tag_entry(verb, verb_type) == expected
+
+@pytest.mark.parametrize("verb, verb_type, message", [
+    ("ikid", "vti", "must end in -an, -aan, -oon or -in"),
+    ("nibaa", "vti", "must end in -an, -aan, -oon or -in"),
+    ("nibaa", "vta", "unknown verb type"),
+    ("nib aa", "vai", "outside the double-vowel alphabet"),
+    ("", "vai", "empty stem"),
+    ("sagaswaa", "vai", "starts with 's', which takes no pronoun prefix"),
+    ("kiwaan", "vti", "starts with 'k', which takes no pronoun prefix"),
+    ("'aan", "vti", "which takes no pronoun prefix"),
+])
+def test_tag_entry_rejects(verb, verb_type, message):
+    with pytest.raises(ValueError, match=message):
+        tag_entry(verb, verb_type)
+
+def test_vii_stems_take_no_pronoun_prefix():
+    assert tag_entry("sagaswaa", "vii") == "long_vowel"
+
+def test_reader_streams_chunks_and_rejects_bad_rows(tmp_path):
+    path, rejects = tmp_path / "lexicon.tsv", tmp_path / "rejects.tsv"
+    path.write_text(TSV, encoding="utf-8")
+    reader = LexiconReader(path, rejects, chunk_size=2)
+    chunks = list(reader)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [entry for chunk in chunks for entry in chunk] == [
+        LemmaEntry("nibaa", "vai", "long_vowel", 120), LemmaEntry("na'inan", "vti", "an", 4),
+        LemmaEntry("nibaa", "vai", "long_vowel", 0), LemmaEntry("gimiwan", "vii", "n", 7),
+        LemmaEntry("bakade", "vai", "long_vowel", 2)
+    ]
+    assert (reader.read, reader.accepted, reader.rejected) == (9, 5, 4)
+    lines = rejects.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("#")
+    assert [line.split("\t")[0] for line in lines[1:]] == ["8", "9", "10", "11"]
+    assert "must end in" in lines[1] and lines[1].endswith("ikid\tvti\t3")
+
+def test_csv_files(tmp_path):
+    path = tmp_path / "lexicon.csv"
+    path.write_text("verb,type\nnibaa,vai\n\"mamoon\",vti\nabc,vai\n", encoding="utf-8")
+    assert [entry.verb for entry in iter_lexicon(path)] == ["nibaa", "mamoon"]
+
+def test_chunk_size_must_be_positive(tmp_path):
+    with pytest.raises(ValueError, match="chunk_size"):
+        LexiconReader(tmp_path / "lexicon.tsv", chunk_size=0)
@@ -0,0 +1,86 @@
+import json
+import pytest
+import sys
+from pathlib import Path
+from conjugator import instrumentation, paradigm, pipeline, vti_suffixes_core
+from conjugator.dispatch import RuleDispatcher
+from conjugator.instrumentation import instrumented, report_to_json, report_to_text
+from conjugator.models import ConjugationInput
+from conjugator.pipeline import conjugate, conjugate_many
+from conjugator.paradigm import conjugate_paradigm, conjugate_paradigm_forms
+from conjugator.vai_suffixes_core import DISPATCHER, get_vai_suffix
+from conjugator.vti_suffixes_core import get_vti_suffix
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+from import_time import loaded_modules
+
+def test_rule_attempts_follow_list_order():
+    with instrumented() as stats:
+        conjugate(ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1s", tense="present"))
+    rules = stats.report()["rules"]
+    # nibaa ends in a long vowel: DropShortVowel is tried and fails, VowelEndIndPos wins.
+    assert rules["vai.independent.positive.DropShortVowel"] == {"attempts": 1, "hits": 0, "misses": 1}
+    assert rules["vai.independent.positive.VowelEndIndPos"] == {"attempts": 1, "hits": 1, "misses": 0}
+    assert rules["vai.independent.positive.AddAIndPos"]["attempts"] == 0
+
+def test_vti_rules_and_stages():
+    inputs = [ConjugationInput(type="vti", form="independent", verb="miijin", pronoun=p, tense="past", direct_object="singular")
+              for p in ("1s", "2s", "3s", "1p")]
+    with instrumented() as stats:
+        list(conjugate_many(inputs))
+    report = stats.report()
+    # 1p is outside the first rule's pronouns and miijin outside the second's endings: the third wins.
+    assert report["rules"]["vti.independent.positive.1.keep"] == {"attempts": 4, "hits": 3, "misses": 1}
+    assert report["rules"]["vti.independent.positive.2.lengthen_final_an"] == {"attempts": 1, "hits": 0, "misses": 1}
+    assert report["rules"]["vti.independent.positive.3.remove_final_letter"] == {"attempts": 1, "hits": 1, "misses": 0}
+    assert report["rules"]["vti.independent.negative.1.keep"]["attempts"] == 0
+    assert {stage: values["calls"] for stage, values in report["stages"].items()} == {"suffix": 4, "tense": 4, "pronoun": 4}
+    assert json.loads(report_to_json(report)) == report
+    assert "vti.independent.positive.3.remove_final_letter" in report_to_text(report)
+
+def test_disabled_restores_plain_functions():
+    get_tense_parts, get_all_tense_parts = pipeline.get_tense_parts, paradigm.get_all_tense_parts
+    suffix_parts, suffix_functions = dict(pipeline.SUFFIX_PARTS), dict(paradigm.SUFFIX_FUNCTIONS)
+    get_vti_parts = vti_suffixes_core.get_vti_parts
+    with instrumented():
+        assert pipeline.get_tense_parts is not get_tense_parts
+        assert paradigm.get_all_tense_parts is not get_all_tense_parts
+        assert "find" in vars(DISPATCHER)
+        assert vti_suffixes_core.get_vti_parts is not get_vti_parts
+    assert pipeline.get_tense_parts is get_tense_parts
+    assert paradigm.get_all_tense_parts is get_all_tense_parts
+    assert pipeline.SUFFIX_PARTS == suffix_parts and paradigm.SUFFIX_FUNCTIONS == suffix_functions
+    assert vti_suffixes_core.get_vti_parts is get_vti_parts
+    assert "find" not in vars(DISPATCHER)
+    assert DISPATCHER.find.__func__ is RuleDispatcher.find
+    assert not instrumentation.INSTRUMENTATION.enabled
+
+@pytest.mark.parametrize("generate", [conjugate_paradigm, conjugate_paradigm_forms])
+def test_paradigm_rules_and_stages(generate):
+    with instrumented() as stats:
+        generate("ikido", "vai")
+    report = stats.report()
+    assert report["rules"]["vai.independent.positive.DropShortVowel"]["hits"] > 0
+    assert all(values["calls"] > 0 for values in report["stages"].values())
+
+def test_direct_suffix_calls_are_counted():
+    with instrumented() as stats:
+        get_vai_suffix(ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1s"))
+        get_vti_suffix(ConjugationInput(type="vti", form="independent", verb="miijin", pronoun="1s", direct_object="singular"))
+    rules = stats.report()["rules"]
+    assert rules["vai.independent.positive.VowelEndIndPos"]["hits"] == 1
+    assert rules["vti.independent.positive.1.keep"]["hits"] == 1
+
+def test_enabling_loads_no_other_verb_type():
+    modules = loaded_modules(
+        "from conjugator import ConjugationInput, conjugate\n"
+        "from conjugator.instrumentation import instrumented\n"
+        "from conjugator.paradigm import conjugate_paradigm\n"
+        "with instrumented() as stats:\n"
+        "    conjugate(ConjugationInput(type='vai', form='independent', verb='nibaa', pronoun='1s'))\n"
+        "    conjugate_paradigm('ikido', 'vai')\n"
+        "rules = stats.report()['rules']\n"
+        "assert rules['vai.independent.positive.VowelEndIndPos']['hits'] == 6\n"
+        "assert rules['vai.independent.positive.DropShortVowel']['hits'] == 2")
+    assert "conjugator.vai_suffixes_core" in modules
+    assert not modules & {"conjugator.vii_suffixes_core", "conjugator.vti_suffixes_core"}
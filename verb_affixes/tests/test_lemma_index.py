@@ -0,0 +1,68 @@
+import pytest
+from conjugator import lemma_index
+from conjugator.lemma_index import LemmaIndex, load_lemma_index, read_lemma_list, type_mask
+from conjugator.models import LemmaEntry
+
+ENTRIES = [
+    ("nibaa", "vai", 120), ("nagamo", "vai", 40), ("nandawenim", "vai", 40), ("niimi", "vai", 75),
+    ("noodin", "vii", 30), ("miijin", "vti", 90), ("mizhakwad", "vii", 5), ("mino", "vii", 12), ("nibaa", "vai", 3),
+    ("ayaan", "vti"), ("ayaa", "vai", 60), ("mino", "vai", 7)
+]
+
+@pytest.fixture
+def index():
+    return LemmaIndex(ENTRIES)
+
+def test_duplicate_lemma_keeps_highest_frequency(index):
+    assert len(index) == 11
+    assert index.lookup("nibaa") == [LemmaEntry("nibaa", "vai", "long_vowel", 120)]
+
+@pytest.mark.parametrize("prefix, k, expected", [
+    ("n", 3, ["nibaa", "niimi", "nagamo"]),
+    ("n", 10, ["nibaa", "niimi", "nagamo", "nandawenim", "noodin"]),
+    ("mi", 2, ["miijin", "mino"]),
+    ("ayaa", 10, ["ayaa", "ayaan"]),
+    ("x", 10, []),
+    ("n", 0, []),
+])
+def test_complete_ranks_by_frequency(index, prefix, k, expected):
+    assert [entry.verb for entry in index.complete(prefix, k)] == expected
+
+def test_entry_points(index):
+    assert index.lookup("mino") == [LemmaEntry("mino", "vai", "short_vowel", 7), LemmaEntry("mino", "vii", "short_vowel", 12)]
+    assert index.lookup("ayaan") == [LemmaEntry("ayaan", "vti", "aan", 0)]
+    assert index.lookup("min") == []
+    assert "noodin" in index and "nood" not in index
+
+def test_child_walk_and_type_masks(index):
+    node = 0
+    for letter in "min":
+        node = index.child(node, letter)
+    assert index.child(node, "x") is None
+    assert index.type_masks[node] == type_mask(["vai", "vii"])
+    assert index.type_masks[index.child(node, "o")] == type_mask(["vii", "vai"])
+    assert index.type_masks[0] == type_mask(["vai", "vii", "vti"])
+    assert index.type_masks[index.child(0, "a")] == type_mask(["vai", "vti"])
+
+def test_precomputed_top_lists_match_ranking(monkeypatch):
+    monkeypatch.setattr(lemma_index, "SMALL_SUBTREE", 2)
+    entries = [(f"wa{i:03d}", "vai", (i * 37) % 101) for i in range(300)] + [("wab", "vii", 1000)]
+    index = LemmaIndex(entries)
+    assert len(index.top_lemmas) > 0
+    for prefix in ("", "w", "wa", "wa0", "wa1", "wa29"):
+        expected = sorted((-frequency, verb) for verb, _, frequency in entries if verb.startswith(prefix))
+        assert [(-e.frequency, e.verb) for e in index.complete(prefix)] == expected[:lemma_index.TOP_K]
+        assert [(-e.frequency, e.verb) for e in index.complete(prefix, 25)] == expected[:25]
+
+def test_read_lemma_list(tmp_path):
+    path = tmp_path / "lemmas.tsv"
+    path.write_text("# verbs\nnibaa\tvai\t12\n\nmiijin\tvti\n", encoding="utf-8")
+    assert read_lemma_list(path) == [("nibaa", "vai", 12), ("miijin", "vti", 0)]
+    assert [entry.verb for entry in load_lemma_index(path).complete("")] == ["nibaa", "miijin"]
+    path.write_text("nibaa\tvai\tmany\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="lemmas.tsv:1"):
+        read_lemma_list(path)
+
+def test_unknown_verb_type():
+    with pytest.raises(ValueError, match="Unsupported verb type 'vta'"):
+        LemmaIndex([("waabam", "vta")])
@@ -0,0 +1,55 @@
+import pytest
+from conjugator import vii_suffixes_core
+from conjugator.enum import LexicalFlag
+from conjugator.lexicon import Lexicon, load_lexicon
+from conjugator.vii_suffixes_core import handle_independent, handle_dependent, use_lexicon
+
+@pytest.fixture
+def lexicon_file(tmp_path):
+    path = tmp_path / "lexicon.tsv"
+    path.write_text(
+        "# test lexicon\n"
+        "\n"
+        "zaagibagaaminan\tdummy_n\n"
+        "biiwipon\tdummy_n, rare\n",
+        encoding="utf-8"
+    )
+    return path
+
+@pytest.fixture
+def restore_lexicon():
+    lexicon = vii_suffixes_core.LEXICON
+    yield
+    use_lexicon(lexicon)
+
+def test_default_lexicon_has_dummy_n_stems():
+    lexicon = load_lexicon()
+    assert lexicon.has_flag("dakaagamin", LexicalFlag.DUMMY_N)
+    assert not lexicon.has_flag("noodin", LexicalFlag.DUMMY_N)
+    assert len(lexicon.stems(LexicalFlag.DUMMY_N)) == len(lexicon)
+
+def test_load_lexicon_file(lexicon_file):
+    lexicon = Lexicon.from_file(lexicon_file)
+    assert lexicon.flags("biiwipon") == frozenset({"dummy_n", "rare"})
+    assert lexicon.has_flag("zaagibagaaminan", LexicalFlag.DUMMY_N)
+    assert "noodin" not in lexicon
+
+def test_merge_combines_flags(lexicon_file):
+    merged = load_lexicon().merge(Lexicon.from_file(lexicon_file))
+    assert merged.has_flag("dakaagamin", LexicalFlag.DUMMY_N)
+    assert merged.has_flag("zaagibagaaminan", LexicalFlag.DUMMY_N)
+    assert merged.flags("biiwipon") == frozenset({"dummy_n", "rare"})
+
+@pytest.mark.parametrize("content", ["noodin\n", "\tdummy_n\n", "aabawaa\tdummy_n\n"])
+def test_invalid_lexicon_rows(tmp_path, content):
+    path = tmp_path / "lexicon.tsv"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        Lexicon.from_file(path)
+
+def test_use_lexicon_changes_dummy_n_handling(lexicon_file, restore_lexicon):
+    assert handle_independent("zaagibagaaminan", False, "0p") == ("zaagibagaaminan", "oon")
+    use_lexicon(load_lexicon().merge(Lexicon.from_file(lexicon_file)))
+    assert handle_independent("zaagibagaaminan", False, "0p") == ("zaagibagaamina", "wan")
+    assert handle_dependent("zaagibagaaminan", True, "0s") == ("zaagibagaamina", "sinog")
+    assert handle_dependent("dakaagamin", False, "0s") == ("dakaagami", "g")
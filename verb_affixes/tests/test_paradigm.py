@@ -0,0 +1,57 @@
+import pytest
+from conjugator.models import ConjugationInput
+from conjugator.paradigm import conjugate_paradigm
+from conjugator.vai_suffixes_core import get_vai_suffix
+from conjugator.vii_suffixes_core import get_vii_suffix
+from conjugator.vti_suffixes_core import get_vti_suffix
+from conjugator.tense_prefix_core import get_tense_prefix
+from conjugator.pronoun_prefix_core import get_pronoun_prefix
+
+# Test data format:
+# (verb, verb_type, expected_cell_count)
+
+test_cases = [
+    ("nibaa", "vai", 2 * 5 * (7 + 7 + 3)),
+    ("jiikendam", "vai", 2 * 5 * (7 + 7 + 3)),
+    ("debisinii", "vai", 2 * 5 * (7 + 7 + 3)),
+    ("zhoomiingweni", "vai", 2 * 5 * (7 + 7 + 3)),
+    ("noodin", "vii", 2 * 5 * (2 + 2)),
+    ("dagwaagin", "vii", 2 * 5 * (2 + 2)),
+    ("niiskadad", "vii", 2 * 5 * (2 + 2)),
+    ("aabawaa", "vii", 2 * 5 * (2 + 2)),
+    ("mamoon", "vti", 2 * 2 * 5 * (7 + 7 + 3)),
+    ("miijin", "vti", 2 * 2 * 5 * (7 + 7 + 3)),
+    ("giziibiiginan", "vti", 2 * 2 * 5 * (7 + 7 + 3)),
+    ("ayaan", "vti", 2 * 2 * 5 * (7 + 7 + 3)),
+]
+
+SUFFIX_FUNCTIONS = {"vai": get_vai_suffix, "vii": get_vii_suffix, "vti": get_vti_suffix}
+
+def conjugate_cell(verb, verb_type, cell):
+    """The per-cell path used by the *-main.py scripts."""
+    input_data = ConjugationInput(
+        type=verb_type,
+        form=cell.form,
+        verb=verb,
+        pronoun=cell.pronoun,
+        tense=cell.tense,
+        negation=cell.negation,
+        direct_object=cell.direct_object
+    )
+    added_suffix = SUFFIX_FUNCTIONS[verb_type](input_data)
+    added_tense_prefix = get_tense_prefix(added_suffix, cell.pronoun, cell.tense)
+    if verb_type == "vii":
+        return added_tense_prefix
+    return get_pronoun_prefix(verb_type, added_tense_prefix, cell.form, cell.negation, cell.pronoun, cell.tense)
+
+@pytest.mark.parametrize("verb, verb_type, expected_cell_count", test_cases)
+def test_paradigm_matches_per_cell_path(verb, verb_type, expected_cell_count):
+    cells = conjugate_paradigm(verb, verb_type)
+    assert len(cells) == expected_cell_count, f"Expected {expected_cell_count} cells, got {len(cells)}"
+    for cell in cells:
+        expected = conjugate_cell(verb, verb_type, cell)
+        assert cell.result == expected, f"{verb}/{cell.form}/{cell.negation}/{cell.tense}/{cell.pronoun}: expected '{expected}', got '{cell.result}'"
+
+def test_paradigm_rejects_unknown_verb_type():
+    with pytest.raises(ValueError):
+        conjugate_paradigm("nibaa", "vta")
@@ -0,0 +1,97 @@
+import pytest
+from conjugator.models import ConjugationInput, ConjugatedForm
+from conjugator.paradigm import TENSES, conjugate_paradigm, conjugate_paradigm_forms
+from conjugator.pipeline import conjugate
+from conjugator.tense_prefix_core import consonant_shift, get_all_tense_parts, get_all_tense_prefixes, get_tense_parts, get_tense_prefix
+
+# Test data format:
+# (input kwargs, expected plain surfaces, expected segments of the first surface)
+
+test_cases = [
+    (dict(type="vai", form="independent", verb="ikido", pronoun="1p", tense="present", negation=True),
+     ["indikidosiimin", "nidikidosiimin", "nindikidosiimin"],
+     {"prefix": "ind", "preverb": "", "stem": "ikido", "suffix": "siimin"}),
+    (dict(type="vai", form="independent", verb="nibaa", pronoun="3p", tense="past"),
+     ["gii-nibaawag"],
+     {"prefix": "", "preverb": "gii-", "stem": "nibaa", "suffix": "wag"}),
+    (dict(type="vai", form="independent", verb="bakade", pronoun="1s", tense="desiderative"),
+     ["niwii-pakade"],
+     {"prefix": "ni", "preverb": "wii-", "stem": "pakade", "suffix": ""}),
+    (dict(type="vii", form="dependent", verb="dakaagamin", pronoun="0s", tense="present", negation=True),
+     ["dakaagamisinog"],
+     {"prefix": "", "preverb": "", "stem": "dakaagami", "suffix": "sinog"}),
+    (dict(type="vti", form="dependent", verb="miijin", pronoun="1p", tense="past", direct_object="singular"),
+     ["gii-miijimyaang"],
+     {"prefix": "", "preverb": "gii-", "stem": "miijim", "suffix": "yaang"}),
+    (dict(type="vti", form="independent", verb="mamoon", pronoun="3s", tense="definitive", direct_object="plural"),
+     ["oda-mamoonan"],
+     {"prefix": "o", "preverb": "da-", "stem": "mamoon", "suffix": "an"}),
+]
+
+@pytest.mark.parametrize("kwargs, expected_surfaces, expected_segments", test_cases)
+def test_conjugate_segments(kwargs, expected_surfaces, expected_segments):
+    result = conjugate(ConjugationInput(**kwargs))
+    assert result.render_all() == expected_surfaces
+    assert result.segments() == expected_segments
+
+def test_features_and_slots():
+    result = conjugate(ConjugationInput(type="vti", form="imperative", verb="mamoon", pronoun="2p", tense="present", negation=True, direct_object="singular"))
+    assert result.features == ("vti", "imperative", "negative", "present", "2p", "singular")
+    assert not hasattr(result, "__dict__")
+
+def test_render_html_escapes_segments():
+    result = conjugate(ConjugationInput(type="vti", form="independent", verb="na'inan", pronoun="3s", tense="present", direct_object="singular"))
+    assert result.render("html") == (
+        '<span class="prefix independent positive">o</span>'
+        '<span class="stem independent positive">na&#x27;inaan</span>'
+    )
+
+def test_render_unknown_style():
+    result = conjugate(ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="1s", tense="present"))
+    with pytest.raises(ValueError):
+        result.render("latex")
+
+@pytest.mark.parametrize("verb, verb_type", [("nibaa", "vai"), ("jiikendam", "vai"), ("dagwaagin", "vii"), ("niiskadad", "vii"), ("ayaan", "vti"), ("miijin", "vti")])
+def test_ansi_render_matches_styled_path(verb, verb_type):
+    forms = conjugate_paradigm_forms(verb, verb_type)
+    cells = conjugate_paradigm(verb, verb_type)
+    assert len(forms) == len(cells)
+    for form, cell in zip(forms, cells):
+        assert form == conjugate(ConjugationInput(type=verb_type, form=form.form, verb=verb, pronoun=form.pronoun,
+                                                  tense=form.tense, negation=form.negation, direct_object=form.direct_object))
+        rendered = form.render_all("ansi")
+        assert (rendered if isinstance(cell.result, list) else rendered[0]) == cell.result
+
+# The pronoun prefix attaches to the preverb in non-present tenses, so its initial is the preverb's.
+prefix_cases = [
+    ("vai", "nibaa", "1s", "past", ["ingii-nibaa", "nigii-nibaa", "ningii-nibaa"]),
+    ("vai", "ikido", "1s", "definitive", ["inga-ikid", "niga-ikid", "ninga-ikid"]),
+    ("vti", "mamoon", "3s", "conditional", ["odaa-mamoonan"]),
+    ("vti", "ayaan", "3s", "definitive", ["oda-ayaanan"]),
+]
+
+@pytest.mark.parametrize("verb_type, verb, pronoun, tense, expected", prefix_cases)
+def test_prefix_initial_from_tense_stage(verb_type, verb, pronoun, tense, expected):
+    obj = "plural" if verb_type == "vti" else None
+    input_data = ConjugationInput(type=verb_type, form="independent", verb=verb, pronoun=pronoun, tense=tense, direct_object=obj)
+    assert conjugate(input_data).render_all() == expected
+
+@pytest.mark.parametrize("verb", ["bakade", "zhaabwii", "zaaga'am", "jiibaakwe", "ikido", ""])
+@pytest.mark.parametrize("pronoun", ["1s", "3s"])
+def test_all_tense_parts_match_single_tense(verb, pronoun):
+    fan_out = get_all_tense_parts(verb, pronoun)
+    assert set(fan_out) == set(TENSES)
+    for tense, parts in fan_out.items():
+        assert parts == get_tense_parts(verb, pronoun, tense)
+        assert get_all_tense_prefixes(verb, pronoun)[tense] == get_tense_prefix(verb, pronoun, tense)
+
+@pytest.mark.parametrize("verb, tense, expected", [
+    ("zhaabwii", "past", "shaabwii"),
+    ("zaaga'am", "desiderative", "saaga'am"),
+    ("jiibaakwe", "past", "chiibaakwe"),
+    ("bakade", "conditional", "bakade"),
+    ("ikido", "past", "ikido"),
+    ("", "past", ""),
+])
+def test_consonant_shift(verb, tense, expected):
+    assert consonant_shift(verb, tense) == expected
@@ -0,0 +1,48 @@
+import random
+import pytest
+from conjugator.models import ConjugationError, ConjugationInput
+from conjugator.paradigm import conjugate_paradigm_forms
+from conjugator.pipeline import conjugate_many
+from conjugator.planner import conjugate_planned, group_inputs, plan_suffix_parts
+
+ENTRIES = [("nibaa", "vai"), ("ikido", "vai"), ("jiikendam", "vai"), ("ojibwemo", "vai"), ("ziikawidoon", "vai"),
+           ("onaagoshin", "vii"), ("dagwaagin", "vii"), ("mizhakwad", "vii"), ("miijin", "vti"), ("ayaan", "vti")]
+
+def paradigm_inputs(verb: str, verb_type: str) -> list[ConjugationInput]:
+    return [ConjugationInput(type=verb_type, form=form.form, verb=verb, pronoun=form.pronoun, tense=form.tense,
+                             negation=form.negation, direct_object=form.direct_object)
+            for form in conjugate_paradigm_forms(verb, verb_type)]
+
+def outcome(result):
+    return result.message if isinstance(result, ConjugationError) else result
+
+def test_planned_matches_conjugate_many_in_input_order():
+    inputs = [input_data for entry in ENTRIES for input_data in paradigm_inputs(*entry)]
+    random.Random(7).shuffle(inputs)
+    assert conjugate_planned(inputs) == list(conjugate_many(inputs))
+
+def test_groups_share_ending_class():
+    inputs = [ConjugationInput(type="vai", form="independent", verb=verb, pronoun="1s", tense="present")
+              for verb in ("nibaa", "wiisini", "bakade", "nibaa", "ikido")]
+    groups = group_inputs(inputs)
+    # Long vowel (nibaa, bakade) and short vowel (wiisini, ikido): two groups, one rule each.
+    assert sorted(groups.values()) == [[0, 2, 3], [1, 4]]
+    assert plan_suffix_parts(inputs) == [("nibaa", ""), ("wiisin", ""), ("bakade", ""), ("nibaa", ""), ("ikid", "")]
+
+@pytest.mark.parametrize("input_data", [
+    ConjugationInput(type="vta", form="independent", verb="waabam", pronoun="1s", tense="present"),
+    ConjugationInput(type="vii", form="dependent", verb="bam", pronoun="0s", tense="present", negation=True),
+    ConjugationInput(type="vai", form="conjunct", verb="nibaa", pronoun="1s", tense="present"),
+    ConjugationInput(type="vai", form="independent", verb=None, pronoun="1s", tense="present"),
+])
+def test_errors_match_per_item_pipeline(input_data):
+    inputs = [ConjugationInput(type="vai", form="independent", verb="nibaa", pronoun="3s", tense="past"), input_data]
+    planned = conjugate_planned(inputs)
+    assert planned[0].render() == "gii-nibaa"
+    assert isinstance(planned[1], ConjugationError)
+    assert planned[1].input is input_data
+    assert [outcome(result) for result in planned] == [outcome(result) for result in conjugate_many(inputs)]
+
+def test_compact_inputs():
+    inputs = paradigm_inputs("miijin", "vti")
+    assert conjugate_planned(input_data.compact() for input_data in inputs) == list(conjugate_many(inputs))
@@ -0,0 +1,34 @@
+import pytest
+from conjugator.models import ConjugationInput
+from conjugator.paradigm import conjugate_paradigm
+from conjugator.pipeline import conjugate
+from conjugator.pronoun_prefix_core import ALL_VARIANTS, VariantPolicy, get_prefix_variants, set_variant_policy
+
+@pytest.fixture
+def policy():
+    # Restores the default policy after each test.
+    yield set_variant_policy
+    set_variant_policy(ALL_VARIANTS)
+
+@pytest.mark.parametrize("variant_policy, expected", [
+    (ALL_VARIANTS, ("ind", "nid", "nind")),
+    (VariantPolicy("nin", alternates=0), ("nind",)),
+    (VariantPolicy("ni", alternates=1), ("nid", "ind")),
+    (VariantPolicy("nin"), ("nind", "ind", "nid")),
+])
+def test_policy_selects_variants(policy, variant_policy, expected):
+    policy(variant_policy)
+    assert get_prefix_variants("vai", "1s", "i") == expected
+    # Pronouns without dialect variants are unaffected.
+    assert get_prefix_variants("vai", "2s", "i") == ("gid",)
+
+def test_single_dialect_generation(policy):
+    policy(VariantPolicy("nin", alternates=0))
+    result = conjugate(ConjugationInput(type="vai", form="independent", verb="ikido", pronoun="1p", tense="present", negation=True))
+    assert result.render_all() == ["nindikidosiimin"]
+    assert all(not isinstance(cell.result, list) for cell in conjugate_paradigm("ikido", "vai"))
+
+@pytest.mark.parametrize("kwargs", [dict(preferred="nim"), dict(alternates=-1)])
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        VariantPolicy(**kwargs)
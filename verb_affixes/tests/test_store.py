@@ -0,0 +1,89 @@
+import pytest
+from conjugator import tense_prefix_core, vai_suffixes_core as vai, vii_suffixes_core as vii
+from conjugator.dispatch import RuleDispatcher
+from conjugator.enum import Form, LexicalFlag, Negation, Pronoun, WordEndingVAI
+from conjugator.lexicon import Lexicon
+from conjugator.models import Analysis
+from conjugator.paradigm import conjugate_paradigm_forms
+from conjugator.store import ParadigmStore, RebuildStats
+
+ENTRIES = [("nibaa", "vai"), ("ikido", "vai"), ("onaagoshin", "vii"), ("miijin", "vti")]
+
+@pytest.fixture
+def store(tmp_path):
+    with ParadigmStore(tmp_path / "paradigms.sqlite") as store:
+        store.build(ENTRIES, batch_size=50)
+        yield store
+
+@pytest.mark.parametrize("verb, verb_type", ENTRIES)
+def test_stored_paradigm_matches_generation(store, verb, verb_type):
+    assert (verb, verb_type) in store
+    assert store.paradigm(verb, verb_type) == conjugate_paradigm_forms(verb, verb_type)
+
+def test_rebuild_replaces_lemma(store):
+    store.build([("nibaa", "vai"), ("nibaa", "vai")])
+    assert store.paradigm("nibaa", "vai") == conjugate_paradigm_forms("nibaa", "vai")
+
+def test_miss_falls_back_to_generation(tmp_path):
+    with ParadigmStore(tmp_path / "empty.sqlite") as store:
+        assert store.paradigm("ayaan", "vti") == conjugate_paradigm_forms("ayaan", "vti")
+        assert ("ayaan", "vti") not in store
+    with ParadigmStore(tmp_path / "through.sqlite", write_through=True) as store:
+        assert store.paradigm("ayaan", "vti") == conjugate_paradigm_forms("ayaan", "vti")
+        assert ("ayaan", "vti") in store
+
+def test_find_surface_and_features(store):
+    assert store.find_surface("nindikidosiimin") == [Analysis("ikido", "vai", "independent", True, "present", "1p")]
+    assert store.find_surface("waabam") == []
+    forms = store.find_features("vai", "independent", False, "past", "3s")
+    assert [form.render() for form in forms] == ["gii-nibaa", "gii-ikido"]
+    forms = store.find_features("vti", "independent", False, "present", "1s", "plural")
+    assert [form.verb for form in forms] == ["miijin"]
+
+# --- Incremental rebuild ---
+@pytest.fixture
+def edited_vai_table(monkeypatch):
+    """Simulates a linguist editing one VAI_SUFFIX_MAP entry: the 3p negative of vowel stems."""
+    monkeypatch.setitem(vai.VAI_SUFFIX_MAP[Form.INDEPENDENT_CLAUSE][Negation.NEGATIVE][WordEndingVAI.SHORT_LONG_VOWEL],
+                        Pronoun.THIRD_PLURAL_ANIMATE, "siiwagoog")
+    monkeypatch.setattr(vai, "DISPATCHER", RuleDispatcher(vai.RULE_REGISTRY, vai.classify_ending, vai.ENDING_CLASS_SAMPLES,
+                                                          [pronoun.value for pronoun in Pronoun]))
+
+def test_rebuild_without_changes_does_nothing(store):
+    assert store.rebuild() == RebuildStats(changed_keys=0, slots=0, lemmas=0)
+
+def test_rebuild_refreshes_only_the_edited_slots(store, edited_vai_table):
+    # nibaa and ikido both end in a vowel: one slot each, five tenses per slot.
+    assert store.rebuild() == RebuildStats(changed_keys=1, slots=2, lemmas=0)
+    assert store.find_surface("gii-ikidosiiwagoog") == [Analysis("ikido", "vai", "independent", True, "past", "3p")]
+    for verb, verb_type in ENTRIES:
+        assert store.paradigm(verb, verb_type) == conjugate_paradigm_forms(verb, verb_type)
+    assert store.rebuild() == RebuildStats(changed_keys=0, slots=0, lemmas=0)
+
+def test_rebuild_after_dummy_n_change_rebuilds_that_lemma(tmp_path):
+    lexicon = vii.LEXICON
+    with ParadigmStore(tmp_path / "paradigms.sqlite") as store:
+        store.build(ENTRIES + [("noodin", "vii")])
+        try:
+            vii.use_lexicon(lexicon.merge(Lexicon({"noodin": frozenset({LexicalFlag.DUMMY_N.value})})))
+            assert store.rebuild() == RebuildStats(changed_keys=1, slots=0, lemmas=1)
+            assert store.paradigm("noodin", "vii") == conjugate_paradigm_forms("noodin", "vii")
+        finally:
+            vii.use_lexicon(lexicon)
+
+def test_rebuild_after_prefix_change_rebuilds_everything(store, monkeypatch):
+    monkeypatch.setitem(tense_prefix_core.CONSONANT_SHIFT_MAP, "zh", "ch")
+    assert store.rebuild() == RebuildStats(changed_keys=1, slots=0, lemmas=len(ENTRIES))
+
+def test_rebuild_of_untracked_store(store):
+    store.connection.execute("DELETE FROM slots WHERE verb = 'ikido'")
+    assert store.rebuild() == RebuildStats(changed_keys=0, slots=0, lemmas=1)
+    assert store.paradigm("ikido", "vai") == conjugate_paradigm_forms("ikido", "vai")
+
+def test_failing_lemma_is_skipped(tmp_path):
+    skipped = []
+    with ParadigmStore(tmp_path / "paradigms.sqlite") as store:
+        # No pronoun prefix exists for s- stems.
+        assert store.build([("nibaa", "vai"), ("sagaswaa", "vai"), ("ikido", "vai")], batch_size=1, skipped=skipped) == 2
+        assert skipped == [("sagaswaa", "vai")]
+        assert ("ikido", "vai") in store and ("sagaswaa", "vai") not in store
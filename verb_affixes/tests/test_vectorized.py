@@ -0,0 +1,55 @@
+import itertools
+import runpy
+from pathlib import Path
+import pytest
+from conjugator.models import ConjugationInput, FORM_CODES, PRONOUN_CODES
+from conjugator.vai_suffixes_core import get_vai_parts
+from conjugator.vii_suffixes_core import DUMMY_N, get_vii_parts
+
+np = pytest.importorskip("numpy")
+from conjugator.vectorized import classify_endings, ending_classes, suffix_parts_array, surface_array
+
+ROOT = Path(__file__).resolve().parent.parent
+SCALAR_PARTS = {"vai": get_vai_parts, "vii": get_vii_parts}
+EDGE_STEMS = ["", "a", "n", "d", "am", "aa", "bad", "ban", "boon"]
+
+def stems(verb_type: str) -> list[str]:
+    verbs = runpy.run_path(str(ROOT / f"{verb_type}-main.py"))["VERBS"]
+    return verbs + sorted(DUMMY_N) + EDGE_STEMS
+
+def scalar_parts(verb_type: str, stem: str, form: str, neg: bool, pronoun: str | None) -> tuple[str, str] | None:
+    try:
+        return SCALAR_PARTS[verb_type](ConjugationInput(type=verb_type, form=form, verb=stem, pronoun=pronoun, negation=neg))
+    except Exception:
+        return None
+
+@pytest.mark.parametrize("verb_type", ["vai", "vii"])
+def test_vectorized_matches_scalar(verb_type):
+    cells = list(itertools.product(stems(verb_type), range(len(FORM_CODES)), (False, True), range(len(PRONOUN_CODES))))
+    expected = [scalar_parts(verb_type, stem, FORM_CODES[form], neg, PRONOUN_CODES[pronoun])
+                for stem, form, neg, pronoun in cells]
+    valid = [i for i, parts in enumerate(expected) if parts is not None]
+    stem, form, neg, pronoun = (np.array(column) for column in zip(*(cells[i] for i in valid)))
+    edited, suffixes = suffix_parts_array(verb_type, stem, form, neg, pronoun)
+    assert list(zip(edited.tolist(), suffixes.tolist())) == [expected[i] for i in valid]
+    assert surface_array(verb_type, stem, form, neg, pronoun).tolist() == [expected[i][0] + expected[i][1] for i in valid]
+
+def test_classify_endings():
+    classes = ending_classes("vii")
+    codes = classify_endings("vii", [sorted(DUMMY_N)[0], "bad", "ban", "bii", "bi", "bam"])
+    assert [classes[code] for code in codes] == ["dummy_n", "d", "n", "long_vowel", "short_vowel", "other"]
+
+def test_scalar_features_broadcast():
+    edited, suffixes = suffix_parts_array("vai", ["nibaa", "ikido"], 0, False, PRONOUN_CODES.index("1p"))
+    assert edited.tolist() == ["nibaa", "ikido"]
+    assert suffixes.tolist() == ["min", "min"]
+
+@pytest.mark.parametrize("verb_type, stem, form, message", [
+    ("vta", "waabam", 0, "Unsupported verb type 'vta'"),
+    ("vai", "nibaa", 3, "out of range"),
+    # No dependent negative vii rule matches an "other" ending: the scalar path fails on it too.
+    ("vii", "bam", 1, "No vii suffix for 'bam' as dependent/True/0s"),
+])
+def test_invalid_cells_raise(verb_type, stem, form, message):
+    with pytest.raises(ValueError, match=message):
+        suffix_parts_array(verb_type, [stem], form, True, PRONOUN_CODES.index("0s"))
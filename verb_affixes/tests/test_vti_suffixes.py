@@ -0,0 +1,51 @@
+import pytest
+from conjugator.models import ConjugationInput
+from conjugator.vti_suffixes_core import VTI_RULES, RULE_TABLE, OBJECTS, classify_ending, get_vti_parts
+
+# Test data format:
+# (verb, form, neg, direct_object, pronoun, expected_verb, expected_suffix)
+
+test_cases = [
+    # independent
+    ("ayaan", "independent", False, "singular", "1p", "ayaa", "min"),
+    ("mikan", "independent", False, "plural", "3s", "mikaan", "an"),
+    ("mikan", "independent", False, "singular", "21", "mika", "min"),
+    ("miijin", "independent", True, "plural", "2p", "miiji", "siinaawaan"),
+    ("gidaan", "independent", True, "singular", "1s", "gidaan", "ziin"),
+
+    # dependent
+    ("mikan", "dependent", False, "singular", "3s", "mikan", "g"),
+    ("mikan", "dependent", False, "plural", "1s", "mikam", "aan"),
+    ("mamoon", "dependent", False, "singular", "3p", "mamoo", "waad"),
+    ("miijin", "dependent", False, "singular", "3s", "miijin", "d"),
+    ("miijin", "dependent", False, "plural", "21", "miijim", "yang"),
+    ("ayaan", "dependent", True, "singular", "3p", "ayaan", "zigwaa"),
+    ("mamoon", "dependent", True, "plural", "2s", "mamoo", "siwan"),
+
+    # imperative (21 takes a different suffix per object)
+    ("mikan", "imperative", False, "singular", "21", "mikan", "daa"),
+    ("mikan", "imperative", False, "plural", "2p", "mikam", "ok"),
+    ("miijin", "imperative", False, "plural", "21", "miiji", "daanin"),
+    ("mamoon", "imperative", False, "singular", "2s", "mamoon", ""),
+    ("mamoon", "imperative", True, "singular", "2p", "mamoo", "kegon"),
+    ("gidaan", "imperative", True, "plural", "21", "gidaan", "ziidaanin"),
+
+    # no rule applies
+    ("miijin", "imperative", False, "singular", "1s", "miijin", ""),
+    ("nibaa", "independent", False, "singular", "1s", "nibaa", ""),
+]
+
+@pytest.mark.parametrize("verb, form, neg, obj, pronoun, expected_verb, expected_suffix", test_cases)
+def test_vti_parts(verb, form, neg, obj, pronoun, expected_verb, expected_suffix):
+    input_data = ConjugationInput(type="vti", form=form, verb=verb, pronoun=pronoun, negation=neg, direct_object=obj)
+    assert get_vti_parts(input_data) == (expected_verb, expected_suffix)
+
+@pytest.mark.parametrize("verb, expected", [("gidaan", "aan"), ("mikan", "an"), ("mamoon", "oon"), ("miijin", "in"), ("nibaa", "other"), ("", "other")])
+def test_classify_ending(verb, expected):
+    assert classify_ending(verb) == expected
+
+def test_rules_do_not_overlap():
+    # Each compiled key is owned by exactly one rule, so rule order never changes the output.
+    keys = [(rule.form, rule.negation, obj, ending, pronoun)
+            for rule in VTI_RULES for ending in rule.endings for pronoun in rule.pronouns for obj in OBJECTS]
+    assert len(keys) == len(set(keys)) == len(RULE_TABLE)
@@ -35,9 +35,8 @@ def main():
                             tense=tense
                         )
                         try:
-                            tense_prefixed_verb = get_tense_prefix(input_data.verb, input_data.pronoun, input_data.tense)
-                            input_data.verb = tense_prefixed_verb
-                            result = get_vii_suffix(input_data)
+                            added_suffix = get_vii_suffix(input_data)
+                            result = get_tense_prefix(added_suffix, pronoun, tense)
                             print(f"{pronoun}: {result}")
                         except Exception as e:
                             logging.error(f"error processing {verb}/{form}/{neg}/{pronoun}: {e}")